@@ -106,6 +106,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Load the states saved at the last shutdown before integrations are set up",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -205,6 +210,7 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        warm_start=args.warm_start,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -87,6 +87,7 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    state_snapshot,
     template,
     translation,
 )
@@ -101,6 +102,7 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_get_import_timings,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -296,6 +298,7 @@ async def async_setup_hass(
             hass.config.debug = True
 
         hass.config.safe_mode = runtime_config.safe_mode
+        hass.config.warm_start = runtime_config.warm_start
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
@@ -451,10 +454,13 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
     )
+    # The state snapshot only restores the states of registered entities
+    await state_snapshot.async_load(hass)
 
 
 async def async_from_config_dict(
@@ -468,6 +474,7 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    await loader.async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -957,6 +964,20 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        import_time = {
+            domain: sum(module_timings.values())
+            for domain, module_timings in async_get_import_timings(hass).items()
+        }
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
+        if manifest_cache := hass.data.get(loader.DATA_MANIFEST_CACHE):
+            _LOGGER.debug(
+                "Resolved %s manifests from the manifest cache and %s from disk",
+                manifest_cache.hits,
+                manifest_cache.misses,
+            )
 
 
 class _WatchPendingSetups:
@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of states of an entity sent in each
+# message when streaming history_during_period
+STREAM_CHUNK_SIZE = 8192
@@ -38,7 +38,7 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES, STREAM_CHUNK_SIZE
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,8 +72,30 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    resolution: int | None,
+    downsample: history.DownsampleMethod,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
+    if resolution and entity_ids:
+        return json_bytes(
+            messages.result_message(
+                msg_id,
+                dict(
+                    history.downsample_significant_states(
+                        hass,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        resolution,
+                        downsample,
+                        include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                        no_attributes,
+                    )
+                ),
+            )
+        )
     return json_bytes(
         messages.result_message(
             msg_id,
@@ -103,6 +125,11 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("stream", default=False): bool,
+        vol.Optional("resolution"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("downsample", default=history.DownsampleMethod.LTTB): vol.Coerce(
+            history.DownsampleMethod
+        ),
     }
 )
 @websocket_api.async_response
@@ -128,8 +155,12 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    stream: bool = msg["stream"]
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        if stream:
+            _async_send_empty_stream(connection, msg["id"])
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -154,11 +185,33 @@ async def ws_get_history_during_period(
             )
         )
     ):
-        connection.send_result(msg["id"], {})
+        if stream:
+            _async_send_empty_stream(connection, msg["id"])
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    resolution: int | None = msg.get("resolution")
+    downsample: history.DownsampleMethod = msg["downsample"]
+
+    if stream:
+        _async_stream_significant_states(
+            hass,
+            connection,
+            msg,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            resolution,
+            downsample,
+        )
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -172,8 +225,109 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            resolution,
+            downsample,
+        )
+    )
+
+
+@callback
+def _async_send_empty_stream(connection: ActiveConnection, msg_id: int) -> None:
+    """Send an empty streamed response when there is no history to send."""
+    connection.send_result(msg_id)
+    connection.send_message(
+        messages.event_message(msg_id, {"states": {}, "complete": True})
+    )
+
+
+def _read_stream_message(
+    reader: history.StatesChunkReader, msg_id: int
+) -> bytes | None:
+    """Read the next chunk of streamed history and convert it to json."""
+    if (chunk := reader.read_chunk()) is None:
+        return None
+    entity_id, states = chunk
+    return json_bytes(messages.event_message(msg_id, {"states": {entity_id: states}}))
+
+
+async def _async_send_stream_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    reader: history.StatesChunkReader,
+) -> None:
+    """Read the chunks of streamed history and send them one at a time.
+
+    Each chunk is read by its own job in the recorder executor and the next
+    one is only read once the previous one has been sent to the client, so
+    memory use does not grow with the length of the period or the number
+    of entities. No database worker waits for a slow client.
+    """
+    msg_id = msg["id"]
+    instance = get_instance(hass)
+    try:
+        while (
+            message := await instance.async_add_executor_job(
+                _read_stream_message, reader, msg_id
+            )
+        ) is not None:
+            connection.send_message(message)
+            await connection.async_wait_for_drain()
+    except Exception as err:  # noqa: BLE001
+        connection.subscriptions.pop(msg_id, None)
+        connection.async_handle_exception(msg, err)
+        return
+    connection.subscriptions.pop(msg_id, None)
+    connection.send_message(
+        messages.event_message(msg_id, {"states": {}, "complete": True})
+    )
+
+
+@callback
+def _async_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    resolution: int | None,
+    downsample: history.DownsampleMethod,
+) -> None:
+    """Stream history significant_states to the client in chunks.
+
+    Each chunk is sent as an event message holding the states of a single
+    entity. Multiple chunks may be sent for the same entity and they must
+    be appended to each other by the client. A final event message with
+    complete set signals that all the history has been sent.
+    """
+    reader: history.StatesChunkReader = history.significant_states_reader(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+        STREAM_CHUNK_SIZE,
+    )
+    if resolution:
+        reader = history.DownsampledStatesReader(
+            reader, start_time, end_time, resolution, downsample
         )
+    connection.send_result(msg["id"])
+    task = hass.async_create_background_task(
+        _async_send_stream_chunks(hass, connection, msg, reader),
+        "history_stream_significant_states",
     )
+    # Unsubscribing stops reading and waiting for the client
+    connection.subscriptions[msg["id"]] = task.cancel
 
 
 def _generate_stream_message(
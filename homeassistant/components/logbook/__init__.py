@@ -20,8 +20,8 @@ from homeassistant.const import (
     ATTR_NAME,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import config_validation as cv
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
@@ -136,7 +136,29 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    hass.data[DOMAIN] = logbook_config = LogbookConfig(
+        external_events, filters, entities_filter
+    )
+
+    @callback
+    def _async_entity_renamed(event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Clear the cached logbook entries when an entity is renamed."""
+        logbook_config.hour_cache.async_clear()
+
+    @callback
+    def _async_entity_renamed_filter(
+        event_data: er.EventEntityRegistryUpdatedData,
+    ) -> bool:
+        """Filter entity registry updates that rename an entity."""
+        return event_data["action"] == "update" and (
+            "old_entity_id" in event_data or "name" in event_data["changes"]
+        )
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_entity_renamed,
+        event_filter=_async_entity_renamed_filter,
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+import threading
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast, final
 
+from lru import LRU
 from propcache.api import cached_property
 from sqlalchemy.engine.row import Row
 
@@ -22,6 +24,72 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+# The number of hours of logbook entries which are cached
+LOGBOOK_HOUR_CACHE_SIZE = 2048
+
+
+class LogbookHourCache:
+    """Cache the logbook entries of closed hours.
+
+    Logbook requests for the same entities or devices, like the ones made
+    by the more-info dialog, query and humanify the same past hours again
+    each time. The entries of hours which can no longer change are cached
+    by request key and hour start, so only the hours which are not cached
+    need to be queried.
+
+    The entries are shared between requests and must not be modified.
+    The cache is cleared when recorded rows are purged or moved to another
+    entity_id and when entities are renamed. Entries which were queried
+    before the cache was cleared are not cached.
+    """
+
+    __slots__ = ("_generation", "_history_generation", "_hours", "_lock")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._hours: LRU[tuple[Hashable, float], list[dict[str, Any]]] = LRU(
+            LOGBOOK_HOUR_CACHE_SIZE
+        )
+        self._generation = 0
+        self._history_generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self, history_generation: int) -> int:
+        """Return the generation to pass to set_hours.
+
+        The cache is cleared if the recorder history generation has changed.
+        """
+        with self._lock:
+            if history_generation != self._history_generation:
+                self._hours.clear()
+                self._generation += 1
+                self._history_generation = history_generation
+            return self._generation
+
+    def get_hour(
+        self, key: Hashable, hour_start_ts: float
+    ) -> list[dict[str, Any]] | None:
+        """Return the cached entries of an hour or None if it is not cached."""
+        with self._lock:
+            return self._hours.get((key, hour_start_ts))
+
+    def set_hours(
+        self, generation: int, key: Hashable, hours: dict[float, list[dict[str, Any]]]
+    ) -> None:
+        """Cache the entries of closed hours unless the cache was cleared."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            for hour_start_ts, entries in hours.items():
+                self._hours[(key, hour_start_ts)] = entries
+
+    @callback
+    def async_clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._hours.clear()
+            self._generation += 1
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +101,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    hour_cache: LogbookHourCache = field(default_factory=LogbookHourCache)
 
 
 class LazyEventPartialState:
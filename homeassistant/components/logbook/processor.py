@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Hashable, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -84,6 +85,13 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+HOUR_SECONDS = 3600
+# How long after an hour has ended it is considered closed
+# in addition to the commit interval of the recorder
+HOUR_CACHE_CLOSE_DELAY = 60
+# The queries exclude the start of the period
+QUERY_START_OFFSET = 1e-6
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -126,6 +134,18 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.hour_cache = logbook_config.hour_cache
+        # Only the entries of requests for entities or devices are cached as
+        # their queries find the context rows outside of the requested period,
+        # so the entries do not depend on how the period is split into hours.
+        # The entity names are excluded as they can change at any time.
+        self.hour_cache_key: Hashable | None = None
+        if (entity_ids or device_ids) and timestamp and not include_entity_name:
+            self.hour_cache_key = (
+                tuple(entity_ids or ()),
+                tuple(device_ids or ()),
+                event_types,
+            )
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
@@ -156,6 +176,103 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        if self.hour_cache_key is None:
+            return self._get_events(start_day, end_day)
+        return self._get_events_with_hour_cache(
+            self.hour_cache_key, start_day.timestamp(), end_day.timestamp()
+        )
+
+    def _get_events_with_hour_cache(
+        self, key: Hashable, start_ts: float, end_ts: float
+    ) -> list[dict[str, Any]]:
+        """Get events for a period of time using the cached closed hours.
+
+        The hours which are not cached are queried in as few queries as
+        possible and the closed hours among them are added to the cache.
+        Nothing is added while the recorder is behind, as the rows of hours
+        which have ended long ago may not have been committed yet.
+        """
+        instance = get_instance(self.hass)
+        hour_cache = self.hour_cache
+        generation = hour_cache.generation(instance.history_generation)
+        recorder_is_behind = bool(instance.backlog or instance.migration_in_progress)
+        # Hours are closed once all their rows are expected to be committed
+        closed_ts = min(
+            end_ts,
+            time.time() - instance.commit_interval - HOUR_CACHE_CLOSE_DELAY,
+        )
+        hour = math.ceil(start_ts / HOUR_SECONDS) * HOUR_SECONDS
+        events: list[dict[str, Any]] = []
+        new_hours: dict[float, list[dict[str, Any]]] = {}
+        query_start_ts = start_ts
+        after_cached_hour = False
+        while hour + HOUR_SECONDS <= closed_ts:
+            if (cached := hour_cache.get_hour(key, hour)) is not None:
+                if query_start_ts < hour:
+                    events.extend(
+                        self._get_events_for_hours(
+                            query_start_ts,
+                            hour,
+                            closed_ts,
+                            after_cached_hour,
+                            new_hours,
+                        )
+                    )
+                events.extend(cached)
+                query_start_ts = hour + HOUR_SECONDS
+                after_cached_hour = True
+            hour += HOUR_SECONDS
+        if query_start_ts < end_ts:
+            events.extend(
+                self._get_events_for_hours(
+                    query_start_ts, end_ts, closed_ts, after_cached_hour, new_hours
+                )
+            )
+        if new_hours and not recorder_is_behind:
+            hour_cache.set_hours(generation, key, new_hours)
+        return events
+
+    def _get_events_for_hours(
+        self,
+        start_ts: float,
+        end_ts: float,
+        closed_ts: float,
+        after_cached_hour: bool,
+        new_hours: dict[float, list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Get events for a period of time and collect its closed hours."""
+        query_start_ts = start_ts
+        if after_cached_hour:
+            # The queries exclude the start of the period, but rows at
+            # the exact start of the hour after a cached hour belong to it
+            query_start_ts -= QUERY_START_OFFSET
+        events = self._get_events(
+            dt_util.utc_from_timestamp(query_start_ts),
+            dt_util.utc_from_timestamp(end_ts),
+        )
+        if after_cached_hour:
+            events = [
+                event for event in events if event[LOGBOOK_ENTRY_WHEN] >= start_ts
+            ]
+        hour = math.ceil(start_ts / HOUR_SECONDS) * HOUR_SECONDS
+        hours: dict[float, list[dict[str, Any]]] = {}
+        while hour + HOUR_SECONDS <= min(end_ts, closed_ts):
+            hours[hour] = []
+            hour += HOUR_SECONDS
+        if hours:
+            for event in events:
+                when = event[LOGBOOK_ENTRY_WHEN]
+                if (entries := hours.get(when - when % HOUR_SECONDS)) is not None:
+                    entries.append(event)
+            new_hours.update(hours)
+        return events
+
+    def _get_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> list[dict[str, Any]]:
+        """Query and humanify the events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
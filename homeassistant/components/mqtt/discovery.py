@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import defaultdict, deque
 from dataclasses import dataclass
 import functools
 from itertools import chain
@@ -66,12 +66,19 @@ MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeForma
 MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
+MQTT_DISCOVERY_NEW_BATCH: SignalTypeFormat[list[MQTTDiscoveryPayload]] = (
+    SignalTypeFormat("mqtt_discovery_new_batch_{}_{}")
+)
 MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
     "mqtt_discovery_done_{}_{}"
 )
 
 TOPIC_BASE = "~"
 
+# Retained discovery messages are buffered for this many seconds
+# to process the burst received when subscribing in one batch
+DISCOVERY_BATCH_WINDOW = 0.5
+
 CONF_MIGRATE_DISCOVERY = "migrate_discovery"
 
 MIGRATE_DISCOVERY_SCHEMA = vol.Schema(
@@ -354,8 +361,11 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    discovery_stats = mqtt_data.discovery_stats
     platform_setup_lock: dict[str, asyncio.Lock] = {}
     integration_discovery_messages: dict[str, MQTTIntegrationDiscoveryConfig] = {}
+    retained_messages: dict[str, ReceiveMessage] = {}
+    batch_timer: asyncio.TimerHandle | None = None
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
@@ -380,10 +390,105 @@ async def async_start(  # noqa: C901
                 )
         _async_add_component(discovery_payload)
 
+    @callback
+    def _async_add_components(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
+        """Add the components of a platform from a batch of discovery messages."""
+        if component not in mqtt_data.discovery_batch_platforms:
+            for discovery_payload in discovery_payloads:
+                _async_add_component(discovery_payload)
+            return
+        for discovery_payload in discovery_payloads:
+            discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+            message = f"Found new component: {component} {discovery_hash[1]}"
+            async_log_discovery_origin_info(message, discovery_payload)
+            mqtt_data.discovery_already_discovered.add(discovery_hash)
+        async_dispatcher_send(
+            hass, MQTT_DISCOVERY_NEW_BATCH.format(component, "mqtt"), discovery_payloads
+        )
+
+    async def _async_components_setup(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
+        """Perform component set up for a batch of discovery messages."""
+        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
+            if component not in mqtt_data.platforms_loaded:
+                await async_forward_entry_setup_and_setup_discovery(
+                    hass, config_entry, {component}
+                )
+        _async_add_components(component, discovery_payloads)
+
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:
         """Process the received message."""
+        nonlocal batch_timer
         mqtt_data.last_discovery = msg.timestamp
+        if retained_messages.pop(msg.topic, None) is not None:
+            # Only the latest message for a topic is processed
+            discovery_stats.deduplicated_messages += 1
+        if msg.retain:
+            retained_messages[msg.topic] = msg
+            if batch_timer is None:
+                batch_timer = hass.loop.call_later(
+                    DISCOVERY_BATCH_WINDOW, _async_process_discovery_batch
+                )
+            return
+        start = time.perf_counter()
+        _async_process_discovery_message(msg, None)
+        discovery_stats.messages += 1
+        discovery_stats.processing_time += time.perf_counter() - start
+
+    @callback
+    def _async_process_discovery_batch() -> None:
+        """Process the buffered retained discovery messages.
+
+        New components are deduplicated by discovery hash and added with
+        a single signal for each platform.
+        """
+        nonlocal batch_timer
+        batch_timer = None
+        start = time.perf_counter()
+        messages = list(retained_messages.values())
+        retained_messages.clear()
+        new_components: dict[tuple[str, str], MQTTDiscoveryPayload] = {}
+        for msg in messages:
+            _async_process_discovery_message(msg, new_components)
+
+        component_payloads: defaultdict[str, list[MQTTDiscoveryPayload]] = defaultdict(
+            list
+        )
+        for (component, discovery_id), discovery_payload in new_components.items():
+            if not discovery_payload:
+                async_process_discovery_payload(
+                    component, discovery_id, discovery_payload
+                )
+                continue
+            _async_track_pending_discovery(component, discovery_id)
+            component_payloads[component].append(discovery_payload)
+        for component, discovery_payloads in component_payloads.items():
+            if component not in mqtt_data.platforms_loaded:
+                config_entry.async_create_task(
+                    hass, _async_components_setup(component, discovery_payloads)
+                )
+            else:
+                _async_add_components(component, discovery_payloads)
+
+        discovery_stats.batches += 1
+        discovery_stats.batched_messages += len(messages)
+        discovery_stats.messages += len(messages)
+        discovery_stats.processing_time += time.perf_counter() - start
+
+    @callback
+    def _async_process_discovery_message(
+        msg: ReceiveMessage,
+        new_components: dict[tuple[str, str], MQTTDiscoveryPayload] | None,
+    ) -> None:
+        """Process a discovery message.
+
+        When new_components is passed, the payloads of components that are
+        not discovered yet are collected in it instead of being processed.
+        """
         payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
@@ -513,8 +618,43 @@ async def async_start(  # noqa: C901
                 )
                 return
 
+            if (
+                new_components is not None
+                and discovery_hash not in mqtt_data.discovery_already_discovered
+            ):
+                if discovery_hash in new_components:
+                    discovery_stats.deduplicated_messages += 1
+                new_components[discovery_hash] = discovery_payload
+                continue
+
             async_process_discovery_payload(component, discovery_id, discovery_payload)
 
+    @callback
+    def _async_track_pending_discovery(component: str, discovery_id: str) -> None:
+        """Queue the discovery updates received until the discovery is done."""
+        discovery_hash = (component, discovery_id)
+        discovery_pending_discovered = mqtt_data.discovery_pending_discovered
+
+        @callback
+        def discovery_done(_: Any) -> None:
+            pending = discovery_pending_discovered[discovery_hash]["pending"]
+            _LOGGER.debug("Pending discovery for %s: %s", discovery_hash, pending)
+            if not pending:
+                discovery_pending_discovered[discovery_hash]["unsub"]()
+                discovery_pending_discovered.pop(discovery_hash)
+            else:
+                payload = pending.pop()
+                async_process_discovery_payload(component, discovery_id, payload)
+
+        discovery_pending_discovered[discovery_hash] = {
+            "unsub": async_dispatcher_connect(
+                hass,
+                MQTT_DISCOVERY_DONE.format(*discovery_hash),
+                discovery_done,
+            ),
+            "pending": deque([]),
+        }
+
     @callback
     def async_process_discovery_payload(
         component: str, discovery_id: str, payload: MQTTDiscoveryPayload
@@ -528,27 +668,7 @@ async def async_start(  # noqa: C901
         if (
             already_discovered or payload
         ) and discovery_hash not in mqtt_data.discovery_pending_discovered:
-            discovery_pending_discovered = mqtt_data.discovery_pending_discovered
-
-            @callback
-            def discovery_done(_: Any) -> None:
-                pending = discovery_pending_discovered[discovery_hash]["pending"]
-                _LOGGER.debug("Pending discovery for %s: %s", discovery_hash, pending)
-                if not pending:
-                    discovery_pending_discovered[discovery_hash]["unsub"]()
-                    discovery_pending_discovered.pop(discovery_hash)
-                else:
-                    payload = pending.pop()
-                    async_process_discovery_payload(component, discovery_id, payload)
-
-            discovery_pending_discovered[discovery_hash] = {
-                "unsub": async_dispatcher_connect(
-                    hass,
-                    MQTT_DISCOVERY_DONE.format(*discovery_hash),
-                    discovery_done,
-                ),
-                "pending": deque([]),
-            }
+            _async_track_pending_discovery(component, discovery_id)
 
         if component not in mqtt_data.platforms_loaded and payload:
             # Load component first
@@ -626,6 +746,17 @@ async def async_start(  # noqa: C901
         )
     )
 
+    @callback
+    def _async_cancel_discovery_batch() -> None:
+        """Cancel processing the buffered retained discovery messages."""
+        nonlocal batch_timer
+        if batch_timer is not None:
+            batch_timer.cancel()
+            batch_timer = None
+        retained_messages.clear()
+
+    mqtt_data.discovery_unsubscribe.append(_async_cancel_discovery_batch)
+
     async def async_integration_message_received(
         integration: str, msg: ReceiveMessage
     ) -> None:
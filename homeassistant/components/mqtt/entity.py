@@ -101,6 +101,7 @@ from .debug_info import log_message
 from .discovery import (
     MQTT_DISCOVERY_DONE,
     MQTT_DISCOVERY_NEW,
+    MQTT_DISCOVERY_NEW_BATCH,
     MQTT_DISCOVERY_UPDATED,
     MQTTDiscoveryPayload,
     clear_discovery_hash,
@@ -248,38 +249,73 @@ def async_setup_entity_entry_helper(
     mqtt_data = hass.data[DATA_MQTT]
 
     @callback
-    def _async_setup_entity_entry_from_discovery(
+    def _async_entity_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
-    ) -> None:
-        """Set up an MQTT entity from discovery."""
+    ) -> MqttEntity | None:
+        """Create an MQTT entity from a discovery payload."""
         nonlocal entity_class
         if not _verify_mqtt_config_entry_enabled_for_discovery(
             hass, domain, discovery_payload
         ):
-            return
+            return None
         try:
             config: DiscoveryInfoType = discovery_schema(discovery_payload)
             if schema_class_mapping is not None:
                 entity_class = schema_class_mapping[config[CONF_SCHEMA]]
             if TYPE_CHECKING:
                 assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
+            return entity_class(hass, config, entry, discovery_payload.discovery_data)
         except vol.Invalid as err:
             _handle_discovery_failure(hass, discovery_payload)
             async_handle_schema_error(discovery_payload, err)
         except Exception:
             _handle_discovery_failure(hass, discovery_payload)
             raise
+        return None
 
-    mqtt_data.reload_dispatchers.append(
-        async_dispatcher_connect(
-            hass,
-            MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_entity_entry_from_discovery,
+    @callback
+    def _async_setup_entity_entry_from_discovery(
+        discovery_payload: MQTTDiscoveryPayload,
+    ) -> None:
+        """Set up an MQTT entity from discovery."""
+        if (entity := _async_entity_from_discovery(discovery_payload)) is not None:
+            async_add_entities([entity])
+
+    @callback
+    def _async_setup_entity_entries_from_discovery(
+        discovery_payloads: list[MQTTDiscoveryPayload],
+    ) -> None:
+        """Set up MQTT entities from a batch of discovery payloads."""
+        entities: list[MqttEntity] = []
+        for discovery_payload in discovery_payloads:
+            try:
+                if (
+                    entity := _async_entity_from_discovery(discovery_payload)
+                ) is not None:
+                    entities.append(entity)
+            except Exception:
+                _LOGGER.exception(
+                    "Error setting up %s entity from discovery %s",
+                    domain,
+                    discovery_payload.discovery_data[ATTR_DISCOVERY_HASH],
+                )
+        async_add_entities(entities)
+
+    mqtt_data.reload_dispatchers.extend(
+        (
+            async_dispatcher_connect(
+                hass,
+                MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
+                _async_setup_entity_entry_from_discovery,
+            ),
+            async_dispatcher_connect(
+                hass,
+                MQTT_DISCOVERY_NEW_BATCH.format(domain, "mqtt"),
+                _async_setup_entity_entries_from_discovery,
+            ),
         )
     )
+    mqtt_data.discovery_batch_platforms.add(domain)
 
     @callback
     def _async_setup_entities() -> None:
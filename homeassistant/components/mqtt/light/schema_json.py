@@ -50,7 +50,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, VolSchemaType
 from homeassistant.util import color as color_util
-from homeassistant.util.json import json_loads_object
+from homeassistant.util.json import JsonObjectType
 
 from .. import subscription
 from ..config import DEFAULT_QOS, DEFAULT_RETAIN, MQTT_RW_SCHEMA
@@ -286,7 +286,15 @@ class MqttLightJson(MqttEntity, LightEntity, RestoreEntity):
     @callback
     def _state_received(self, msg: ReceiveMessage) -> None:
         """Handle new MQTT messages."""
-        values = json_loads_object(msg.payload)
+        # The parsed payload is shared with the other subscribers
+        # of the message and must not be modified
+        payload_json = msg.json
+        # Avoid isinstance overhead as we are not interested in dict subclasses
+        if type(payload_json) is not dict:
+            raise ValueError(
+                f"Expected JSON to be parsed as a dict got {type(payload_json)}"
+            )
+        values: JsonObjectType = payload_json
 
         if values["state"] == "ON":
             self._attr_is_on = True
@@ -9,7 +9,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
 import logging
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, Platform
 from homeassistant.core import CALLBACK_TYPE, callback
@@ -24,6 +24,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, JsonValueType, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -34,7 +35,7 @@ if TYPE_CHECKING:
     from .discovery import MQTTDiscoveryPayload
     from .tag import MQTTTagScanner
 
-from .const import DOMAIN, TEMPLATE_ERRORS
+from .const import DEFAULT_ENCODING, DOMAIN, TEMPLATE_ERRORS
 
 
 class PayloadSentinel(StrEnum):
@@ -77,6 +78,51 @@ class PublishMessage:
     retain: bool
 
 
+_UNPARSED = object()
+_INVALID_JSON = object()
+
+
+class ReceivePayloadViews:
+    """Lazily decoded views of a received MQTT payload.
+
+    The client creates one instance for each incoming message which is
+    shared by all subscribers, so the payload is decoded and parsed as
+    JSON at most once no matter how many subscribers use it. The parsed
+    JSON is shared and must not be modified.
+    """
+
+    __slots__ = ("_json", "_text", "raw")
+
+    def __init__(self, raw: bytes) -> None:
+        """Initialize the payload views."""
+        self.raw = raw
+        self._text: dict[str, str] = {}
+        self._json: Any = _UNPARSED
+
+    def text(self, encoding: str = DEFAULT_ENCODING) -> str:
+        """Return the payload decoded with encoding.
+
+        Raises UnicodeDecodeError if the payload can not be decoded.
+        """
+        if (text := self._text.get(encoding)) is None:
+            text = self._text[encoding] = self.raw.decode(encoding)
+        return text
+
+    def json(self) -> JsonValueType:
+        """Return the payload parsed as JSON.
+
+        Raises ValueError if the payload is not valid JSON.
+        """
+        if self._json is _UNPARSED:
+            try:
+                self._json = json_loads(self.raw)
+            except JSON_DECODE_EXCEPTIONS:
+                self._json = _INVALID_JSON
+        if self._json is _INVALID_JSON:
+            raise ValueError("Payload is not valid JSON")
+        return cast(JsonValueType, self._json)
+
+
 # eq=False so we use the id() of the object for comparison
 # since client will only generate one instance of this object
 # per messages/subscribed_topic.
@@ -90,6 +136,31 @@ class ReceiveMessage:
     retain: bool
     subscribed_topic: str
     timestamp: float
+    # Shared views of the raw payload, only set when the payload
+    # is the raw payload or its text in the default encoding
+    views: ReceivePayloadViews | None = field(default=None, repr=False)
+
+    @property
+    def text(self) -> str:
+        """Return the payload as text."""
+        if isinstance(payload := self.payload, str):
+            return payload
+        if self.views is not None:
+            return self.views.text()
+        return payload.decode(DEFAULT_ENCODING)
+
+    @property
+    def json(self) -> JsonValueType:
+        """Return the payload parsed as JSON.
+
+        The parsed JSON is shared by all subscribers of the message
+        and must not be modified.
+
+        Raises ValueError if the payload is not valid JSON.
+        """
+        if self.views is not None:
+            return self.views.json()
+        return json_loads(self.payload)
 
 
 type MessageCallbackType = Callable[[ReceiveMessage], None]
@@ -273,16 +344,32 @@ class MqttValueTemplate:
     @callback
     def async_render_with_possible_json_value(
         self,
-        payload: ReceivePayloadType,
+        payload: ReceivePayloadType | ReceiveMessage,
         default: ReceivePayloadType | PayloadSentinel = PayloadSentinel.NONE,
         variables: TemplateVarsType = None,
     ) -> ReceivePayloadType:
-        """Render with possible json value or pass-though a received MQTT value."""
+        """Render with possible json value or pass-though a received MQTT value.
+
+        When a received message is passed, the JSON of its payload is parsed
+        once and shared with the other subscribers of the message.
+        """
         rendered_payload: ReceivePayloadType
+        msg: ReceiveMessage | None = None
+
+        if isinstance(payload, ReceiveMessage):
+            msg = payload
+            payload = msg.payload
 
         if self._value_template is None:
             return payload
 
+        json_kwargs: dict[str, Any] = {}
+        if msg is not None:
+            try:
+                json_kwargs["value_json"] = msg.json
+            except ValueError:
+                json_kwargs["value_json"] = template.VALUE_NOT_JSON
+
         values: dict[str, Any] = {}
 
         if variables is not None:
@@ -310,7 +397,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, **json_kwargs
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -336,7 +423,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, **json_kwargs
                 )
             )
         except TEMPLATE_ERRORS as exc:
@@ -379,6 +466,30 @@ class EntityTopicState:
         self.subscribe_calls[entity.entity_id] = entity
 
 
+@dataclass(slots=True)
+class MqttDiscoveryStats:
+    """Keep statistics of the processed MQTT discovery messages."""
+
+    messages: int = 0
+    batches: int = 0
+    batched_messages: int = 0
+    deduplicated_messages: int = 0
+    processing_time: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary for diagnostics."""
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "batched_messages": self.batched_messages,
+            "deduplicated_messages": self.deduplicated_messages,
+            "processing_time": round(self.processing_time, 3),
+            "messages_per_second": round(self.messages / self.processing_time)
+            if self.processing_time
+            else None,
+        }
+
+
 @dataclass
 class MqttData:
     """Keep the MQTT entry data."""
@@ -392,12 +503,14 @@ class MqttData:
     device_triggers: dict[str, Trigger] = field(default_factory=dict)
     data_config_flow_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     discovery_already_discovered: set[tuple[str, str]] = field(default_factory=set)
+    discovery_batch_platforms: set[str] = field(default_factory=set)
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
+    discovery_stats: MqttDiscoveryStats = field(default_factory=MqttDiscoveryStats)
     discovery_unsubscribe: list[CALLBACK_TYPE] = field(default_factory=list)
     integration_unsubscribe: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     last_discovery: float = 0.0
@@ -0,0 +1,120 @@
+"""Topic trie to match MQTT topics against subscribed topic filters."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from itertools import count
+from operator import itemgetter
+
+
+class _TopicTrieNode[_T: Hashable]:
+    """A level of a topic filter in the trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # The values of the topic filters ending at this level with the
+        # sequence number they were added with
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie[_T: Hashable]:
+    """Index values by MQTT topic filter.
+
+    The trie has a level for each topic level of the topic filters,
+    so matching a topic only visits the levels that can match it instead
+    of testing every topic filter. The single level `+` and multi level
+    `#` wildcards follow the matching rules of the MQTT specification,
+    including that topics starting with `$` are not matched by wildcards
+    at the first level.
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the topic trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._sequence = count()
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if any value is added for the topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        if value not in node.values:
+            node.values[value] = next(self._sequence)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise KeyError(value)
+            path.append((node, level))
+            node = child
+        del node.values[value]
+        # Prune the levels that no longer lead to a value
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the topic filters matching a topic.
+
+        The values are returned in the order they were added.
+        """
+        levels = topic.split("/")
+        # Wildcards do not match topics starting with $ at the first level
+        wildcards = not topic.startswith("$")
+        matches: list[tuple[int, _T]] = []
+        nodes = [self._root]
+        for level in levels:
+            next_nodes: list[_TopicTrieNode[_T]] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards:
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                    if (child := children.get("#")) is not None:
+                        matches.extend(
+                            (sequence, value)
+                            for value, sequence in child.values.items()
+                        )
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards = True
+        else:
+            for node in nodes:
+                matches.extend(
+                    (sequence, value) for value, sequence in node.values.items()
+                )
+                # `#` also matches the parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.extend(
+                        (sequence, value) for value, sequence in child.values.items()
+                    )
+        if len(matches) > 1:
+            matches.sort(key=itemgetter(0))
+        return [value for _, value in matches]
@@ -173,6 +173,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_registry.async_setup(hass)
     instance.async_initialize()
     instance.async_register()
+    await instance.state_attributes_manager.async_load_warm_cache()
     instance.start()
     async_register_services(hass, instance)
     websocket_api.async_setup(hass)
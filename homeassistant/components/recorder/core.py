@@ -91,7 +91,7 @@ from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingStatesRow, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -206,6 +206,9 @@ class Recorder(threading.Thread):
         self.exclude_event_types = exclude_event_types
 
         self.schema_version = 0
+        # Incremented when recorded rows are purged or moved to another
+        # entity_id so caches of query results know they are stale
+        self.history_generation = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
 
@@ -446,6 +449,7 @@ class Recorder(threading.Thread):
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
+        await self.state_attributes_manager.async_save_warm_cache()
 
     @callback
     def _async_hass_started(self, hass: HomeAssistant) -> None:
@@ -808,6 +812,8 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            self.state_attributes_manager.load_warm_cache(session)
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -1099,13 +1105,27 @@ class Recorder(threading.Thread):
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
     ) -> None:
-        """Process a state_changed event into the session."""
+        """Process a state_changed event into the session.
+
+        When the database is on the current schema and the entity_id
+        migration is done the state is not added to the session, it is
+        collected as a pending row which is inserted in bulk when the
+        session is committed. While the migration is running the entity_id
+        must still be written to the states table as the legacy queries
+        filter on it.
+        """
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | PendingStatesRow
+        if bulk_insert := (
+            self.schema_version == SCHEMA_VERSION and states_meta_manager.active
+        ):
+            dbstate = PendingStatesRow.from_event(event)
+        else:
+            dbstate = States.from_event(event)
         old_state = event.data["old_state"]
 
         assert self.event_session is not None
@@ -1127,8 +1147,8 @@ class Recorder(threading.Thread):
         else:
             states_manager.add_pending(entity_id, dbstate)
 
-        if states_meta_manager.active:
-            dbstate.entity_id = None
+        if states_meta_manager.active and not bulk_insert:
+            dbstate.entity_id = None  # type: ignore[union-attr]
 
         if entity_id is None or not (
             shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
@@ -1176,7 +1196,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if isinstance(dbstate, PendingStatesRow):
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_row(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1224,6 +1248,7 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.states_manager.insert_pending_rows(session)
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1482,6 +1507,8 @@ class Recorder(threading.Thread):
             self._commit_event_session_or_retry()
         except Exception:
             _LOGGER.exception("Error saving the event session during shutdown")
+        else:
+            self.state_attributes_manager.prepare_warm_cache()
 
         self.event_session.close()
         self.recorder_runs_manager.clear()
@@ -516,10 +516,33 @@ class States(Base):
     @staticmethod
     def from_event(event: Event[EventStateChangedData]) -> States:
         """Create object from a state_changed event."""
+        params = States.insert_params_from_event(event)
+        if params["state"] is None:
+            params["state"] = ""
+        return States(
+            entity_id=event.data["entity_id"],
+            attributes=None,
+            context_id=None,
+            context_user_id=None,
+            context_parent_id=None,
+            last_updated=None,
+            last_changed=None,
+            **params,
+        )
+
+    @staticmethod
+    def insert_params_from_event(
+        event: Event[EventStateChangedData],
+    ) -> dict[str, Any]:
+        """Create bulk insert parameters from a state_changed event.
+
+        The foreign keys are left empty and must be filled in by the caller
+        before the row is inserted.
+        """
         state = event.data["new_state"]
         # None state means the state was removed from the state machine
         if state is None:
-            state_value = ""
+            state_value = None
             last_updated_ts = event.time_fired_timestamp
             last_changed_ts = None
             last_reported_ts = None
@@ -535,23 +558,19 @@ class States(Base):
             else:
                 last_reported_ts = state.last_reported_timestamp
         context = event.context
-        return States(
-            state=state_value,
-            entity_id=event.data["entity_id"],
-            attributes=None,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
-            origin_idx=event.origin.idx,
-            last_updated=None,
-            last_changed=None,
-            last_updated_ts=last_updated_ts,
-            last_changed_ts=last_changed_ts,
-            last_reported_ts=last_reported_ts,
-        )
+        return {
+            "state": state_value,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+            "origin_idx": event.origin.idx,
+            "last_updated_ts": last_updated_ts,
+            "last_changed_ts": last_changed_ts,
+            "last_reported_ts": last_reported_ts,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
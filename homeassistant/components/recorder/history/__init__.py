@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, Protocol
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
+from homeassistant.util import dt as dt_util
 
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .downsample import DownsampleMethod, downsample_compressed_states
 from .modern import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    SignificantStatesReader,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
@@ -24,11 +30,17 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "DownsampleMethod",
+    "DownsampledStatesReader",
+    "StatesChunkReader",
+    "downsample_significant_states",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "significant_states_reader",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -152,6 +164,205 @@ def get_significant_states_with_session(
     )
 
 
+class StatesChunkReader(Protocol):
+    """Read states in chunks of a single entity."""
+
+    def read_chunk(self) -> tuple[str, list[Any]] | None:
+        """Read the next chunk, None once all the states have been read."""
+
+
+class _MaterializedStatesReader:
+    """Read chunks of the significant states of the legacy schema.
+
+    The legacy schema cannot be read in chunks, so all the states are
+    read by the first call and then split into chunks.
+    """
+
+    def __init__(
+        self,
+        read_states: Callable[[], dict[str, list[State | dict[str, Any]]]],
+        chunk_size: int,
+    ) -> None:
+        """Initialize the reader."""
+        self._read_states = read_states
+        self._chunk_size = chunk_size
+        self._chunks: Iterator[tuple[str, list[State | dict[str, Any]]]] | None = None
+
+    def read_chunk(self) -> tuple[str, list[State | dict[str, Any]]] | None:
+        """Read the next chunk of states."""
+        if self._chunks is None:
+            chunk_size = self._chunk_size
+            self._chunks = (
+                (entity_id, entity_states[idx : idx + chunk_size])
+                for entity_id, entity_states in self._read_states().items()
+                for idx in range(0, len(entity_states), chunk_size)
+            )
+        return next(self._chunks, None)
+
+
+def significant_states_reader(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> StatesChunkReader:
+    """Return a reader of chunks of significant states during a time period."""
+    if get_instance(hass).states_meta_manager.active:
+        return SignificantStatesReader(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            chunk_size,
+        )
+    return _MaterializedStatesReader(
+        partial(
+            get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        ),
+        chunk_size,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield chunks of significant states during a time period."""
+    reader = significant_states_reader(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        chunk_size,
+    )
+    while (chunk := reader.read_chunk()) is not None:
+        yield chunk
+
+
+class DownsampledStatesReader:
+    """Read the downsampled states of one entity at a time.
+
+    The states of an entity are read from a reader of compressed states
+    chunk by chunk and reduced with method as they are read.
+    """
+
+    def __init__(
+        self,
+        reader: StatesChunkReader,
+        start_time: datetime,
+        end_time: datetime | None,
+        resolution: int,
+        method: DownsampleMethod,
+    ) -> None:
+        """Initialize the reader."""
+        self._reader = reader
+        self._start_time_ts = start_time.timestamp()
+        self._end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+        self._resolution = resolution
+        self._method = method
+        # The first chunk of the next entity, read with the states before it
+        self._next_chunk: tuple[str, list[Any]] | None = None
+
+    def read_chunk(self) -> tuple[str, list[dict[str, Any]]] | None:
+        """Read and downsample the states of the next entity."""
+        while (chunk := self._next_chunk or self._reader.read_chunk()) is not None:
+            self._next_chunk = None
+            entity_id, first_states = chunk
+            if states := downsample_compressed_states(
+                self._entity_states(entity_id, first_states),
+                self._start_time_ts,
+                self._end_time_ts,
+                self._resolution,
+                self._method,
+            ):
+                return entity_id, states
+        return None
+
+    def _entity_states(
+        self, entity_id: str, first_states: list[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the states of an entity and keep the chunk after them."""
+        yield from first_states
+        while (chunk := self._reader.read_chunk()) is not None:
+            if chunk[0] != entity_id:
+                self._next_chunk = chunk
+                return
+            yield from chunk[1]
+
+
+def downsample_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    resolution: int,
+    method: DownsampleMethod,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield at most two states per bucket for each entity.
+
+    The period is split into resolution buckets and the states of each
+    entity are reduced with method as they are read from the database.
+    The states are returned in the compressed state format.
+    """
+    reader = DownsampledStatesReader(
+        significant_states_reader(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+        start_time,
+        end_time,
+        resolution,
+        method,
+    )
+    while (chunk := reader.read_chunk()) is not None:
+        yield chunk
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -0,0 +1,162 @@
+"""Downsample history states into a bounded number of points."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from enum import StrEnum
+from itertools import groupby
+from math import isfinite
+from operator import itemgetter
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+
+
+class DownsampleMethod(StrEnum):
+    """How the states in a time bucket are reduced."""
+
+    LAST = "last"
+    MIN = "min"
+    MAX = "max"
+    MEAN = "mean"
+    LTTB = "lttb"
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a float or None if it is not a finite number.
+
+    The state is None for the rows recorded when an entity was removed.
+    """
+    try:
+        value = float(state)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+    return value if isfinite(value) else None
+
+
+def downsample_compressed_states(
+    states: Iterable[dict[str, Any]],
+    start_time_ts: float,
+    end_time_ts: float,
+    resolution: int,
+    method: DownsampleMethod,
+) -> list[dict[str, Any]]:
+    """Downsample compressed states sorted by last_updated.
+
+    The period is split into resolution buckets of equal length and
+    the numeric states in each bucket are reduced to a single point
+    with method. LTTB picks the state in each bucket that forms the
+    largest triangle with the point picked in the previous bucket and
+    the average of the next bucket, which keeps the visual shape of the
+    series.
+
+    States that are not numbers (unavailable, unknown, on, off...) are
+    reduced to the last one in each bucket, so at most two points are
+    returned for each bucket.
+    """
+    bucket_width = max(end_time_ts - start_time_ts, 1e-6) / resolution
+    last_bucket = resolution - 1
+    result: list[dict[str, Any]] = []
+    first_state: dict[str, Any] | None = None
+    # LTTB picks the point of a bucket when the next bucket is known
+    lttb_selected: tuple[float, float, dict[str, Any]] | None = None
+    lttb_pending: list[tuple[float, float, dict[str, Any]]] = []
+
+    def _bucket(state: dict[str, Any]) -> int:
+        return min(
+            max(
+                int(
+                    (state[COMPRESSED_STATE_LAST_UPDATED] - start_time_ts)
+                    / bucket_width
+                ),
+                0,
+            ),
+            last_bucket,
+        )
+
+    for _, bucket_states in groupby(states, _bucket):
+        numeric: list[tuple[float, float, dict[str, Any]]] = []
+        last_non_numeric: dict[str, Any] | None = None
+        for state in bucket_states:
+            if first_state is None:
+                first_state = state
+            if (value := _float_or_none(state[COMPRESSED_STATE_STATE])) is None:
+                last_non_numeric = state
+            else:
+                numeric.append((state[COMPRESSED_STATE_LAST_UPDATED], value, state))
+        if last_non_numeric is not None:
+            result.append(last_non_numeric)
+        if not numeric:
+            continue
+        if method is DownsampleMethod.LTTB:
+            if lttb_pending:
+                lttb_selected = _lttb_select(lttb_pending, lttb_selected, numeric)
+                result.append(lttb_selected[2])
+            lttb_pending = numeric
+        elif method is DownsampleMethod.LAST:
+            result.append(numeric[-1][2])
+        elif method is DownsampleMethod.MIN:
+            result.append(min(numeric, key=itemgetter(1))[2])
+        elif method is DownsampleMethod.MAX:
+            result.append(max(numeric, key=itemgetter(1))[2])
+        else:
+            mean = sum(value for _, value, _ in numeric) / len(numeric)
+            result.append(
+                {
+                    **numeric[0][2],
+                    COMPRESSED_STATE_STATE: str(round(mean, 6)),
+                }
+            )
+
+    if lttb_pending:
+        # The last point of the series is always kept
+        result.append(lttb_pending[-1][2])
+
+    if not result or first_state is None:
+        return result
+    result.sort(key=itemgetter(COMPRESSED_STATE_LAST_UPDATED))
+    if (
+        result[0] is not first_state
+        and COMPRESSED_STATE_ATTRIBUTES in first_state
+        and COMPRESSED_STATE_ATTRIBUTES not in result[0]
+    ):
+        # Keep the attributes of the first state as minimal
+        # responses only include them on the first state
+        result[0] = {
+            **result[0],
+            COMPRESSED_STATE_ATTRIBUTES: first_state[COMPRESSED_STATE_ATTRIBUTES],
+        }
+    return result
+
+
+def _lttb_select(
+    bucket: list[tuple[float, float, dict[str, Any]]],
+    previous: tuple[float, float, dict[str, Any]] | None,
+    next_bucket: list[tuple[float, float, dict[str, Any]]],
+) -> tuple[float, float, dict[str, Any]]:
+    """Select the point of the bucket that forms the largest triangle.
+
+    The triangle is formed with the previously selected point and the
+    average of the next bucket.
+    """
+    if previous is None:
+        # The first point of the series is always kept
+        return bucket[0]
+    prev_time, prev_value, _ = previous
+    avg_time = sum(point[0] for point in next_bucket) / len(next_bucket)
+    avg_value = sum(point[1] for point in next_bucket) / len(next_bucket)
+    max_area = -1.0
+    selected = 0
+    for idx, (time, value, _) in enumerate(bucket):
+        area = abs(
+            (prev_time - avg_time) * (value - prev_value)
+            - (prev_time - time) * (avg_value - prev_value)
+        )
+        if area > max_area:
+            max_area = area
+            selected = idx
+    return bucket[selected]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import groupby, islice, takewhile
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any, cast
 
@@ -51,6 +52,10 @@ from .const import (
     STATE_KEY,
 )
 
+# The maximum number of rows of a single entity in
+# each chunk yielded by stream_significant_states
+DEFAULT_STREAM_CHUNK_SIZE = 1024
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
@@ -236,6 +241,305 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        prepared := _prepare_significant_states_stmts(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    entity_id_to_metadata_id, start_time_ts, stmts = prepared
+    rows: list[Row] = []
+    for stmt in stmts:
+        row_chunk = cast(
+            list[Row],
+            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        )
+        if rows:
+            rows += row_chunk
+        else:
+            # If we have no rows yet, we can just assign the chunk
+            # as this is the common case since its rare that
+            # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
+            rows = row_chunk
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield states changes during UTC period start_time - end_time in chunks.
+
+    This is the streaming version of get_significant_states. See
+    SignificantStatesReader for how the chunks are read.
+    """
+    reader = SignificantStatesReader(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        chunk_size,
+    )
+    while (chunk := reader.read_chunk()) is not None:
+        yield chunk
+
+
+class SignificantStatesReader:
+    """Read the significant states of entities in chunks.
+
+    Each chunk holds at most chunk_size states of a single entity. The
+    entities are read in the order they were requested and the chunks of
+    an entity are read in order, one after the other. Joined together, the
+    chunks match get_significant_states.
+
+    Every call to read_chunk runs its queries in a new session and keeps
+    the position to continue from, so nothing is held open in the database
+    between chunks and the caller may take as long as it needs to process
+    a chunk.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        entity_ids: list[str] | None = None,
+        include_start_time_state: bool = True,
+        significant_changes_only: bool = True,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+        compressed_state_format: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the reader."""
+        if not entity_ids:
+            raise ValueError("entity_ids must be provided")
+        self._hass = hass
+        self._start_time = start_time
+        self._start_time_ts = start_time.timestamp()
+        self._end_time_ts = datetime_to_timestamp_or_none(end_time)
+        self._entity_ids = entity_ids
+        self._include_start_time_state = include_start_time_state
+        self._significant_changes_only = significant_changes_only
+        self._minimal_response = minimal_response
+        self._no_attributes = no_attributes
+        self._compressed_state_format = compressed_state_format
+        self._chunk_size = chunk_size
+        # The entities that are left to read, None until the first chunk
+        self._entities: deque[tuple[str, int]] | None = None
+        # The entity being read and where to continue reading it
+        self._entity: _EntityStatesConverter | None = None
+        self._metadata_id = 0
+        self._after_ts: float | None = None
+        self._skip = 0
+
+    def read_chunk(self) -> tuple[str, list[State | dict[str, Any]]] | None:
+        """Read the next chunk of states.
+
+        Returns None once the states of all the entities have been read.
+        """
+        with session_scope(hass=self._hass, read_only=True) as session:
+            if self._entities is None:
+                self._entities = self._recorded_entities(session)
+            while self._entity is not None or self._entities:
+                start_time_rows: list[Row] = []
+                if self._entity is None:
+                    entity_id, self._metadata_id = self._entities.popleft()
+                    self._entity = _EntityStatesConverter(
+                        entity_id,
+                        self._start_time_ts if self._include_start_time_state else None,
+                        self._minimal_response,
+                        self._compressed_state_format,
+                        self._no_attributes,
+                    )
+                    self._after_ts = None
+                    self._skip = 0
+                    if self._include_start_time_state:
+                        start_time_rows = self._read_start_time_rows(session)
+                entity = self._entity
+                rows = start_time_rows
+                if (limit := self._chunk_size - len(start_time_rows)) > 0:
+                    rows = rows + self._read_rows(session, limit)
+                if states := entity.convert(rows):
+                    return entity.entity_id, states
+        return None
+
+    def _recorded_entities(self, session: Session) -> deque[tuple[str, int]]:
+        """Return the entities to read which have been recorded."""
+        entity_id_to_metadata_id = get_instance(
+            self._hass
+        ).states_meta_manager.get_many(self._entity_ids, session, False)
+        if self._include_start_time_state and not _get_oldest_possible_ts(
+            self._hass, self._start_time
+        ):
+            self._include_start_time_state = False
+        return deque(
+            (entity_id, metadata_id)
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        )
+
+    def _read_start_time_rows(self, session: Session) -> list[Row]:
+        """Read the state of the entity at the start time."""
+        start_time_ts = self._start_time_ts
+        metadata_id = self._metadata_id
+        no_attributes = self._no_attributes
+        include_last_changed = not self._significant_changes_only
+        stmt = lambda_stmt(
+            lambda: _get_single_entity_start_time_stmt(
+                start_time_ts,
+                metadata_id,
+                no_attributes,
+                include_last_changed,
+                False,
+            ),
+            track_on=[no_attributes, include_last_changed],
+        )
+        return list(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+
+    def _read_rows(self, session: Session, limit: int) -> list[Row]:
+        """Read the next rows of the entity in the period.
+
+        The rows are read from the timestamp of the last row that was read,
+        skipping the rows with that timestamp that were read already.
+        """
+        assert self._entity is not None
+        skip = self._skip
+        stmt = _significant_states_chunk_stmt(
+            self._start_time_ts if self._after_ts is None else self._after_ts,
+            self._after_ts is not None,
+            self._end_time_ts,
+            self._metadata_id,
+            self._significant_changes_only
+            and split_entity_id(self._entity.entity_id)[0] not in SIGNIFICANT_DOMAINS,
+            not self._significant_changes_only,
+            self._no_attributes,
+            limit + skip,
+        )
+        rows = list(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+        if len(rows) < limit + skip:
+            # All the rows of the entity have been read
+            self._entity = None
+        elif rows:
+            last_updated_ts = rows[-1].last_updated_ts
+            self._skip = sum(
+                1
+                for _ in takewhile(
+                    lambda row: row.last_updated_ts == last_updated_ts,
+                    reversed(rows),
+                )
+            )
+            self._after_ts = last_updated_ts
+        return rows[skip:]
+
+
+def _significant_states_chunk_stmt(
+    after_ts: float,
+    inclusive: bool,
+    end_time_ts: float | None,
+    metadata_id: int,
+    only_changes: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+    limit: int,
+) -> StatementLambdaElement:
+    """Return the statement to read the next significant states of an entity."""
+    return lambda_stmt(
+        lambda: _significant_states_chunk_select(
+            after_ts,
+            inclusive,
+            end_time_ts,
+            metadata_id,
+            only_changes,
+            include_last_changed,
+            no_attributes,
+            limit,
+        ),
+        track_on=[
+            inclusive,
+            bool(end_time_ts),
+            only_changes,
+            include_last_changed,
+            no_attributes,
+        ],
+    )
+
+
+def _significant_states_chunk_select(
+    after_ts: float,
+    inclusive: bool,
+    end_time_ts: float | None,
+    metadata_id: int,
+    only_changes: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+    limit: int,
+) -> Select:
+    """Query the next significant states of an entity."""
+    stmt = _stmt_and_join_attributes(no_attributes, include_last_changed, False)
+    if only_changes:
+        stmt = stmt.filter(
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+    stmt = stmt.filter(States.metadata_id == metadata_id)
+    if inclusive:
+        stmt = stmt.filter(States.last_updated_ts >= after_ts)
+    else:
+        stmt = stmt.filter(States.last_updated_ts > after_ts)
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    return stmt.order_by(States.last_updated_ts, States.state_id).limit(limit)
+
+
+def _prepare_significant_states_stmts(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, int | None], float | None, list[StatementLambdaElement]] | None:
+    """Prepare the statements to find the significant states.
+
+    Returns the metadata ids of the entities, the start time timestamp
+    to use for the start time states and the statements to execute, or
+    None if none of the entities have ever been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -244,7 +548,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -261,7 +565,6 @@ def get_significant_states_with_session(
     start_time_ts = start_time.timestamp()
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    rows: list[Row] = []
     if TYPE_CHECKING:
         assert instance.database_engine is not None
     slow_dependent_subquery = instance.database_engine.optimizer.slow_dependent_subquery
@@ -275,38 +578,24 @@ def get_significant_states_with_session(
         iter_metadata_ids = chunked_or_all(metadata_ids, MAX_IDS_FOR_INDEXED_GROUP_BY)
     else:
         iter_metadata_ids = (metadata_ids,)
-    for metadata_ids_chunk in iter_metadata_ids:
-        stmt = _generate_significant_states_with_session_stmt(
-            start_time_ts,
-            end_time_ts,
-            single_metadata_id,
-            metadata_ids_chunk,
-            metadata_ids_in_significant_domains,
-            significant_changes_only,
-            no_attributes,
-            include_start_time_state,
-            oldest_ts,
-            slow_dependent_subquery,
-        )
-        row_chunk = cast(
-            list[Row],
-            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        )
-        if rows:
-            rows += row_chunk
-        else:
-            # If we have no rows yet, we can just assign the chunk
-            # as this is the common case since its rare that
-            # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
-            rows = row_chunk
-    return _sorted_states_to_dict(
-        rows,
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
+        [
+            _generate_significant_states_with_session_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids_chunk,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+                oldest_ts,
+                slow_dependent_subquery,
+            )
+            for metadata_ids_chunk in iter_metadata_ids
+        ],
     )
 
 
@@ -933,3 +1222,144 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+class _EntityStatesConverter:
+    """Convert the rows of an entity into JSON friendly states, chunk by chunk.
+
+    This is the chunked version of _sorted_states_to_dict for a single
+    entity. Duplicate states of minimal responses are filtered out across
+    the chunks.
+    """
+
+    __slots__ = (
+        "_attr_cache",
+        "_attr_state",
+        "_attr_time",
+        "_compressed_state_format",
+        "_first_chunk",
+        "_full_states",
+        "_no_attributes",
+        "_prev_state",
+        "_start_time_ts",
+        "_state_class",
+        "entity_id",
+    )
+
+    def __init__(
+        self,
+        entity_id: str,
+        start_time_ts: float | None,
+        minimal_response: bool,
+        compressed_state_format: bool,
+        no_attributes: bool,
+    ) -> None:
+        """Initialize the converter."""
+        self.entity_id = entity_id
+        self._start_time_ts = start_time_ts
+        self._compressed_state_format = compressed_state_format
+        self._no_attributes = no_attributes
+        self._attr_cache: dict[str, dict[str, Any]] = {}
+        self._full_states = (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        )
+        self._prev_state: str | None = None
+        self._first_chunk = True
+        self._state_class: Callable[
+            [
+                Row,
+                dict[str, dict[str, Any]],
+                float | None,
+                str,
+                str,
+                float | None,
+                bool,
+            ],
+            State | dict[str, Any],
+        ]
+        if compressed_state_format:
+            self._state_class = row_to_compressed_state
+            self._attr_time = COMPRESSED_STATE_LAST_UPDATED
+            self._attr_state = COMPRESSED_STATE_STATE
+        else:
+            self._state_class = LazyState
+            self._attr_time = LAST_CHANGED_KEY
+            self._attr_state = STATE_KEY
+
+    def convert(self, chunk: list[Row]) -> list[State | dict[str, Any]]:
+        """Convert the next chunk of rows sorted by last_updated."""
+        if not chunk:
+            return []
+        field_map = _FIELD_MAP
+        state_idx = field_map["state"]
+        last_updated_ts_idx = field_map["last_updated_ts"]
+        state_class = self._state_class
+        entity_id = self.entity_id
+        if self._full_states:
+            return [
+                state_class(
+                    db_state,
+                    self._attr_cache,
+                    self._start_time_ts,
+                    entity_id,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
+                )
+                for db_state in chunk
+            ]
+
+        # With minimal response we only provide a native
+        # State for the first response. All the states
+        # after it only provide the "state" and the
+        # "last_changed" and duplicate states are filtered
+        # out across chunk boundaries.
+        ent_results: list[State | dict[str, Any]] = []
+        rows: Iterable[Row] = chunk
+        prev_state = self._prev_state
+        if self._first_chunk:
+            self._first_chunk = False
+            first_state = chunk[0]
+            prev_state = first_state[state_idx]
+            ent_results.append(
+                state_class(
+                    first_state,
+                    self._attr_cache,
+                    self._start_time_ts,
+                    entity_id,
+                    prev_state,
+                    first_state[last_updated_ts_idx],
+                    self._no_attributes,
+                )
+            )
+            rows = islice(chunk, 1, None)
+        attr_state = self._attr_state
+        attr_time = self._attr_time
+        if self._compressed_state_format:
+            ent_results.extend(
+                [
+                    {
+                        attr_state: (prev_state := state),
+                        attr_time: row[last_updated_ts_idx],
+                    }
+                    for row in rows
+                    if (state := row[state_idx]) != prev_state
+                ]
+            )
+        else:
+            _utc_from_timestamp = dt_util.utc_from_timestamp
+            ent_results.extend(
+                [
+                    {
+                        attr_state: (prev_state := state),
+                        attr_time: _utc_from_timestamp(
+                            row[last_updated_ts_idx]
+                        ).isoformat(),
+                    }
+                    for row in rows
+                    if (state := row[state_idx]) != prev_state
+                ]
+            )
+        self._prev_state = prev_state
+        return ent_results
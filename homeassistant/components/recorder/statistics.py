@@ -5,22 +5,25 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
 import math
 from operator import itemgetter
 import re
+import threading
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, Required, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import (
     Label,
     Select,
     and_,
     bindparam,
     case,
+    event as sqlalchemy_event,
     func,
     lambda_stmt,
     select,
@@ -222,6 +225,12 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_COMPILER = "recorder_hourly_statistics_compiler"
+DATA_STATISTICS_ROLLUP_CACHE = "recorder_statistics_rollup_cache"
+
+# The number of statistic_id and display unit combinations
+# which have their daily rollups cached
+STATISTICS_ROLLUP_CACHE_SIZE = 256
 
 
 def mean(values: list[float]) -> float | None:
@@ -285,6 +294,363 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _HourlyStatisticAccumulator:
+    """Running summary of the 5-minute statistics of a metadata_id in an hour."""
+
+    mean_type: StatisticMeanType
+    min: float | None = None
+    max: float | None = None
+    mean_sum: float = 0.0
+    mean_count: int = 0
+    weighted_sum_sin: float | None = None
+    weighted_sum_cos: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+    def add(self, stat: StatisticsBase, mean_type: StatisticMeanType) -> None:
+        """Add a 5-minute statistic to the summary."""
+        self.mean_type = mean_type
+        if (_min := stat.min) is not None and (self.min is None or _min < self.min):
+            self.min = _min
+        if (_max := stat.max) is not None and (self.max is None or _max > self.max):
+            self.max = _max
+        if (_mean := stat.mean) is not None:
+            self.mean_sum += _mean
+            self.mean_count += 1
+            if (_mean_weight := stat.mean_weight) is not None:
+                radians = math.radians(_mean)
+                self.weighted_sum_sin = (self.weighted_sum_sin or 0.0) + math.sin(
+                    radians
+                ) * _mean_weight
+                self.weighted_sum_cos = (self.weighted_sum_cos or 0.0) + math.cos(
+                    radians
+                ) * _mean_weight
+        # The statistics are added in order so the last one has the last sum
+        self.last_reset_ts = stat.last_reset_ts
+        self.state = stat.state
+        self.sum = stat.sum
+
+    def summary(self, start_time_ts: float) -> StatisticDataTimestamp:
+        """Return the hourly statistic, matching _compile_hourly_statistics."""
+        _mean: float | None = None
+        _mean_weight: float | None = None
+        if self.mean_type is StatisticMeanType.ARITHMETIC:
+            if self.mean_count:
+                _mean = self.mean_sum / self.mean_count
+        elif self.mean_type is StatisticMeanType.CIRCULAR:
+            if self.weighted_sum_sin is not None and self.weighted_sum_cos is not None:
+                _mean = (
+                    math.degrees(
+                        math.atan2(self.weighted_sum_sin, self.weighted_sum_cos)
+                    )
+                    % 360
+                )
+                _mean_weight = math.sqrt(
+                    self.weighted_sum_sin**2 + self.weighted_sum_cos**2
+                )
+        # The summary has the same None values for missing
+        # fields as the one summarized with a query
+        return cast(
+            StatisticDataTimestamp,
+            {
+                "start_ts": start_time_ts,
+                "mean": _mean,
+                "mean_weight": _mean_weight,
+                "min": self.min,
+                "max": self.max,
+                "last_reset_ts": self.last_reset_ts,
+                "state": self.state,
+                "sum": self.sum,
+            },
+        )
+
+
+class HourlyStatisticsCompiler:
+    """Compile hourly statistics from the 5-minute statistics as they are written.
+
+    Summarizing the 5-minute statistics of an hour with a query gets slow
+    with many statistic ids. Instead the 5-minute statistics are added to
+    running per metadata_id summaries when they are compiled and the hourly
+    statistics are taken from the summaries.
+
+    The summaries are only used when every 5-minute period of the hour was
+    compiled in order by this instance and the number of 5-minute rows in
+    the database matches, otherwise the hour is summarized with a query.
+    Anything else which modifies the 5-minute statistics must call
+    invalidate.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    __slots__ = ("_accumulators", "_hour_start_ts", "_next_start_ts", "_rows")
+
+    def __init__(self) -> None:
+        """Initialize the compiler."""
+        self._accumulators: dict[int, _HourlyStatisticAccumulator] = {}
+        self._hour_start_ts: float | None = None
+        self._next_start_ts: float | None = None
+        self._rows = 0
+
+    def invalidate(self) -> None:
+        """Forget the summaries, the current hour will be compiled with a query."""
+        self._accumulators = {}
+        self._hour_start_ts = None
+        self._next_start_ts = None
+        self._rows = 0
+
+    def add_period(
+        self,
+        start: datetime,
+        stats: Iterable[tuple[StatisticsBase, StatisticMeanType]],
+    ) -> None:
+        """Add the 5-minute statistics compiled for the period starting at start."""
+        start_ts = start.timestamp()
+        if start.minute == 0:
+            self.invalidate()
+            self._hour_start_ts = start_ts
+        elif self._hour_start_ts is None or start_ts != self._next_start_ts:
+            # A period is missing or compiled twice
+            self.invalidate()
+            return
+        self._next_start_ts = start_ts + StatisticsShortTerm.duration.total_seconds()
+        accumulators = self._accumulators
+        for stat, mean_type in stats:
+            if TYPE_CHECKING:
+                assert stat.metadata_id is not None
+            if (accumulator := accumulators.get(stat.metadata_id)) is None:
+                accumulator = accumulators[stat.metadata_id] = (
+                    _HourlyStatisticAccumulator(mean_type)
+                )
+            accumulator.add(stat, mean_type)
+            self._rows += 1
+
+    def pop_summary(
+        self, session: Session, start_time: datetime
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly statistics for the hour starting at start_time.
+
+        Returns None if the hour must be summarized with a query.
+        """
+        start_time_ts = start_time.timestamp()
+        end_time_ts = (start_time + Statistics.duration).timestamp()
+        hour_start_ts = self._hour_start_ts
+        accumulators = self._accumulators
+        rows = self._rows
+        self.invalidate()
+        if (
+            hour_start_ts != start_time_ts
+            or session.execute(
+                _count_short_term_statistics_stmt(start_time_ts, end_time_ts)
+            ).scalar_one()
+            != rows
+        ):
+            return None
+        return {
+            metadata_id: accumulator.summary(start_time_ts)
+            for metadata_id, accumulator in accumulators.items()
+        }
+
+
+@dataclasses.dataclass(slots=True)
+class _StatisticsRollup:
+    """Aggregate of the hourly statistics of a statistic_id in a period."""
+
+    start_ts: float
+    end_ts: float
+    min: float | None = None
+    max: float | None = None
+    mean_sum: float = 0.0
+    mean_count: int = 0
+    weighted_sum_sin: float = 0.0
+    weighted_sum_cos: float = 0.0
+    last_reset: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+    def add(self, row: StatisticsRow, circular: bool) -> None:
+        """Add an hourly statistic, the statistics must be added in order."""
+        if (_min := row.get("min")) is not None and (
+            self.min is None or _min < self.min
+        ):
+            self.min = _min
+        if (_max := row.get("max")) is not None and (
+            self.max is None or _max > self.max
+        ):
+            self.max = _max
+        if (_mean := row.get("mean")) is not None:
+            self.mean_sum += _mean
+            self.mean_count += 1
+            if circular:
+                rad_mean = _mean * DEG_TO_RAD
+                _mean_weight = row.get("mean_weight") or 0.0
+                self.weighted_sum_sin += math.sin(rad_mean) * _mean_weight
+                self.weighted_sum_cos += math.cos(rad_mean) * _mean_weight
+        self.last_reset = row.get("last_reset")
+        self.state = row.get("state")
+        self.sum = row.get("sum")
+
+    def merge(self, other: _StatisticsRollup) -> None:
+        """Merge the rollup of a later period into this rollup."""
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        self.mean_sum += other.mean_sum
+        self.mean_count += other.mean_count
+        self.weighted_sum_sin += other.weighted_sum_sin
+        self.weighted_sum_cos += other.weighted_sum_cos
+        self.last_reset = other.last_reset
+        self.state = other.state
+        self.sum = other.sum
+
+    def as_row(
+        self,
+        types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+        mean_type: StatisticMeanType,
+    ) -> StatisticsRow:
+        """Return the rollup as a row, matching _reduce_statistics."""
+        row: StatisticsRow = {"start": self.start_ts, "end": self.end_ts}
+        if "mean" in types:
+            row["mean"] = None
+            if self.mean_count:
+                match mean_type:
+                    case StatisticMeanType.ARITHMETIC:
+                        row["mean"] = self.mean_sum / self.mean_count
+                    case StatisticMeanType.CIRCULAR:
+                        row["mean"] = (
+                            RAD_TO_DEG
+                            * math.atan2(self.weighted_sum_sin, self.weighted_sum_cos)
+                        ) % 360
+        if "min" in types:
+            row["min"] = self.min
+        if "max" in types:
+            row["max"] = self.max
+        if "last_reset" in types:
+            row["last_reset"] = self.last_reset
+        if "state" in types:
+            row["state"] = self.state
+        if "sum" in types:
+            row["sum"] = self.sum
+        return row
+
+
+class StatisticsRollupCache:
+    """Cache daily rollups of the hourly statistics.
+
+    Reducing years of hourly statistics to days, weeks or months for
+    dashboards reads and reduces every hourly row each time. Instead the
+    hourly statistics of each completed local day are reduced once and
+    the rollups of the days are combined to weeks and months, so only
+    the hourly statistics of the days which are not cached are read.
+
+    The rollups are in the display unit of the statistics and are keyed by
+    metadata_id, statistic unit and display unit. Anything which writes
+    hourly statistics must call invalidate_after_commit, rollups which
+    were computed from statistics read before the last invalidation are
+    not cached.
+    """
+
+    __slots__ = ("_days", "_generation", "_lock", "_time_zone")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._days: LRU[
+            tuple[int, str | None, str | None], dict[float, _StatisticsRollup | None]
+        ] = LRU(STATISTICS_ROLLUP_CACHE_SIZE)
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._time_zone: tzinfo | None = None
+
+    def generation(self) -> int:
+        """Return the generation to pass to set_days.
+
+        The cache is cleared if the time zone has changed.
+        """
+        with self._lock:
+            if (time_zone := dt_util.get_default_time_zone()) is not self._time_zone:
+                self._days.clear()
+                self._generation += 1
+                self._time_zone = time_zone
+            return self._generation
+
+    def get_days(
+        self, key: tuple[int, str | None, str | None]
+    ) -> dict[float, _StatisticsRollup | None]:
+        """Return the cached rollups by day start, None if the day has no data."""
+        with self._lock:
+            return dict(self._days.get(key) or {})
+
+    def set_days(
+        self,
+        generation: int,
+        key: tuple[int, str | None, str | None],
+        days: dict[float, _StatisticsRollup | None],
+    ) -> None:
+        """Cache rollups of completed days unless the cache was invalidated."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            if (cached := self._days.get(key)) is None:
+                self._days[key] = cached = {}
+            cached.update(days)
+
+    def invalidate_after_commit(
+        self,
+        session: Session,
+        metadata_ids: Iterable[int] | None = None,
+        start_ts: float | None = None,
+    ) -> None:
+        """Invalidate the rollups once the changes of session are committed.
+
+        Invalidating before the commit would let a concurrent reader get
+        the new generation, read the statistics as they were before the
+        commit and cache them.
+        """
+        if metadata_ids is not None:
+            metadata_ids = set(metadata_ids)
+
+        def _invalidate(session: Session) -> None:
+            self.invalidate(metadata_ids, start_ts)
+
+        sqlalchemy_event.listen(session, "after_commit", _invalidate, once=True)
+
+    def invalidate(
+        self,
+        metadata_ids: Iterable[int] | None = None,
+        start_ts: float | None = None,
+    ) -> None:
+        """Forget the rollups of metadata_ids or all statistics.
+
+        If start_ts is set only the rollups of the day of start_ts are
+        forgotten.
+        """
+        with self._lock:
+            self._generation += 1
+            if metadata_ids is None and start_ts is None:
+                self._days.clear()
+                return
+            items = self._days.items()
+            if metadata_ids is not None:
+                _metadata_ids = set(metadata_ids)
+                items = [item for item in items if item[0][0] in _metadata_ids]
+            if start_ts is None:
+                for key, _ in items:
+                    del self._days[key]
+                return
+            if self._time_zone is None:
+                return
+            day_start_ts = (
+                datetime.fromtimestamp(start_ts, tz=self._time_zone)
+                .replace(hour=0, minute=0, second=0, microsecond=0)
+                .timestamp()
+            )
+            for _, days in items:
+                days.pop(day_start_ts, None)
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -483,20 +849,42 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _count_short_term_statistics_stmt(
+    start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Generate the statement to count the 5-minute statistics in a period."""
+    return lambda_stmt(
+        lambda: select(func.count(StatisticsShortTerm.id))
+        .filter(StatisticsShortTerm.start_ts >= start_time_ts)
+        .filter(StatisticsShortTerm.start_ts < end_time_ts)
+    )
+
+
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    compiler: HourlyStatisticsCompiler | None = None,
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If the compiler has summarized every 5-minute statistic of the
+    hour as they were written, its summary is used instead.
     """
     start_time = start.replace(minute=0)
+    if compiler and (summary := compiler.pop_summary(session, start_time)) is not None:
+        _insert_hourly_statistics(session, summary)
+        return
+
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
 
     # Compute last hour's average, min, max
-    summary: dict[int, StatisticDataTimestamp] = {}
+    summary = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
     stats = execute_stmt_lambda_element(session, stmt)
 
@@ -540,7 +928,13 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
+    _insert_hourly_statistics(session, summary)
+
+
+def _insert_hourly_statistics(
+    session: Session, summary: dict[int, StatisticDataTimestamp]
+) -> None:
+    """Insert compiled hourly statistics in the database."""
     now_timestamp = time_time()
     session.add_all(
         Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
@@ -623,6 +1017,18 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     return True
 
 
+def _mean_type(metadata: StatisticMetaData) -> StatisticMeanType:
+    """Return the mean type of statistic metadata."""
+    if "mean_type" in metadata:
+        return metadata["mean_type"]
+    # Custom integrations may still only set has_mean
+    return (  # type: ignore[unreachable]
+        StatisticMeanType.ARITHMETIC
+        if metadata.get("has_mean")
+        else StatisticMeanType.NONE
+    )
+
+
 def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
     """Return a statement that returns the first run_id at start."""
     return lambda_stmt(lambda: select(StatisticsRuns.run_id).filter_by(start=start))
@@ -675,6 +1081,7 @@ def _compile_statistics(
         current_metadata.update(compiled.current_metadata)
 
     new_short_term_stats: list[StatisticsBase] = []
+    new_short_term_stats_mean_types: list[StatisticMeanType] = []
     updated_metadata_ids: set[int] = set()
     now_timestamp = time_time()
     # Insert collected statistics in the database
@@ -689,6 +1096,12 @@ def _compile_statistics(
             session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
         ):
             new_short_term_stats.append(new_stat)
+            new_short_term_stats_mean_types.append(_mean_type(stats["meta"]))
+
+    hourly_compiler = get_hourly_statistics_compiler(instance.hass)
+    hourly_compiler.add_period(
+        start, zip(new_short_term_stats, new_short_term_stats_mean_types, strict=True)
+    )
 
     if start.minute == 50:
         # Once every hour, update issues
@@ -703,7 +1116,10 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, hourly_compiler)
+        get_statistics_rollup_cache(instance.hass).invalidate_after_commit(
+            session, start_ts=start.replace(minute=0).timestamp()
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -849,7 +1265,9 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    get_hourly_statistics_compiler(instance.hass).invalidate()
     with session_scope(session=instance.get_session()) as session:
+        get_statistics_rollup_cache(instance.hass).invalidate_after_commit(session)
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
 
@@ -1846,6 +2264,153 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _rollup_display_unit(
+    hass: HomeAssistant,
+    statistic_id: str,
+    statistic_unit: str | None,
+    units: dict[str, str] | None,
+) -> str | None:
+    """Return the unit _sorted_statistics_to_dict converts the statistics to."""
+    if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
+        return statistic_unit
+    display_unit: str | None = statistic_unit
+    if units and converter.UNIT_CLASS in units:
+        display_unit = units[converter.UNIT_CLASS]
+    elif state := hass.states.get(statistic_id):
+        display_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    if display_unit not in converter.VALID_UNITS:
+        return statistic_unit
+    return display_unit
+
+
+def _statistics_during_period_from_rollups(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return daily, weekly or monthly statistics reduced from daily rollups.
+
+    start_time and end_time must be aligned with local days. The rollups of
+    completed days are cached, only the hourly statistics of the days which
+    are not cached and of the current day are read from the database.
+    """
+    rollup_cache = get_statistics_rollup_cache(hass)
+    generation = rollup_cache.generation()
+    _, day_start_end = reduce_day_ts_factory()
+    end_ts = end_time.timestamp() if end_time is not None else None
+    # Only days which have ended are cached
+    cache_end_ts = day_start_end(time_time())[0]
+    if end_ts is not None:
+        cache_end_ts = min(cache_end_ts, end_ts)
+    day_starts: list[float] = []
+    day_start = dt_util.as_local(start_time)
+    while (day_start_ts := day_start.timestamp()) < cache_end_ts:
+        day_starts.append(day_start_ts)
+        day_start += timedelta(days=1)
+
+    query_start_ts = max(cache_end_ts, start_time.timestamp())
+    keys: dict[int, tuple[int, str | None, str | None]] = {}
+    cached_days: dict[int, dict[float, _StatisticsRollup | None]] = {}
+    for statistic_id, (metadata_id, stats_metadata) in metadata.items():
+        unit = stats_metadata["unit_of_measurement"]
+        keys[metadata_id] = key = (
+            metadata_id,
+            unit,
+            _rollup_display_unit(hass, statistic_id, unit, units),
+        )
+        cached = cached_days[metadata_id] = rollup_cache.get_days(key)
+        for day_start_ts in day_starts:
+            if day_start_ts not in cached:
+                query_start_ts = min(query_start_ts, day_start_ts)
+                break
+
+    new_days: dict[int, dict[float, _StatisticsRollup]] = defaultdict(dict)
+    if end_ts is None or query_start_ts < end_ts:
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(query_start_ts),
+            end_time,
+            list(keys),
+            Statistics,
+            {"last_reset", "max", "mean", "min", "state", "sum"},
+        )
+        if stats := cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        ):
+            hourly_stats = _sorted_statistics_to_dict(
+                hass,
+                stats,
+                None,
+                metadata,
+                True,
+                Statistics,
+                units,
+                {"last_reset", "max", "mean", "min", "state", "sum"},
+            )
+            for statistic_id, stat_list in hourly_stats.items():
+                metadata_id, stats_metadata = metadata[statistic_id]
+                circular = stats_metadata["mean_type"] is StatisticMeanType.CIRCULAR
+                days = new_days[metadata_id]
+                rollup: _StatisticsRollup | None = None
+                for statistic in stat_list:
+                    if rollup is None or statistic["start"] >= rollup.end_ts:
+                        rollup = _StatisticsRollup(*day_start_end(statistic["start"]))
+                        days[rollup.start_ts] = rollup
+                    rollup.add(statistic, circular)
+
+    same_period: Callable[[float, float], bool] | None = None
+    period_start_end: Callable[[float], tuple[float, float]] | None = None
+    if period == "week":
+        same_period, period_start_end = reduce_week_ts_factory()
+    elif period == "month":
+        same_period, period_start_end = reduce_month_ts_factory()
+
+    result: dict[str, list[StatisticsRow]] = {}
+    for statistic_id, (metadata_id, stats_metadata) in metadata.items():
+        cached = cached_days[metadata_id]
+        new = new_days.get(metadata_id, {})
+        if missing_days := {
+            day_start_ts: new.get(day_start_ts)
+            for day_start_ts in day_starts
+            if day_start_ts not in cached
+        }:
+            rollup_cache.set_days(generation, keys[metadata_id], missing_days)
+        rollups = [
+            rollup
+            for day_start_ts in day_starts
+            if (rollup := cached.get(day_start_ts, new.get(day_start_ts))) is not None
+        ]
+        rollups.extend(
+            rollup
+            for day_start_ts, rollup in new.items()
+            if day_start_ts >= cache_end_ts
+        )
+        if not rollups:
+            continue
+
+        mean_type = stats_metadata["mean_type"]
+        if same_period is None or period_start_end is None:
+            result[statistic_id] = [
+                rollup.as_row(types, mean_type) for rollup in rollups
+            ]
+            continue
+        rows: list[StatisticsRow] = []
+        period_rollup = _StatisticsRollup(*period_start_end(rollups[0].start_ts))
+        for rollup in rollups:
+            if not same_period(period_rollup.start_ts, rollup.start_ts):
+                rows.append(period_rollup.as_row(types, mean_type))
+                period_rollup = _StatisticsRollup(*period_start_end(rollup.start_ts))
+            period_rollup.merge(rollup)
+        rows.append(period_rollup.as_row(types, mean_type))
+        result[statistic_id] = rows
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1916,35 +2481,42 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if metadata_ids is not None and period in ("day", "week", "month"):
+        result = _statistics_during_period_from_rollups(
+            hass, session, start_time, end_time, metadata, period, units, types
+        )
+        if not result:
+            return {}
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types, metadata)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types, metadata)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types, metadata)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types, metadata)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types, metadata)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types, metadata)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2582,8 +3154,12 @@ def _import_statistics_with_session(
             _insert_statistics(session, table, metadata_id, stat, now_timestamp)
 
     if table != StatisticsShortTerm:
+        get_statistics_rollup_cache(instance.hass).invalidate_after_commit(
+            session, {metadata_id}
+        )
         return True
 
+    get_hourly_statistics_compiler(instance.hass).invalidate()
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
@@ -2602,6 +3178,18 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_COMPILER)
+def get_hourly_statistics_compiler(hass: HomeAssistant) -> HourlyStatisticsCompiler:
+    """Get the hourly statistics compiler."""
+    return HourlyStatisticsCompiler()
+
+
+@singleton(DATA_STATISTICS_ROLLUP_CACHE)
+def get_statistics_rollup_cache(hass: HomeAssistant) -> StatisticsRollupCache:
+    """Get the statistics rollup cache."""
+    return StatisticsRollupCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2695,6 +3283,10 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        get_hourly_statistics_compiler(instance.hass).invalidate()
+        get_statistics_rollup_cache(instance.hass).invalidate_after_commit(
+            session, {metadata[statistic_id][0]}
+        )
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2768,6 +3360,10 @@ def change_statistics_unit(
             )
             return
 
+        get_hourly_statistics_compiler(instance.hass).invalidate()
+        get_statistics_rollup_cache(instance.hass).invalidate_after_commit(
+            session, {metadata_id}
+        )
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
+from homeassistant.helpers.storage import Store
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
@@ -18,6 +20,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -28,6 +32,11 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The hashes of the most recently used attributes are saved at shutdown
+# so the cache can be loaded from the database in bulk at the next start
+WARM_CACHE_STORAGE_KEY = "recorder.state_attributes_hashes"
+WARM_CACHE_STORAGE_VERSION = 1
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,11 +46,40 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._warm_cache_store = Store[list[int]](
+            recorder.hass,
+            WARM_CACHE_STORAGE_VERSION,
+            WARM_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._warm_cache_hashes: list[int] = []
+        # entity_id -> (attributes, state_info, shared_attrs_bytes)
+        self._last_serialized: dict[
+            str, tuple[ReadOnlyDict[str, Any], StateInfo | None, bytes]
+        ] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        The state machine reuses the attributes object when only the state
+        changes, so when the attributes of the new state are the same object
+        as the last serialized attributes for the entity, the last result is
+        returned without encoding them again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            self._last_serialized.pop(entity_id, None)
+        elif (
+            (last_serialized := self._last_serialized.get(entity_id))
+            and last_serialized[0] is new_state.attributes
+            and last_serialized[1] is new_state.state_info
+        ):
+            return last_serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +89,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if new_state is not None:
+            self._last_serialized[entity_id] = (
+                new_state.attributes,
+                new_state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -67,6 +112,52 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    async def async_load_warm_cache(self) -> None:
+        """Load the hashes of the attributes used before the last shutdown.
+
+        Must run in the event loop.
+        """
+        self._warm_cache_hashes = await self._warm_cache_store.async_load() or []
+
+    def load_warm_cache(self, session: Session) -> None:
+        """Load the attributes used before the last shutdown into the cache.
+
+        The hashes are resolved against the database so the cache can never
+        contain ids that do not exist anymore.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (hashes := self._warm_cache_hashes):
+            return
+        self._warm_cache_hashes = []
+        # The cache must be large enough to hold the saved tier
+        self.adjust_lru_size(len(hashes))
+        self._load_from_hashes(hashes, session)
+
+    def prepare_warm_cache(self) -> None:
+        """Collect the hashes of the cached attributes to save at shutdown.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        # LRU is not iterable, keys() returns the most recently used first
+        self._warm_cache_hashes = [
+            StateAttributes.hash_shared_attrs_bytes(
+                cast(str, shared_attrs).encode("utf-8")
+            )
+            for shared_attrs in self._id_map.keys()  # noqa: SIM118
+        ]
+
+    async def async_save_warm_cache(self) -> None:
+        """Save the hashes collected at shutdown.
+
+        Must run in the event loop after the recorder thread has finished.
+        """
+        if hashes := self._warm_cache_hashes:
+            self._warm_cache_hashes = []
+            await self._warm_cache_store.async_save(hashes)
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -136,6 +227,16 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        # The encoding depends on the dialect of the database
+        self._last_serialized.clear()
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
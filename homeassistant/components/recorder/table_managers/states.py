@@ -3,22 +3,81 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, cast
 
+from sqlalchemy import Table, insert
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from ..db_schema import States
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import StateAttributes, States, StatesMeta
 from ..queries import find_oldest_state
 from ..util import execute_stmt_lambda_element
 
 
+@dataclass(slots=True)
+class PendingStatesRow:
+    """A states row that will be inserted in bulk at the next commit.
+
+    The row mirrors the attributes of States used to link it to other rows
+    so it can be processed like a States object. The linked rows may be
+    pending in the same commit, they are resolved once those rows have ids.
+    """
+
+    params: dict[str, Any]
+    state: str | None
+    last_reported_ts: float | None
+    old_state: States | PendingStatesRow | None = None
+    old_state_id: int | None = None
+    states_meta_rel: StatesMeta | None = None
+    metadata_id: int | None = None
+    state_attributes: StateAttributes | None = None
+    attributes_id: int | None = None
+    state_id: int | None = None
+    # Rows can only be inserted once the old state they link to has an id
+    generation: int = 0
+
+    @property
+    def last_updated_ts(self) -> float:
+        """Return the last updated timestamp of the row."""
+        return cast(float, self.params["last_updated_ts"])
+
+    @classmethod
+    def from_event(cls, event: Event[EventStateChangedData]) -> PendingStatesRow:
+        """Create a pending row from a state_changed event."""
+        params = States.insert_params_from_event(event)
+        return cls(params, params["state"], params["last_reported_ts"])
+
+    def insert_params(self) -> dict[str, Any]:
+        """Return the insert parameters with the linked rows resolved."""
+        params = self.params
+        params["state"] = self.state
+        params["last_reported_ts"] = self.last_reported_ts
+        params["old_state_id"] = (
+            self.old_state.state_id if self.old_state else self.old_state_id
+        )
+        params["metadata_id"] = (
+            self.states_meta_rel.metadata_id
+            if self.states_meta_rel
+            else self.metadata_id
+        )
+        params["attributes_id"] = (
+            self.state_attributes.attributes_id
+            if self.state_attributes
+            else self.attributes_id
+        )
+        return params
+
+
 class StatesManager:
     """Manage the states table."""
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingStatesRow] = {}
+        self._pending_rows: list[list[PendingStatesRow]] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
@@ -28,7 +87,7 @@ class StatesManager:
         """Return the oldest timestamp."""
         return self._oldest_ts
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingStatesRow | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -49,7 +108,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingStatesRow) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -61,6 +120,59 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    def add_pending_row(self, row: PendingStatesRow) -> None:
+        """Add a row to be inserted at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if isinstance(row.old_state, PendingStatesRow):
+            row.generation = row.old_state.generation + 1
+        pending_rows = self._pending_rows
+        while len(pending_rows) <= row.generation:
+            pending_rows.append([])
+        pending_rows[row.generation].append(row)
+
+    def insert_pending_rows(self, session: Session) -> None:
+        """Insert the pending rows in bulk.
+
+        Each generation of rows is inserted with a single executemany,
+        which is a multi-VALUES insert on databases that support it.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending_rows := self._pending_rows):
+            return
+        # Flush first so pending StatesMeta, StateAttributes and
+        # States the rows link to have their ids assigned
+        session.flush()
+        # We need to cast __table__ to Table, explanation in
+        # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+        states_table = cast(Table, States.__table__)
+        returning = session.get_bind().dialect.insert_executemany_returning
+        for rows in pending_rows:
+            params = [row.insert_params() for row in rows]
+            state_ids: Sequence[int]
+            if returning:
+                state_ids = session.scalars(
+                    insert(states_table).returning(
+                        states_table.c.state_id, sort_by_parameter_order=True
+                    ),
+                    params,
+                ).all()
+            else:
+                # MySQL does not support RETURNING so the ids
+                # have to be fetched one row at a time
+                state_ids = [
+                    session.execute(
+                        insert(states_table), row_params
+                    ).inserted_primary_key[0]
+                    for row_params in params
+                ]
+            for row, state_id in zip(rows, state_ids, strict=True):
+                row.state_id = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -78,8 +190,10 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            if (state_id := db_states.state_id) is not None:
+                self._last_committed_id[entity_id] = state_id
         self._pending.clear()
+        self._pending_rows.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -90,6 +204,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
         self._oldest_ts = None
 
     def load_from_db(self, session: Session) -> None:
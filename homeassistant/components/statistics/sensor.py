@@ -62,6 +62,28 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .sliding_window import (
+    AverageLinear,
+    AverageStep,
+    DatetimeValueMax,
+    DatetimeValueMin,
+    Distance95Percent,
+    Distance99Percent,
+    DistanceAbsolute,
+    Mean,
+    MeanCircular,
+    Median,
+    Noisiness,
+    Percentile,
+    SlidingWindowStatistic,
+    StandardDeviation,
+    Sum,
+    SumDifferences,
+    SumDifferencesNonnegative,
+    ValueMax,
+    ValueMin,
+    Variance,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -458,6 +480,32 @@ STATS_NUMERIC_SUPPORT = {
     STAT_VARIANCE: _stat_variance,
 }
 
+# Statistics of a numeric sensor source which are updated with each sample
+# instead of being computed from all the samples by the function above
+STATS_NUMERIC_SLIDING_WINDOW: dict[str, type[SlidingWindowStatistic]] = {
+    STAT_AVERAGE_LINEAR: AverageLinear,
+    STAT_AVERAGE_STEP: AverageStep,
+    STAT_AVERAGE_TIMELESS: Mean,
+    STAT_DATETIME_VALUE_MAX: DatetimeValueMax,
+    STAT_DATETIME_VALUE_MIN: DatetimeValueMin,
+    STAT_DISTANCE_95P: Distance95Percent,
+    STAT_DISTANCE_99P: Distance99Percent,
+    STAT_DISTANCE_ABSOLUTE: DistanceAbsolute,
+    STAT_MEAN: Mean,
+    STAT_MEAN_CIRCULAR: MeanCircular,
+    STAT_MEDIAN: Median,
+    STAT_NOISINESS: Noisiness,
+    STAT_PERCENTILE: Percentile,
+    STAT_STANDARD_DEVIATION: StandardDeviation,
+    STAT_SUM: Sum,
+    STAT_SUM_DIFFERENCES: SumDifferences,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: SumDifferencesNonnegative,
+    STAT_TOTAL: Sum,
+    STAT_VALUE_MAX: ValueMax,
+    STAT_VALUE_MIN: ValueMin,
+    STAT_VARIANCE: Variance,
+}
+
 # Statistics supported by a binary_sensor source
 STATS_BINARY_SUPPORT = {
     STAT_AVERAGE_STEP: _stat_binary_average_step,
@@ -698,6 +746,16 @@ class StatisticsSensor(SensorEntity):
             [deque[bool | float], deque[float], int],
             float | int | datetime | None,
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
+        self._sliding_window_statistic: SlidingWindowStatistic | None = None
+        if not self.is_binary and (
+            statistic_class := STATS_NUMERIC_SLIDING_WINDOW.get(state_characteristic)
+        ):
+            self._sliding_window_statistic = statistic_class(percentile)
+        # The sliding window statistic is not updated while the window holds
+        # samples which are not finite, as they break its sorted samples and
+        # running sums. It is rebuilt from the window once they have left it.
+        self._non_finite_samples = 0
+        self._sliding_window_stale = False
 
         self._update_listener: CALLBACK_TYPE | None = None
         self._preview_callback: Callable[[str, Mapping[str, Any]], None] | None = None
@@ -800,10 +858,13 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_sample(
+                    new_state.state == "on", new_state.last_reported_timestamp
+                )
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_reported_timestamp)
+                self._append_sample(
+                    float(new_state.state), new_state.last_reported_timestamp
+                )
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -911,6 +972,54 @@ class StatisticsSensor(SensorEntity):
             return None
         return SensorStateClass.MEASUREMENT
 
+    def _append_sample(self, value: float | bool, age: float) -> None:
+        """Append a sample, removing the oldest one if the buffer is full."""
+        if len(self.states) == self.states.maxlen:
+            self._remove_oldest_from_statistic()
+        self.states.append(value)
+        self.ages.append(age)
+        if not math.isfinite(value):
+            self._non_finite_samples += 1
+            self._sliding_window_stale = True
+        elif (
+            statistic := self._sliding_window_statistic
+        ) is not None and not self._sliding_window_stale:
+            statistic.append(self.states, self.ages)
+
+    def _remove_oldest_from_statistic(self) -> None:
+        """Update the sliding window statistic before the oldest sample is removed."""
+        if not math.isfinite(self.states[0]):
+            self._non_finite_samples -= 1
+        elif (
+            statistic := self._sliding_window_statistic
+        ) is not None and not self._sliding_window_stale:
+            statistic.remove_oldest(self.states, self.ages)
+
+    def _sliding_window_value(
+        self, statistic: SlidingWindowStatistic
+    ) -> float | int | datetime | None:
+        """Return the value of the sliding window statistic.
+
+        The statistic is rebuilt from the window if it was not updated while
+        the window held samples which are not finite. Until then the value
+        is computed from all the samples.
+        """
+        if self._sliding_window_stale:
+            if self._non_finite_samples:
+                return self._state_characteristic_fn(
+                    self.states, self.ages, self._percentile
+                )
+            statistic = type(statistic)(self._percentile)
+            states: deque[bool | float] = deque()
+            ages: deque[float] = deque()
+            for state, age in zip(self.states, self.ages, strict=True):
+                states.append(state)
+                ages.append(age)
+                statistic.append(states, ages)
+            self._sliding_window_statistic = statistic
+            self._sliding_window_stale = False
+        return statistic.value(self.states, self.ages)
+
     def _purge_old_states(self, max_age: float) -> None:
         """Remove states which are older than a given age."""
         now_timestamp = time.time()
@@ -947,6 +1056,7 @@ class StatisticsSensor(SensorEntity):
                     dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
+            self._remove_oldest_from_statistic()
             self.ages.popleft()
             self.states.popleft()
 
@@ -1091,10 +1201,18 @@ class StatisticsSensor(SensorEntity):
     def _update_value(self) -> None:
         """Front to call the right statistical characteristics functions.
 
-        One of the _stat_*() functions is represented by self._state_characteristic_fn().
+        One of the _stat_*() functions is represented by self._state_characteristic_fn(),
+        unless the characteristic is updated with each sample by a sliding window
+        statistic.
         """
 
-        value = self._state_characteristic_fn(self.states, self.ages, self._percentile)
+        value: float | int | datetime | None
+        if self._sliding_window_statistic is not None:
+            value = self._sliding_window_value(self._sliding_window_statistic)
+        else:
+            value = self._state_characteristic_fn(
+                self.states, self.ages, self._percentile
+            )
         _LOGGER.debug(
             "Updating value: states: %s, ages: %s => %s", self.states, self.ages, value
         )
@@ -0,0 +1,595 @@
+"""Statistics which are updated with each sample of the sliding window."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+import sys
+
+from homeassistant.util import dt as dt_util
+
+# The running sums are rebuilt from the samples once at least this many,
+# or as many as the window holds, samples were removed from them, so the
+# rounding errors of the removals can not accumulate
+REBUILD_MIN_REMOVALS = 1024
+
+# The rounding error of the sum of squares of the variance relative to it
+VARIANCE_RELATIVE_TOLERANCE = 8 * sys.float_info.epsilon
+
+
+class _RunningSum:
+    """A compensated running sum of floats."""
+
+    __slots__ = ("_compensation", "_sum")
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum (Neumaier summation)."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    @property
+    def value(self) -> float:
+        """Return the sum."""
+        return self._sum + self._compensation
+
+
+class SlidingWindowStatistic(ABC):
+    """A statistic which is updated with each sample of the sliding window.
+
+    The sensor calls append after a sample was appended to the window and
+    remove_oldest before the oldest sample is removed from it, so an update
+    costs O(1) or O(log n) instead of computing the statistic from all the
+    samples. The results match the _stat_* functions of the sensor.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, percentile: int) -> None:
+        """Initialize the statistic."""
+
+    @abstractmethod
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic after a sample was appended."""
+
+    @abstractmethod
+    def remove_oldest(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic before the oldest sample is removed."""
+
+    @abstractmethod
+    def value(
+        self, states: deque[bool | float], ages: deque[float]
+    ) -> float | datetime | None:
+        """Return the value of the statistic."""
+
+
+class _RunningSumsStatistic(SlidingWindowStatistic):
+    """Base class of statistics which are computed from running sums.
+
+    Subclasses add the terms of a sample, or of the segment between two
+    samples, to the sums with _add_terms.
+    """
+
+    __slots__ = ("_removals", "_sums")
+
+    _num_sums = 1
+
+    def __init__(self, percentile: int) -> None:
+        """Initialize the statistic."""
+        self._reset()
+
+    def _reset(self) -> None:
+        """Reset the sums."""
+        self._removals = 0
+        self._sums = [_RunningSum() for _ in range(self._num_sums)]
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic after a sample was appended."""
+        if len(states) == 1:
+            self._reset()
+        self._add_terms(states, ages, len(states) - 1, 1.0)
+
+    def remove_oldest(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic before the oldest sample is removed."""
+        self._add_terms(states, ages, 0, -1.0)
+        self._removals += 1
+
+    @abstractmethod
+    def _add_terms(
+        self, states: deque[bool | float], ages: deque[float], index: int, sign: float
+    ) -> None:
+        """Add the terms of the appended sample or remove the oldest one."""
+
+    def _rebuilt_sums(
+        self, states: deque[bool | float], ages: deque[float]
+    ) -> list[_RunningSum]:
+        """Return the sums, rebuilt from the samples if needed."""
+        if self._removals >= max(len(states), REBUILD_MIN_REMOVALS):
+            self._reset()
+            for index in range(len(states)):
+                self._add_terms(states, ages, index, 1.0)
+        return self._sums
+
+
+class _SampleTermsStatistic(_RunningSumsStatistic):
+    """Base class of statistics with terms for each sample."""
+
+    __slots__ = ()
+
+    def _add_terms(
+        self, states: deque[bool | float], ages: deque[float], index: int, sign: float
+    ) -> None:
+        """Add the terms of a sample to the sums."""
+        self._add_sample_terms(states[index], sign)
+
+    @abstractmethod
+    def _add_sample_terms(self, value: float, sign: float) -> None:
+        """Add the terms of a sample value to the sums."""
+
+
+class _SegmentTermsStatistic(_RunningSumsStatistic):
+    """Base class of statistics with terms for each pair of samples.
+
+    The appended sample adds the segment from the sample before it and
+    removing the oldest sample removes the segment to the sample after it.
+    """
+
+    __slots__ = ()
+
+    def _add_terms(
+        self, states: deque[bool | float], ages: deque[float], index: int, sign: float
+    ) -> None:
+        """Add the terms of the segment of a sample to the sums."""
+        if len(states) < 2:
+            return
+        if index == 0 and sign < 0:
+            index = 1
+        elif index == 0:
+            return
+        self._add_segment_terms(
+            states[index - 1], states[index], ages[index - 1], ages[index], sign
+        )
+
+    @abstractmethod
+    def _add_segment_terms(
+        self,
+        previous_value: float,
+        value: float,
+        previous_age: float,
+        age: float,
+        sign: float,
+    ) -> None:
+        """Add the terms of a segment to the sums."""
+
+
+class Sum(_SampleTermsStatistic):
+    """Sum of the samples."""
+
+    __slots__ = ()
+
+    def _add_sample_terms(self, value: float, sign: float) -> None:
+        """Add the terms of a sample value to the sums."""
+        self._sums[0].add(sign * value)
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) > 0:
+            return self._rebuilt_sums(states, ages)[0].value
+        return None
+
+
+class Mean(Sum):
+    """Mean of the samples."""
+
+    __slots__ = ()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) > 0:
+            return self._rebuilt_sums(states, ages)[0].value / len(states)
+        return None
+
+
+class MeanCircular(_SampleTermsStatistic):
+    """Circular mean of the samples in degrees."""
+
+    __slots__ = ()
+
+    _num_sums = 2
+
+    def _add_sample_terms(self, value: float, sign: float) -> None:
+        """Add the terms of a sample value to the sums."""
+        radians = math.radians(value)
+        self._sums[0].add(sign * math.sin(radians))
+        self._sums[1].add(sign * math.cos(radians))
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) > 0:
+            sin_sum, cos_sum = self._rebuilt_sums(states, ages)
+            return (math.degrees(math.atan2(sin_sum.value, cos_sum.value)) + 360) % 360
+        return None
+
+
+class Variance(_SampleTermsStatistic):
+    """Sample variance of the samples.
+
+    The sums are of the samples shifted by the first sample after a reset,
+    which avoids the cancellation of large sums for samples far from zero.
+    """
+
+    __slots__ = ("_shift",)
+
+    _num_sums = 2
+
+    def _reset(self) -> None:
+        """Reset the sums."""
+        super()._reset()
+        self._shift: float | None = None
+
+    def _add_sample_terms(self, value: float, sign: float) -> None:
+        """Add the terms of a sample value to the sums."""
+        if self._shift is None:
+            self._shift = value
+        shifted = value - self._shift
+        self._sums[0].add(sign * shifted)
+        self._sums[1].add(sign * shifted * shifted)
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            shifted_sum, squared_sum = self._rebuilt_sums(states, ages)
+            count = len(states)
+            squares = squared_sum.value
+            deviations = squares - shifted_sum.value**2 / count
+            # A spread below the rounding error of the sums, like the one of
+            # equal samples, is not distinguishable from no spread at all
+            if deviations <= count * VARIANCE_RELATIVE_TOLERANCE * squares:
+                return 0.0
+            return deviations / (count - 1)
+        return None
+
+
+class StandardDeviation(Variance):
+    """Sample standard deviation of the samples."""
+
+    __slots__ = ()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if (variance := super().value(states, ages)) is None:
+            return None
+        return math.sqrt(variance)
+
+
+class Distance95Percent(StandardDeviation):
+    """Width of the interval containing 95% of normally distributed samples."""
+
+    __slots__ = ()
+
+    _z_score = 1.96
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if (standard_deviation := super().value(states, ages)) is None:
+            return None
+        return 2 * self._z_score * standard_deviation
+
+
+class Distance99Percent(Distance95Percent):
+    """Width of the interval containing 99% of normally distributed samples."""
+
+    __slots__ = ()
+
+    _z_score = 2.58
+
+
+class SumDifferences(_SegmentTermsStatistic):
+    """Sum of the absolute differences between consecutive samples."""
+
+    __slots__ = ()
+
+    def _add_segment_terms(
+        self,
+        previous_value: float,
+        value: float,
+        previous_age: float,
+        age: float,
+        sign: float,
+    ) -> None:
+        """Add the terms of a segment to the sums."""
+        self._sums[0].add(sign * abs(value - previous_value))
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._rebuilt_sums(states, ages)[0].value
+        return None
+
+
+class SumDifferencesNonnegative(SumDifferences):
+    """Sum of the differences between consecutive samples of a counter.
+
+    A decrease is considered a reset of the counter to zero.
+    """
+
+    __slots__ = ()
+
+    def _add_segment_terms(
+        self,
+        previous_value: float,
+        value: float,
+        previous_age: float,
+        age: float,
+        sign: float,
+    ) -> None:
+        """Add the terms of a segment to the sums."""
+        self._sums[0].add(
+            sign * (value - previous_value if value >= previous_value else value)
+        )
+
+
+class Noisiness(SumDifferences):
+    """Mean of the absolute differences between consecutive samples."""
+
+    __slots__ = ()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._rebuilt_sums(states, ages)[0].value / (len(states) - 1)
+        return None
+
+
+class AverageLinear(_SegmentTermsStatistic):
+    """Time weighted average of the samples with linear interpolation."""
+
+    __slots__ = ()
+
+    def _add_segment_terms(
+        self,
+        previous_value: float,
+        value: float,
+        previous_age: float,
+        age: float,
+        sign: float,
+    ) -> None:
+        """Add the terms of a segment to the sums."""
+        self._sums[0].add(sign * 0.5 * (value + previous_value) * (age - previous_age))
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if len(states) == 1:
+            return states[0]
+        if len(states) >= 2:
+            return self._rebuilt_sums(states, ages)[0].value / (ages[-1] - ages[0])
+        return None
+
+
+class AverageStep(AverageLinear):
+    """Time weighted average of the samples with step interpolation."""
+
+    __slots__ = ()
+
+    def _add_segment_terms(
+        self,
+        previous_value: float,
+        value: float,
+        previous_age: float,
+        age: float,
+        sign: float,
+    ) -> None:
+        """Add the terms of a segment to the sums."""
+        self._sums[0].add(sign * previous_value * (age - previous_age))
+
+
+class _MonotonicQueue:
+    """Extreme of a sliding window of samples.
+
+    The queue holds the samples which can still become the extreme when
+    the samples before them are removed, in the order they were appended.
+    Samples which are equal to the extreme are kept, so the first one is
+    the oldest sample with the extreme value.
+    """
+
+    __slots__ = ("_appended", "_maximum", "_queue", "_removed")
+
+    def __init__(self, maximum: bool) -> None:
+        """Initialize the queue."""
+        self._maximum = maximum
+        # The value, age and sequence number of the samples
+        self._queue: deque[tuple[float, float, int]] = deque()
+        self._appended = 0
+        self._removed = 0
+
+    def append(self, value: float, age: float) -> None:
+        """Append a sample."""
+        queue = self._queue
+        if self._maximum:
+            while queue and queue[-1][0] < value:
+                queue.pop()
+        else:
+            while queue and queue[-1][0] > value:
+                queue.pop()
+        queue.append((value, age, self._appended))
+        self._appended += 1
+
+    def remove_oldest(self) -> None:
+        """Remove the oldest sample."""
+        if self._queue and self._queue[0][2] == self._removed:
+            self._queue.popleft()
+        self._removed += 1
+
+    @property
+    def extreme(self) -> tuple[float, float] | None:
+        """Return the value and age of the extreme sample."""
+        if not self._queue:
+            return None
+        value, age, _ = self._queue[0]
+        return value, age
+
+
+class _ExtremeStatistic(SlidingWindowStatistic):
+    """Base class of statistics of the maximum or minimum sample."""
+
+    __slots__ = ("_queue",)
+
+    _maximum = True
+
+    def __init__(self, percentile: int) -> None:
+        """Initialize the statistic."""
+        self._queue = _MonotonicQueue(self._maximum)
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic after a sample was appended."""
+        self._queue.append(states[-1], ages[-1])
+
+    def remove_oldest(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic before the oldest sample is removed."""
+        self._queue.remove_oldest()
+
+
+class ValueMax(_ExtremeStatistic):
+    """Maximum of the samples."""
+
+    __slots__ = ()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if (extreme := self._queue.extreme) is None:
+            return None
+        return extreme[0]
+
+
+class ValueMin(ValueMax):
+    """Minimum of the samples."""
+
+    __slots__ = ()
+
+    _maximum = False
+
+
+class DatetimeValueMax(_ExtremeStatistic):
+    """Time of the oldest sample with the maximum value."""
+
+    __slots__ = ()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> datetime | None:
+        """Return the value of the statistic."""
+        if (extreme := self._queue.extreme) is None:
+            return None
+        return dt_util.utc_from_timestamp(extreme[1])
+
+
+class DatetimeValueMin(DatetimeValueMax):
+    """Time of the oldest sample with the minimum value."""
+
+    __slots__ = ()
+
+    _maximum = False
+
+
+class DistanceAbsolute(SlidingWindowStatistic):
+    """Difference between the maximum and the minimum of the samples."""
+
+    __slots__ = ("_max_queue", "_min_queue")
+
+    def __init__(self, percentile: int) -> None:
+        """Initialize the statistic."""
+        self._max_queue = _MonotonicQueue(True)
+        self._min_queue = _MonotonicQueue(False)
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic after a sample was appended."""
+        self._max_queue.append(states[-1], ages[-1])
+        self._min_queue.append(states[-1], ages[-1])
+
+    def remove_oldest(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic before the oldest sample is removed."""
+        self._max_queue.remove_oldest()
+        self._min_queue.remove_oldest()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic."""
+        if (maximum := self._max_queue.extreme) is None or (
+            minimum := self._min_queue.extreme
+        ) is None:
+            return None
+        return maximum[0] - minimum[0]
+
+
+class Percentile(SlidingWindowStatistic):
+    """Percentile of the samples.
+
+    The samples are kept sorted, an update bisects the sorted samples and
+    moves the references after the position of the sample, which is much
+    faster for windows of thousands of samples than a search tree written
+    in Python.
+    """
+
+    __slots__ = ("_percentile", "_sorted")
+
+    def __init__(self, percentile: int) -> None:
+        """Initialize the statistic."""
+        self._percentile = percentile
+        self._sorted: list[float] = []
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic after a sample was appended."""
+        insort(self._sorted, states[-1])
+
+    def remove_oldest(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Update the statistic before the oldest sample is removed."""
+        del self._sorted[bisect_left(self._sorted, states[0])]
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic.
+
+        Matches statistics.quantiles with the exclusive method.
+        """
+        data = self._sorted
+        if (count := len(data)) == 1:
+            return data[0]
+        if count >= 2:
+            n = 100
+            m = count + 1
+            j = min(max(self._percentile * m // n, 1), count - 1)
+            delta = self._percentile * m - j * n
+            return (data[j - 1] * (n - delta) + data[j] * delta) / n
+        return None
+
+
+class Median(Percentile):
+    """Median of the samples."""
+
+    __slots__ = ()
+
+    def value(self, states: deque[bool | float], ages: deque[float]) -> float | None:
+        """Return the value of the statistic.
+
+        Matches statistics.median.
+        """
+        data = self._sorted
+        if not (count := len(data)):
+            return None
+        if count % 2 == 1:
+            return data[count // 2]
+        i = count // 2
+        return (data[i - 1] + data[i]) / 2
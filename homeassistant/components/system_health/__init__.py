@@ -65,7 +65,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_system_health_platform
+        hass, DOMAIN, _register_system_health_platform, lazy=True
     )
 
     return True
@@ -101,10 +101,19 @@ async def get_integration_info(
     return result
 
 
+async def async_get_registrations(
+    hass: HomeAssistant,
+) -> dict[str, SystemHealthRegistration]:
+    """Return the system health registrations of the loaded integrations."""
+    await integration_platform.async_load_lazy_integration_platforms(hass, DOMAIN)
+    registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
+    return registrations
+
+
 async def _registered_domain_data(
     hass: HomeAssistant,
 ) -> AsyncGenerator[tuple[str, dict[str, Any]]]:
-    registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
+    registrations = await async_get_registrations(hass)
     for domain, domain_data in zip(
         registrations,
         await asyncio.gather(
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Hashable
 from functools import lru_cache, partial
 import json
 import logging
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import voluptuous as vol
 
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -38,6 +40,7 @@ from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
+    EntityFilter,
     convert_include_exclude_filter,
 )
 from homeassistant.helpers.event import (
@@ -64,6 +67,7 @@ from homeassistant.setup import (
     async_get_setup_timings,
     async_wait_component,
 )
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -71,6 +75,12 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+# The longest window in seconds in which subscribe_entities merges changes
+MAX_COALESCE_WINDOW = 60
+
+_ENTITY_SUBSCRIPTIONS: HassKey[dict[Hashable, _EntitySubscriptions]] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -372,31 +382,204 @@ def _send_handle_get_states_response(
     )
 
 
+class _CoalescedStateChanges:
+    """Merge the state changes of a subscription within a window.
+
+    The first old state and the latest new state of each entity which
+    changed during the window are sent as a single diff when the window
+    ends.
+
+    The coalescing of the connection can not be used for this. It joins
+    already serialized messages into one frame, so the changes of an
+    entity can not be merged anymore. It also only waits until the queue
+    stops growing within the current loop iteration, and only for clients
+    that support coalesce_messages. So the window has its own timer.
+    """
+
+    __slots__ = (
+        "_connection",
+        "_flush_handle",
+        "_msg_id",
+        "_pending",
+        "_window",
+    )
+
+    def __init__(
+        self, connection: ActiveConnection, msg_id: int, window: float
+    ) -> None:
+        """Initialize the coalesced state changes."""
+        self._connection = connection
+        self._msg_id = msg_id
+        self._window = window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to be sent when the window ends."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        if (pending := self._pending.get(entity_id)) is not None:
+            self._pending[entity_id] = (pending[0], new_state)
+        else:
+            self._pending[entity_id] = (event.data["old_state"], new_state)
+        if self._flush_handle is None:
+            self._flush_handle = self._connection.hass.loop.call_later(
+                self._window, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the merged state changes."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        if message := messages.coalesced_state_diff_message(
+            self._msg_id,
+            (
+                (entity_id, old_state, new_state)
+                for entity_id, (old_state, new_state) in pending.items()
+            ),
+        ):
+            self._connection.send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending state changes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+
+class _EntitySubscriptions:
+    """Forward state changes to the subscribe_entities subscriptions of a filter.
+
+    All subscriptions with the same entity_ids and filter share a single
+    state_changed listener. Each event is filtered and serialized once,
+    and the permissions are checked once per user instead of once per
+    connection.
+    """
+
+    __slots__ = ("_entity_filter", "_entity_ids", "_subscriptions", "unsub")
+
+    def __init__(
+        self,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Initialize the subscriptions."""
+        self._entity_ids = entity_ids
+        self._entity_filter = entity_filter
+        # user_id -> (id(connection), msg_id) ->
+        # (connection, msg_id as bytes, coalesced state changes)
+        self._subscriptions: dict[
+            str,
+            dict[
+                tuple[int, int],
+                tuple[ActiveConnection, bytes, _CoalescedStateChanges | None],
+            ],
+        ] = {}
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self, connection: ActiveConnection, msg_id: int, coalesce_window: float
+    ) -> None:
+        """Add a subscription."""
+        self._subscriptions.setdefault(connection.user.id, {})[
+            (id(connection), msg_id)
+        ] = (
+            connection,
+            str(msg_id).encode(),
+            _CoalescedStateChanges(connection, msg_id, coalesce_window)
+            if coalesce_window
+            else None,
+        )
+
+    @callback
+    def async_remove(self, connection: ActiveConnection, msg_id: int) -> bool:
+        """Remove a subscription and return True if none are left."""
+        user_id = connection.user.id
+        user_subscriptions = self._subscriptions[user_id]
+        _, _, coalesced = user_subscriptions.pop((id(connection), msg_id))
+        if coalesced is not None:
+            coalesced.async_cancel()
+        if not user_subscriptions:
+            del self._subscriptions[user_id]
+        return not self._subscriptions
+
+    @callback
+    def async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward entity state changed events to the websockets."""
+        entity_id = event.data["entity_id"]
+        if (self._entity_ids and entity_id not in self._entity_ids) or (
+            self._entity_filter and not self._entity_filter(entity_id)
+        ):
+            return
+        # Sending may cancel subscriptions if a connection is overloaded
+        for user_subscriptions in list(self._subscriptions.values()):
+            subscriptions = list(user_subscriptions.values())
+            # We have to lookup the permissions again because the user
+            # might have changed since the subscription was created.
+            user = subscriptions[0][0].user
+            permissions = user.permissions
+            if (
+                not user.is_admin
+                and not permissions.access_all_entities(POLICY_READ)
+                and not permissions.check_entity(entity_id, POLICY_READ)
+            ):
+                continue
+            for connection, message_id_as_bytes, coalesced in subscriptions:
+                if coalesced is not None:
+                    coalesced.async_add(event)
+                    continue
+                connection.send_message(
+                    messages.cached_state_diff_message(message_id_as_bytes, event)
+                )
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
+def _async_subscribe_entity_changes(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
     entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    entity_filter: EntityFilter,
+    coalesce_window: float,
+) -> CALLBACK_TYPE:
+    """Subscribe a connection to state changes of the filtered entities.
+
+    If coalesce_window is set, the changes within the window are merged.
+    """
+    key = (
+        frozenset(entity_ids) if entity_ids else None,
+        None
+        if entity_filter.empty_filter
+        else tuple(
+            (conf, frozenset(values))
+            for conf, values in sorted(entity_filter.config.items())
+        ),
+    )
+    all_subscriptions = hass.data.setdefault(_ENTITY_SUBSCRIPTIONS, {})
+    if (subscriptions := all_subscriptions.get(key)) is None:
+        subscriptions = all_subscriptions[key] = _EntitySubscriptions(
+            entity_ids,
+            None if entity_filter.empty_filter else entity_filter.get_filter(),
+        )
+        subscriptions.unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, subscriptions.async_forward
+        )
+    subscriptions.async_add(connection, msg_id, coalesce_window)
+
+    @callback
+    def _async_unsubscribe() -> None:
+        if subscriptions.async_remove(connection, msg_id):
+            if TYPE_CHECKING:
+                assert subscriptions.unsub is not None
+            subscriptions.unsub()
+            del all_subscriptions[key]
+
+    return _async_unsubscribe
 
 
 @callback
@@ -404,6 +587,9 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_window", default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_WINDOW)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -420,16 +606,8 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = _async_subscribe_entity_changes(
+        hass, connection, msg_id, entity_ids, _filter, msg["coalesce_window"]
     )
     connection.send_result(msg_id)
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -51,6 +51,7 @@ class ActiveConnection:
         "subscriptions",
         "supported_features",
         "user",
+        "wait_for_drain",
     )
 
     def __init__(
@@ -75,6 +76,8 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Set by the websocket handler once the writer is started
+        self.wait_for_drain: Callable[[], Awaitable[None]] | None = None
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -134,6 +137,15 @@ class ActiveConnection:
         """Send a result message."""
         self.send_message(message_to_json_bytes(result_message(msg_id, result)))
 
+    async def async_wait_for_drain(self) -> None:
+        """Wait until the messages queued for the client have been sent.
+
+        Used to apply back pressure when sending a large number of messages,
+        returns immediately when the connection is closed.
+        """
+        if (wait_for_drain := self.wait_for_drain) is not None:
+            await wait_for_drain()
+
     @callback
     def send_event(self, msg_id: int, event: Any | None = None) -> None:
         """Send a event message."""
@@ -253,6 +265,7 @@ class ActiveConnection:
                 )
         self.subscriptions.clear()
         self.send_message = self._connect_closed_error
+        self.wait_for_drain = None
         current_request.set(None)
         current_connection.set(None)
 
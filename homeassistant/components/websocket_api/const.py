@@ -34,6 +34,11 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# When the client negotiated permessage-deflate, messages smaller than
+# this are sent uncompressed since compressing them costs more CPU time
+# than it saves on the wire.
+COMPRESSION_MIN_SIZE: Final = 1024
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -23,6 +23,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESSION_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -74,6 +75,7 @@ class WebSocketHandler:
         "_closing",
         "_connection",
         "_debug",
+        "_drain_future",
         "_handle_task",
         "_hass",
         "_logger",
@@ -108,6 +110,7 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drain_future: asyncio.Future[None] | None = None
         self._async_logging_changed()
 
     @callback
@@ -166,6 +169,8 @@ class WebSocketHandler:
                     if self._debug:
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
+                    if not message_queue and self._drain_future:
+                        self._release_drain_future()
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
@@ -173,6 +178,8 @@ class WebSocketHandler:
                 if self._debug:
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
+                if not message_queue and self._drain_future:
+                    self._release_drain_future()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -182,6 +189,23 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_future()
+
+    async def _async_wait_for_drain(self) -> None:
+        """Wait until the message queue is empty or the connection closed."""
+        if self._closing or not self._message_queue:
+            return
+        if (drain_future := self._drain_future) is None:
+            drain_future = self._drain_future = self._loop.create_future()
+        await drain_future
+
+    @callback
+    def _release_drain_future(self) -> None:
+        """Release the tasks waiting for the message queue to drain."""
+        if (drain_future := self._drain_future) is not None:
+            self._drain_future = None
+            if not drain_future.done():
+                drain_future.set_result(None)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -294,6 +318,7 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._release_drain_future()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -339,7 +364,7 @@ class WebSocketHandler:
         if TYPE_CHECKING:
             assert writer is not None
 
-        send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_text = self._async_text_frame_sender(writer)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -374,6 +399,7 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            self._release_drain_future()
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
@@ -420,6 +446,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.wait_for_drain = self._async_wait_for_drain
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -427,6 +454,34 @@ class WebSocketHandler:
         self._authenticated = True
         return connection
 
+    @callback
+    def _async_text_frame_sender(
+        self, writer: WebSocketWriter
+    ) -> Callable[[bytes], Coroutine[Any, Any, None]]:
+        """Return a function to send text frames to the client.
+
+        aiohttp compresses every frame once permessage-deflate has been
+        negotiated. Most messages are small events and results where the
+        compression costs more than it saves, so we only compress messages
+        of at least COMPRESSION_MIN_SIZE bytes like the initial states.
+        """
+        if not (wbits := int(self._wsock.compress)):
+            return partial(writer.send_frame, opcode=WSMsgType.TEXT)
+
+        # The compression of the negotiated extension is turned off and
+        # large messages are compressed with the per frame compress argument
+        writer.compress = 0
+        send_frame = writer.send_frame
+
+        async def _send_bytes_text(message: bytes) -> None:
+            """Send a text frame and compress it if it is large enough."""
+            if len(message) < COMPRESSION_MIN_SIZE:
+                await send_frame(message, WSMsgType.TEXT)
+            else:
+                await send_frame(message, WSMsgType.TEXT, wbits)
+
+        return _send_bytes_text
+
     @callback
     def _async_increase_writer_limit(self, writer: WebSocketWriter) -> None:
         #
@@ -16,7 +16,7 @@ from pathlib import Path
 import re
 import shutil
 from types import ModuleType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
@@ -28,13 +28,17 @@ from .core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant, callback
 from .core_config import _PACKAGE_DEFINITION_SCHEMA, _PACKAGES_CONFIG_SCHEMA
 from .exceptions import ConfigValidationError, HomeAssistantError
 from .helpers import config_validation as cv
+from .helpers.singleton import singleton
+from .helpers.storage import Store
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.async_ import create_eager_task
+from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml.loader import YAMLCache, YAMLCacheEntry
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,6 +58,11 @@ INTEGRATION_LOAD_EXCEPTIONS = (IntegrationNotFound, RequirementsNotFound)
 
 SAFE_MODE_FILENAME = "safe-mode"
 
+YAML_CACHE_STORAGE_KEY = "core.yaml_cache"
+YAML_CACHE_STORAGE_VERSION = 1
+YAML_CACHE_SAVE_DELAY = 10
+DATA_YAML_CACHE: HassKey[YAMLConfigCache] = HassKey("yaml_cache")
+
 DEFAULT_CONFIG = f"""
 # Loads default set of integrations. Do not remove.
 default_config:
@@ -213,6 +222,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    yaml_cache = await _async_get_yaml_cache(hass)
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -221,6 +231,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            yaml_cache.cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -232,6 +243,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         if base_exc.problem_mark and base_exc.problem_mark.name:
             base_exc.problem_mark.name = _relpath(hass, base_exc.problem_mark.name)
         raise
+    yaml_cache.async_schedule_save()
 
     invalid_domains = []
     for key in config:
@@ -263,8 +275,65 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     return config
 
 
+class _YAMLCacheData(TypedDict):
+    """Stored data of the YAML cache."""
+
+    version: str
+    entries: dict[str, YAMLCacheEntry]
+
+
+class YAMLConfigCache:
+    """Persist the parsed configuration YAML across restarts and reloads.
+
+    The cache is discarded when Home Assistant is updated as the format of
+    the parsed files may change. Secrets are not stored in the cache.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the YAML cache."""
+        self.cache = YAMLCache()
+        self._store = Store[_YAMLCacheData](
+            hass, YAML_CACHE_STORAGE_VERSION, YAML_CACHE_STORAGE_KEY, private=True
+        )
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        if (data := await self._store.async_load()) is not None and data[
+            "version"
+        ] == __version__:
+            self.cache = YAMLCache(data["entries"])
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the cache if it changed."""
+        if self.cache.changed:
+            self.cache.changed = False
+            self._store.async_delay_save(self._data_to_save, YAML_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> _YAMLCacheData:
+        """Return the data to store."""
+        _LOGGER.debug(
+            "Saving parsed YAML, %s hits and %s misses",
+            self.cache.hits,
+            self.cache.misses,
+        )
+        # The entries may be updated by a reload in the executor while saving
+        return {"version": __version__, "entries": dict(self.cache.entries)}
+
+
+@singleton(DATA_YAML_CACHE, async_=True)
+async def _async_get_yaml_cache(hass: HomeAssistant) -> YAMLConfigCache:
+    """Return the YAML cache of the configuration."""
+    yaml_cache = YAMLConfigCache(hass)
+    await yaml_cache.async_load()
+    return yaml_cache
+
+
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    yaml_cache: YAMLCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -273,7 +342,7 @@ def load_yaml_config_file(
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        conf_dict = load_yaml_dict(config_path, secrets, yaml_cache)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
@@ -6,13 +6,16 @@ of entities and react to changes.
 
 from __future__ import annotations
 
+from array import array
 import asyncio
 from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
+    Iterator,
     KeysView,
     Mapping,
     ValuesView,
@@ -25,6 +28,7 @@ import functools
 import inspect
 import logging
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -1423,6 +1427,10 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+# Indexed listeners for a single event type:
+# index key (event data key) -> index value -> listeners
+_IndexedListenersType = dict[str, dict[Hashable, list[_FilterableJobType[Any]]]]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1462,13 +1470,20 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_indexed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._indexed_listeners: dict[EventType[Any] | str, _IndexedListenersType] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1486,7 +1501,17 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._indexed_listeners.items():
+            # A listener is stored once per indexed value, only count it once
+            unique_jobs = {
+                id(filterable_job)
+                for buckets in indexes.values()
+                for bucket in buckets.values()
+                for filterable_job in bucket
+            }
+            counts[event_type] = counts.get(event_type, 0) + len(unique_jobs)
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1552,6 +1577,10 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            indexes := self._indexed_listeners.get(event_type)
+        ):
+            listeners = listeners + _async_match_indexed_listeners(indexes, event_data)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1656,6 +1685,55 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_indexed(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        index_key: str,
+        index_values: Iterable[Hashable],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type matching indexed event data.
+
+        The listener is only called for events where the value of the
+        ``index_key`` key of the event data is one of ``index_values``, for
+        example listening to ``state_changed`` with ``index_key`` set to
+        ``entity_id``. Matching listeners are looked up in a hash index when
+        the event is fired, so the cost of firing an event only depends on
+        the number of matching listeners and not on the number of indexed
+        listeners for the event type.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, is called for matching events
+        and determines if the listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                f"Indexed listeners are not supported for event {event_type}"
+            )
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {index_key}"),
+            event_filter,
+        )
+        values = set(index_values)
+        buckets = self._indexed_listeners.setdefault(event_type, {}).setdefault(
+            index_key, {}
+        )
+        for value in values:
+            buckets.setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_indexed_listener,
+            event_type,
+            index_key,
+            values,
+            filterable_job,
+        )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1744,6 +1822,55 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        index_key: str,
+        index_values: set[Hashable],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove an indexed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            indexes = self._indexed_listeners[event_type]
+            buckets = indexes[index_key]
+            for value in index_values:
+                bucket = buckets[value]
+                bucket.remove(filterable_job)
+                if not bucket:
+                    del buckets[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown indexed job listener %s", filterable_job
+            )
+            return
+
+        if not buckets:
+            del indexes[index_key]
+            if not indexes:
+                del self._indexed_listeners[event_type]
+
+
+def _async_match_indexed_listeners(
+    indexes: _IndexedListenersType, event_data: Mapping[str, Any]
+) -> list[_FilterableJobType[Any]]:
+    """Return the indexed listeners matching the event data."""
+    matched: list[_FilterableJobType[Any]] = []
+    for index_key, buckets in indexes.items():
+        if (value := event_data.get(index_key)) is None:
+            continue
+        try:
+            bucket = buckets.get(value)
+        except TypeError:
+            # Unhashable values can't match any indexed listener
+            continue
+        if bucket:
+            matched.extend(bucket)
+    return matched
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -2025,17 +2152,45 @@ class State:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class StatesSnapshot:
+    """Columnar snapshot of the state machine.
+
+    The columns are parallel, the state of entity_ids[i] is states[i] and
+    it was last updated at last_updated_timestamps[i].
+    """
+
+    entity_ids: list[str]
+    states: list[str]
+    last_updated_timestamps: array[float]
+
+    def __len__(self) -> int:
+        """Return the number of states in the snapshot."""
+        return len(self.entity_ids)
+
+    def __iter__(self) -> Iterator[tuple[str, str, float]]:
+        """Iterate over (entity_id, state, last_updated_timestamp) rows."""
+        return zip(
+            self.entity_ids, self.states, self.last_updated_timestamps, strict=True
+        )
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
-    Maintains an additional index:
+    Maintains additional indexes:
     - domain -> dict[str, State]
+    - columns of entity_id, state and last_updated_timestamp
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
-        super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._column_index: dict[str, int] = {}
+        self._entity_id_column: list[str] = []
+        self._state_column: list[str] = []
+        self._last_updated_column: array[float] = array("d")
+        super().__init__()
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2045,12 +2200,40 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        # State values are mostly a small set of repeating strings
+        state = sys.intern(entry.state)
+        if (idx := self._column_index.get(key)) is None:
+            self._column_index[key] = len(self._entity_id_column)
+            self._entity_id_column.append(key)
+            self._state_column.append(state)
+            self._last_updated_column.append(entry.last_updated_timestamp)
+        else:
+            self._state_column[idx] = state
+            self._last_updated_column[idx] = entry.last_updated_timestamp
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
+        # Move the last row into the removed row to keep the columns dense
+        idx = self._column_index.pop(key)
+        last_entity_id = self._entity_id_column.pop()
+        last_state = self._state_column.pop()
+        last_updated = self._last_updated_column.pop()
+        if last_entity_id != key:
+            self._column_index[last_entity_id] = idx
+            self._entity_id_column[idx] = last_entity_id
+            self._state_column[idx] = last_state
+            self._last_updated_column[idx] = last_updated
+
+    def snapshot(self) -> StatesSnapshot:
+        """Return a columnar snapshot of all states."""
+        return StatesSnapshot(
+            self._entity_id_column.copy(),
+            self._state_column.copy(),
+            array("d", self._last_updated_column),
+        )
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
@@ -2070,7 +2253,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_bus",
+        "_loop",
+        "_reservations",
+        "_restored",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2079,6 +2269,8 @@ class StateMachine:
         # up read operations
         self._states_data = self._states.data
         self._reservations: set[str] = set()
+        # Entities with a restored state which was not replaced yet
+        self._restored: set[str] = set()
         self._bus = bus
         self._loop = loop
 
@@ -2151,6 +2343,18 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_snapshot(self) -> StatesSnapshot:
+        """Return a columnar snapshot of all states.
+
+        The snapshot only contains the entity_id, state and last updated
+        timestamp of each entity, which is much cheaper to create and scan
+        than a list of State objects for consumers that only need those.
+
+        This method must be run in the event loop.
+        """
+        return self._states.snapshot()
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2188,6 +2392,7 @@ class StateMachine:
         entity_id = entity_id.lower()
         old_state = self._states.pop(entity_id, None)
         self._reservations.discard(entity_id)
+        self._restored.discard(entity_id)
 
         if old_state is None:
             return False
@@ -2248,6 +2453,26 @@ class StateMachine:
 
         self._reservations.add(entity_id)
 
+    @callback
+    def async_restore(self, states: Iterable[State]) -> None:
+        """Restore states that were saved before the last shutdown.
+
+        States of entities that are already in the state machine or
+        reserved are not restored. No state_changed events are fired
+        as this is only used at startup before integrations are set up.
+
+        The first state set for a restored entity replaces the restored
+        state as if the entity was added: the state_changed event has no
+        old_state and last_changed is not carried over. So state triggers
+        and last_changed behave the same as without restoring.
+
+        This method must be run in the event loop.
+        """
+        for state in states:
+            if self.async_available(state.entity_id):
+                self._states[state.entity_id] = state
+                self._restored.add(state.entity_id)
+
     @callback
     def async_available(self, entity_id: str) -> bool:
         """Check to see if an entity_id is available to be used."""
@@ -2319,9 +2544,18 @@ class StateMachine:
             same_attr = False
             last_changed = None
         else:
-            same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
+            if self._restored and entity_id in self._restored:
+                # The restored state is replaced as if the entity was added
+                self._restored.discard(entity_id)
+                old_state.expire()
+                old_state = None
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                same_attr = old_state.attributes == attributes
+                last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
         # than converting a utc datetime object to a timestamp since cpython
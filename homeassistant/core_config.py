@@ -607,6 +607,9 @@ class Config:
         # If Home Assistant is running in safe mode
         self.safe_mode: bool = False
 
+        # If the state machine is loaded from the states saved at the last shutdown
+        self.warm_start: bool = False
+
         self.webrtc = RTCConfiguration()
 
     def async_initialize(self) -> None:
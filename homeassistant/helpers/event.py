@@ -171,6 +171,28 @@ class TrackTemplateResult:
     result: Any
 
 
+@dataclass(slots=True)
+class TrackTemplateMemoStats:
+    """Class for the render memoization statistics of a tracked template.
+
+    hits
+        The number of state changes that did not re-render the template
+        because the states it read did not change.
+    misses
+        The number of state changes that re-rendered the template.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of state changes that skipped the render."""
+        if total := self.hits + self.misses:
+            return self.hits / total
+        return 0.0
+
+
 def threaded_listener_factory[**_P](
     async_factory: Callable[Concatenate[HomeAssistant, _P], Any],
 ) -> Callable[Concatenate[HomeAssistant, _P], CALLBACK_TYPE]:
@@ -1009,6 +1031,10 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # Keyed by the id of the TrackTemplate as the same template
+        # can be tracked more than once
+        self._fingerprints: dict[int, tuple[Any, ...] | None] = {}
+        self._memo_stats: dict[Template, TrackTemplateMemoStats] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -1032,6 +1058,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._fingerprints[id(super_template)] = info.state_fingerprint(self.hass)
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -1053,6 +1080,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._fingerprints[id(track_template_)] = info.state_fingerprint(self.hass)
 
             if info.exception:
                 if not log_fn:
@@ -1087,6 +1115,11 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def memo_stats(self) -> dict[Template, TrackTemplateMemoStats]:
+        """Render memoization statistics of the templates that can be memoized."""
+        return self._memo_stats
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1168,6 +1201,17 @@ class TrackTemplateResultInfo:
             ):
                 return not had_timer
 
+            # The render is skipped when it only depends on the states
+            # it read and they did not change since the last render
+            if (fingerprint := self._fingerprints.get(id(track_template_))) is not None:
+                memo_stats = self._memo_stats.get(template)
+                if memo_stats is None:
+                    memo_stats = self._memo_stats[template] = TrackTemplateMemoStats()
+                if fingerprint == info.state_fingerprint(self.hass):
+                    memo_stats.hits += 1
+                    return False
+                memo_stats.misses += 1
+
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
                 template.template,
@@ -1178,6 +1222,7 @@ class TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._fingerprints[id(track_template_)] = info.state_fingerprint(self.hass)
 
         try:
             result: str | TemplateError = info.result()
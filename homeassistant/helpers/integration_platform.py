@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
@@ -36,6 +36,8 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    lazy: bool = False
+    lazy_tasks: set[asyncio.Task[None]] = field(default_factory=set)
 
 
 @callback
@@ -52,7 +54,10 @@ def _async_integration_platform_component_loaded(
     # First filter out platforms that the integration already processed.
     integration_platforms_by_name: dict[str, IntegrationPlatform] = {}
     for integration_platform in integration_platforms:
-        if component_name in integration_platform.seen_components:
+        if (
+            integration_platform.lazy
+            or component_name in integration_platform.seen_components
+        ):
             continue
         integration_platform.seen_components.add(component_name)
         integration_platforms_by_name[integration_platform.platform_name] = (
@@ -160,8 +165,14 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    If lazy is set, the platforms are not imported when the integrations
+    are loaded but the first time async_load_lazy_integration_platforms
+    is called after they are loaded.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,11 +186,6 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    # Tell the loader that it should try to pre-load the integration
-    # for any future components that are loaded so we can reduce the
-    # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
-    top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
             process_platform,
@@ -187,6 +193,17 @@ async def async_process_integration_platforms(
         ),
         f"process_platform {platform_name}",
     )
+    if lazy:
+        integration_platforms.append(
+            IntegrationPlatform(platform_name, process_job, set(), lazy=True)
+        )
+        return
+
+    # Tell the loader that it should try to pre-load the integration
+    # for any future components that are loaded so we can reduce the
+    # amount of import executor usage.
+    async_register_preload_platform(hass, platform_name)
+    top_level_components = hass.config.top_level_components.copy()
     integration_platform = IntegrationPlatform(
         platform_name, process_job, top_level_components
     )
@@ -217,6 +234,38 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_load_lazy_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Process a lazy platform for the integrations loaded since the last call.
+
+    Returns when the platforms of all loaded integrations have been processed.
+    """
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if (
+            not integration_platform.lazy
+            or integration_platform.platform_name != platform_name
+        ):
+            continue
+        lazy_tasks = integration_platform.lazy_tasks
+        if components := (
+            hass.config.top_level_components - integration_platform.seen_components
+        ):
+            integration_platform.seen_components.update(components)
+            task = hass.async_create_task_internal(
+                _async_process_integration_platforms(
+                    hass, platform_name, components, integration_platform.process_job
+                ),
+                eager_start=True,
+            )
+            if not task.done():
+                lazy_tasks.add(task)
+                task.add_done_callback(lazy_tasks.discard)
+        if lazy_tasks:
+            # Also wait for the platforms another caller started to process
+            await asyncio.wait(lazy_tasks.copy())
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
     platform_name: str,
@@ -17,7 +17,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -34,6 +34,12 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How often the last seen time of an unchanged state is refreshed in storage
+LAST_SEEN_REFRESH_INTERVAL = timedelta(days=1)
+
+type _DumpedState = tuple[StoredState, dict[str, Any] | None, json_fragment]
+type _StateToDump = tuple[StoredState, dict[str, Any] | None, json_fragment | None]
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -119,10 +125,11 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped_states: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -199,13 +206,39 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the stored states which changed since the last dump are
+        encoded, in the executor, so the journal of the store only has to
+        append the changes. The last seen time of an unchanged state is
+        refreshed every LAST_SEEN_REFRESH_INTERVAL.
+        """
         _LOGGER.debug("Dumping states")
+        dumped_states = self._dumped_states
+        to_dump: list[_StateToDump] = []
+        for stored_state in self.async_get_stored_states():
+            extra_data = (
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None
+            )
+            if (
+                (dumped := dumped_states.get(stored_state.state.entity_id))
+                and dumped[0].state is stored_state.state
+                and dumped[1] == extra_data
+                and stored_state.last_seen - dumped[0].last_seen
+                < LAST_SEEN_REFRESH_INTERVAL
+            ):
+                to_dump.append(dumped)
+            else:
+                to_dump.append((stored_state, extra_data, None))
+
+        self._dumped_states = await self.hass.async_add_executor_job(
+            _encode_stored_states, to_dump
+        )
         try:
             await self.store.async_save(
                 [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
+                    cast(dict[str, Any], encoded)
+                    for _, _, encoded in self._dumped_states.values()
                 ]
             )
         except HomeAssistantError as exc:
@@ -268,6 +301,33 @@ class RestoreStateData:
         del self.entities[entity_id]
 
 
+def _encode_stored_states(
+    to_dump: list[_StateToDump],
+) -> dict[str, _DumpedState]:
+    """Encode the stored states which have not been encoded yet."""
+    dumped_states: dict[str, _DumpedState] = {}
+    for stored_state, extra_data, encoded in to_dump:
+        entity_id = stored_state.state.entity_id
+        if encoded is None:
+            try:
+                encoded = json_fragment(
+                    json_bytes(
+                        {
+                            "state": stored_state.state.json_fragment,
+                            "extra_data": extra_data,
+                            "last_seen": stored_state.last_seen,
+                        }
+                    )
+                )
+            except TypeError as err:
+                _LOGGER.error(
+                    "Error encoding the stored state of %s: %s", entity_id, err
+                )
+                continue
+        dumped_states[entity_id] = (stored_state, extra_data, encoded)
+    return dumped_states
+
+
 class RestoreEntity(Entity):
     """Mixin class for restoring previous entity state."""
 
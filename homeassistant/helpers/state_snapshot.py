@@ -0,0 +1,129 @@
+"""Warm start the state machine from the states saved at the last shutdown."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, cast
+
+from homeassistant.const import (
+    ATTR_RESTORED,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from . import entity_registry as er
+from .json import json_fragment
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.state_snapshot"
+STORAGE_VERSION = 1
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Load the state snapshot into the state machine if warm start is enabled.
+
+    Only the states of entities in the entity registry are restored,
+    the states of other entities are not known to come back with the
+    same entity_id. The restored states are marked as restored and are
+    replaced by the entities as they are added. The restored states
+    that were not replaced when Home Assistant has started are replaced
+    with unavailable states.
+    """
+    if not hass.config.warm_start:
+        return
+
+    store = Store[dict[str, dict[str, Any]]](
+        hass, STORAGE_VERSION, STORAGE_KEY, private=True
+    )
+    try:
+        stored_states = await store.async_load() or {}
+    except HomeAssistantError as exc:
+        _LOGGER.error("Error loading the state snapshot", exc_info=exc)
+        stored_states = {}
+
+    entity_registry = er.async_get(hass)
+    restored_states: dict[str, State] = {}
+    for entity_id, compressed_state in stored_states.items():
+        if (entry := entity_registry.async_get(entity_id)) is None or entry.disabled:
+            continue
+        try:
+            restored_states[entity_id] = _state_from_compressed_state(
+                entity_id, compressed_state
+            )
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("Skipping invalid snapshot state for %s", entity_id)
+
+    hass.states.async_restore(restored_states.values())
+    _LOGGER.debug("Restored %s states from the state snapshot", len(restored_states))
+
+    @callback
+    def _async_replace_stale_states(_: Event) -> None:
+        """Replace the restored states of entities that were not added."""
+        for entity_id, state in restored_states.items():
+            if hass.states.get(entity_id) is not state:
+                continue
+            if entry := entity_registry.async_get(entity_id):
+                entry.write_unavailable_state(hass)
+            else:
+                hass.states.async_remove(entity_id)
+        restored_states.clear()
+
+    async def _async_save_snapshot(_: Event) -> None:
+        """Save the states of the entities when Home Assistant stops."""
+        # The states are captured before the integrations are stopped
+        # as many of them set their entities to unavailable when stopping.
+        data = json_fragment(
+            b"{"
+            + b",".join(
+                state.as_compressed_state_json
+                for state in hass.states.async_all()
+                if ATTR_RESTORED not in state.attributes
+            )
+            + b"}"
+        )
+        try:
+            await store.async_save(cast(dict[str, dict[str, Any]], data))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving the state snapshot", exc_info=exc)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_replace_stale_states)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_snapshot)
+
+
+def _state_from_compressed_state(
+    entity_id: str, compressed_state: dict[str, Any]
+) -> State:
+    """Create a restored state from a compressed state."""
+    last_changed = dt_util.utc_from_timestamp(
+        compressed_state[COMPRESSED_STATE_LAST_CHANGED]
+    )
+    last_updated = (
+        dt_util.utc_from_timestamp(last_updated_timestamp)
+        if (
+            last_updated_timestamp := compressed_state.get(
+                COMPRESSED_STATE_LAST_UPDATED
+            )
+        )
+        is not None
+        else last_changed
+    )
+    context = compressed_state[COMPRESSED_STATE_CONTEXT]
+    return State(
+        entity_id,
+        compressed_state[COMPRESSED_STATE_STATE],
+        {**compressed_state[COMPRESSED_STATE_ATTRIBUTES], ATTR_RESTORED: True},
+        last_changed=last_changed,
+        last_reported=last_updated,
+        last_updated=last_updated,
+        context=Context(id=context) if isinstance(context, str) else Context(**context),
+    )
@@ -31,8 +31,9 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, json as json_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +49,8 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -241,8 +244,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, changes are appended to a journal next to the
+        file and compacted into the file when the journal grows larger
+        than the file or at the final write. The data of a journaled store
+        is always encoded with the default JSON encoder.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +268,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _StoreJournal() if journal else None
 
     @cached_property
     def path(self):
@@ -387,6 +398,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self._journal is not None and "journal" in data:
+            await self.hass.async_add_executor_job(
+                self._journal.replay, self.path, data
+            )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -517,6 +533,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal is not None:
+            self._journal.compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -551,7 +569,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal is not None and self._journal.append(path, data):
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        if self._journal is not None:
+            self._journal.prepare_snapshot(data)
+
         json_helper.save_json(
             path,
             data,
@@ -560,6 +584,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal is not None:
+            self._journal.start(path, data, self._private)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +599,189 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal is not None:
+            self._journal.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
+
+
+class _StoreJournal:
+    """Journal of the changes to the data of a store since its last snapshot.
+
+    The first line of the journal holds the generation of the snapshot it
+    applies to. Every other line is a JSON object which sets item "i" of
+    the list "c" in the data to "v", truncates it to "n" items, or sets
+    "c" to "v". "c" is a key of the data, or null if the data is a list.
+
+    Changes are found by comparing the hashes of the encoded values and
+    list items with the ones that were last written.
+    """
+
+    __slots__ = ("_hashes", "_pending", "_size", "_snapshot_size", "compact")
+
+    def __init__(self) -> None:
+        """Initialize the journal."""
+        self.compact = False
+        self._hashes: dict[str | None, int | list[int]] | None = None
+        self._pending: dict[str | None, bytes | list[bytes]] | None = None
+        self._size = 0
+        self._snapshot_size = 0
+
+    def reset(self) -> None:
+        """Write a snapshot the next time."""
+        self._hashes = None
+
+    def replay(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the journal of the snapshot to the data."""
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return
+        try:
+            header = json_util.json_loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+        if header != {"journal": data["journal"]}:
+            # The journal was not started after the snapshot was written
+            return
+        for line in lines[1:]:
+            try:
+                change: dict[str, Any] = json_util.json_loads(line)  # type: ignore[assignment]
+                _apply_journal_change(data, change)
+            except (ValueError, LookupError, TypeError) as err:
+                # The last change was only partially written
+                _LOGGER.warning("Ignoring the rest of journal %s: %s", path, err)
+                return
+        _LOGGER.debug(
+            "Replayed %s changes from the journal of %s", len(lines) - 1, path
+        )
+
+    def append(self, path: str, data: dict[str, Any]) -> bool:
+        """Append the changes to the journal.
+
+        Returns False if a snapshot has to be written instead.
+        """
+        try:
+            encoded = _encode_journal_values(data["data"])
+        except TypeError:
+            # Let save_json report the unserializable data
+            self._pending = None
+            return False
+        self._pending = encoded
+        if self.compact or (hashes := self._hashes) is None:
+            return False
+        if hashes.keys() - encoded.keys():
+            return False
+
+        changes: list[bytes] = []
+        for key, value in encoded.items():
+            old_hashes = hashes.get(key)
+            if type(value) is not list or type(old_hashes) is not list:
+                if old_hashes != _hash_journal_value(value):
+                    changes.append(
+                        json_helper.json_bytes(
+                            {"c": key, "v": json_helper.json_fragment(_join(value))}
+                        )
+                    )
+                continue
+            for idx, item in enumerate(value):
+                if idx >= len(old_hashes) or old_hashes[idx] != hash(item):
+                    changes.append(
+                        json_helper.json_bytes(
+                            {"c": key, "i": idx, "v": json_helper.json_fragment(item)}
+                        )
+                    )
+            if len(value) < len(old_hashes):
+                changes.append(json_helper.json_bytes({"c": key, "n": len(value)}))
+
+        if not changes:
+            return True
+        journal_data = b"".join(change + b"\n" for change in changes)
+        if self._size + len(journal_data) > self._snapshot_size:
+            return False
+
+        _LOGGER.debug("Appending %s changes to the journal of %s", len(changes), path)
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "ab") as journal:
+                journal.write(journal_data)
+        except OSError as err:
+            _LOGGER.exception("Appending to the journal of %s failed", path)
+            raise WriteError(err) from err
+        self._size += len(journal_data)
+        self._hashes = _hash_journal_values(encoded)
+        return True
+
+    def prepare_snapshot(self, data: dict[str, Any]) -> None:
+        """Prepare writing a snapshot of the data."""
+        self.compact = False
+        self._hashes = None
+        data["journal"] = ulid_now()
+
+    def start(self, path: str, data: dict[str, Any], private: bool) -> None:
+        """Start a new journal after the snapshot has been written."""
+        header = json_helper.json_bytes({"journal": data["journal"]}) + b"\n"
+        write_utf8_file(f"{path}{JOURNAL_SUFFIX}", header, private, mode="wb")
+        self._size = len(header)
+        self._snapshot_size = os.path.getsize(path)
+        if (encoded := self._pending) is not None:
+            self._hashes = _hash_journal_values(encoded)
+        self._pending = None
+
+
+def _encode_journal_values(data: Any) -> dict[str | None, bytes | list[bytes]]:
+    """Encode the values and list items of the data."""
+    json_bytes = json_helper.json_bytes
+    if type(data) is list:
+        return {None: [json_bytes(item) for item in data]}
+    return {
+        key: [json_bytes(item) for item in value]
+        if type(value) is list
+        else json_bytes(value)
+        for key, value in data.items()
+    }
+
+
+def _hash_journal_values(
+    encoded: dict[str | None, bytes | list[bytes]],
+) -> dict[str | None, int | list[int]]:
+    """Hash the encoded values and list items."""
+    return {
+        key: [hash(item) for item in value]
+        if type(value) is list
+        else _hash_journal_value(value)
+        for key, value in encoded.items()
+    }
+
+
+def _hash_journal_value(value: bytes | list[bytes]) -> int:
+    """Hash an encoded value."""
+    return hash(_join(value))
+
+
+def _join(value: bytes | list[bytes]) -> bytes:
+    """Return the encoded value of a list of encoded items."""
+    if type(value) is list:
+        return b"".join((b"[", b",".join(value), b"]"))
+    return value  # type: ignore[return-value]
+
+
+def _apply_journal_change(data: dict[str, Any], change: dict[str, Any]) -> None:
+    """Apply a change from the journal to the data."""
+    key = change["c"]
+    if "i" not in change and "n" not in change:
+        if key is None:
+            data["data"] = change["v"]
+        else:
+            data["data"][key] = change["v"]
+        return
+    items: list[Any] = data["data"] if key is None else data["data"][key]
+    if "n" in change:
+        del items[change["n"] :]
+    elif (idx := change["i"]) == len(items):
+        items.append(change["v"])
+    else:
+        items[idx] = change["v"]
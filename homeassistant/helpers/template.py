@@ -13,8 +13,10 @@ from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
 import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -31,6 +33,7 @@ from typing import (
     Literal,
     NoReturn,
     Self,
+    TypedDict,
     cast,
     overload,
 )
@@ -50,6 +53,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -59,6 +63,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -95,6 +100,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -105,6 +111,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
+# Passed as value_json when the value is known not to be valid JSON
+VALUE_NOT_JSON = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _ENVIRONMENT: HassKey[TemplateEnvironment] = HassKey("template.environment")
@@ -115,6 +123,14 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+# Compiled templates which were not used for this many
+# runs are evicted from the bytecode cache
+BYTECODE_CACHE_MAX_UNUSED_RUNS = 3
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -137,6 +153,15 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# State properties that only depend on the state value of an entity, the
+# value of the state attributes they depend on when they do
+_STATE_VALUE_READS: dict[str, frozenset[str]] = {
+    "state": frozenset(),
+    "domain": frozenset(),
+    "object_id": frozenset(),
+    "name": frozenset((ATTR_FRIENDLY_NAME,)),
+}
+
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
 
@@ -393,10 +418,12 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_reads",
         "exception",
         "filter",
         "filter_lifecycle",
         "has_time",
+        "has_untracked_input",
         "is_static",
         "rate_limit",
         "template",
@@ -416,8 +443,14 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The state attributes read for each entity, None when more than
+        # the state value and specific attributes were read
+        self.entity_reads: dict[str, set[str] | None] = {}
         self.rate_limit: float | None = None
         self.has_time = False
+        # Set when the result depends on input that is not tracked, like
+        # random values or states read without collecting them
+        self.has_untracked_input = False
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -464,6 +497,52 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def state_fingerprint(self, hass: HomeAssistant) -> tuple[Any, ...] | None:
+        """Return a fingerprint of the current value of the states read.
+
+        The fingerprint covers the state value and the attributes read
+        for each entity, or the whole state when more than that was read.
+        The render gives the same result as long as the fingerprint is
+        unchanged. None is returned when the result depends on more than
+        the states of the collected entities.
+        """
+        if (
+            self.exception
+            or self.is_static
+            or self.has_time
+            or self.has_untracked_input
+            or self.all_states
+            or self.all_states_lifecycle
+            or self.domains
+            or self.domains_lifecycle
+        ):
+            return None
+        states = hass.states
+        entity_reads = self.entity_reads
+        fingerprint: list[Any] = []
+        for entity_id in self.entities:
+            if (state := states.get(entity_id)) is None:
+                fingerprint.append((entity_id, None))
+            elif (attributes := entity_reads.get(entity_id)) is None:
+                # Entities collected without a read through a template state
+                # are treated as if the whole state was read
+                fingerprint.append((entity_id, state))
+            elif not attributes:
+                fingerprint.append((entity_id, state.state))
+            else:
+                state_attributes = state.attributes
+                fingerprint.append(
+                    (
+                        entity_id,
+                        state.state,
+                        *(
+                            state_attributes.get(attribute, _SENTINEL)
+                            for attribute in sorted(attributes)
+                        ),
+                    )
+                )
+        return tuple(fingerprint)
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
@@ -791,10 +870,13 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        value_json: Any = _SENTINEL,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers that already
+        parsed value can pass the result as value_json to avoid parsing
+        it again, or VALUE_NOT_JSON if it could not be parsed.
 
         This method must be run in the event loop.
         """
@@ -808,10 +890,15 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
+        if value_json is VALUE_NOT_JSON:
             pass
+        elif value_json is not _SENTINEL:
+            variables["value_json"] = value_json
+        else:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
             render_result = _render_with_context(
@@ -1052,18 +1139,35 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._cache: dict[str, Any] = {}
 
-    def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+    def _collect_state(self, reads: Iterable[str] | None = None) -> None:
+        """Collect the entity for the render.
+
+        reads are the state attributes read along with the state value,
+        None when more than that is read.
+        """
+        if (render_info := _render_info.get()) is None:
+            return
+        if not self._collect:
+            render_info.has_untracked_input = True
+            return
+        render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+        entity_reads = render_info.entity_reads
+        if reads is None:
+            entity_reads[self._entity_id] = None
+        elif (collected := entity_reads.setdefault(self._entity_id, set())) is not None:
+            collected.update(reads)
+
+    def _get_attribute(self, name: str, default: Any = None) -> Any:
+        """Return a single state attribute."""
+        self._collect_state((name,))
+        return self._state.attributes.get(name, default)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            self._collect_state(_STATE_VALUE_READS.get(item))
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1082,7 +1186,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state(_STATE_VALUE_READS["state"])
         return self._state.state
 
     @property
@@ -1118,19 +1222,19 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(_STATE_VALUE_READS["domain"])
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(_STATE_VALUE_READS["object_id"])
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state(_STATE_VALUE_READS["name"])
         return self._state.name
 
     @property
@@ -1927,7 +2031,7 @@ def is_state(hass: HomeAssistant, entity_id: str, state: str | list[str]) -> boo
 def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) -> bool:
     """Test if a state's attribute is a specific value."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        attr = state_obj.attributes.get(name, _SENTINEL)
+        attr = state_obj._get_attribute(name, _SENTINEL)  # noqa: SLF001
         if attr is _SENTINEL:
             return False
         return bool(attr == value)
@@ -1937,7 +2041,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2646,6 +2750,8 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    if (render_info := _render_info.get()) is not None:
+        render_info.has_untracked_input = True
     return random.choice(values)
 
 
@@ -3012,6 +3118,119 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the code of the templates compiled in previous runs."""
+    await _get_bytecode_cache(hass).async_load()
+
+
+@singleton(_BYTECODE_CACHE)
+def _get_bytecode_cache(hass: HomeAssistant) -> TemplateBytecodeCache:
+    return TemplateBytecodeCache(hass)
+
+
+class _BytecodeCacheData(TypedDict):
+    """Stored data of the template bytecode cache."""
+
+    magic: str
+    bytecode: dict[str, str]
+    unused_runs: dict[str, int]
+
+
+def _bytecode_magic() -> str:
+    """Return the magic the cached bytecode is only valid for."""
+    # The filters and tests known when compiling are part of the code
+    return f"{MAGIC_NUMBER.hex()}-{jinja2.__version__}-{__version__}"
+
+
+class TemplateBytecodeCache:
+    """Persist the code of compiled templates across restarts.
+
+    The code is keyed by a hash of the template source and the flags of
+    the environment which compiled it. Code which was not used for
+    BYTECODE_CACHE_MAX_UNUSED_RUNS runs is evicted when the cache is saved,
+    and the whole cache is discarded when Python, Jinja or Home Assistant
+    is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._loaded = False
+        self._bytecode: dict[str, str] = {}
+        self._unused_runs: dict[str, int] = {}
+        self._store = Store[_BytecodeCacheData](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+        )
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        if (data := await self._store.async_load()) is not None and data[
+            "magic"
+        ] == _bytecode_magic():
+            unused_runs = data["unused_runs"]
+            self._bytecode = data["bytecode"]
+            self._unused_runs = {
+                key: unused_runs.get(key, 0) + 1 for key in self._bytecode
+            }
+        self._loaded = True
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the cached code for key."""
+        if not self._loaded:
+            return None
+        if (bytecode := self._bytecode.get(key)) is not None:
+            try:
+                code = marshal.loads(base64.b64decode(bytecode))
+            except (EOFError, TypeError, ValueError):
+                _LOGGER.debug("Discarding invalid compiled template %s", key)
+            else:
+                self.hits += 1
+                self._unused_runs[key] = 0
+                return code  # type: ignore[no-any-return]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Cache the code for key and schedule a save."""
+        if not self._loaded:
+            # Saving before the cache is loaded would overwrite it
+            return
+        self._bytecode[key] = base64.b64encode(marshal.dumps(code)).decode()
+        self._unused_runs[key] = 0
+        # Templates may be compiled outside the event loop
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> _BytecodeCacheData:
+        """Return the data to store, without the evicted code."""
+        _LOGGER.debug(
+            "Saving compiled templates, %s hits and %s misses",
+            self.hits,
+            self.misses,
+        )
+        unused_runs = {
+            key: runs
+            for key, runs in list(self._unused_runs.items())
+            if runs <= BYTECODE_CACHE_MAX_UNUSED_RUNS
+        }
+        bytecode = self._bytecode
+        return {
+            "magic": _bytecode_magic(),
+            "bytecode": {key: bytecode[key] for key in unused_runs},
+            "unused_runs": unused_runs,
+        }
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -3053,6 +3272,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.template_bytecode_cache: TemplateBytecodeCache | None = None
+        self._bytecode_cache_prefix = (
+            f"{bool(limited)}:{bool(strict)}:{log_fn is not None}:"
+        )
+        if hass is not None:
+            self.template_bytecode_cache = _get_bytecode_cache(hass)
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3462,7 +3687,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (bytecode_cache := self.template_bytecode_cache) is None or not isinstance(
+            source, str
+        ):
+            compiled = super().compile(source)
+        else:
+            key = hashlib.sha256(
+                f"{self._bytecode_cache_prefix}{source}".encode()
+            ).hexdigest()
+            if (cached := bytecode_cache.get(key)) is not None:
+                compiled = cached
+            else:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -29,7 +29,7 @@ from propcache.api import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -50,6 +50,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -69,7 +70,6 @@ BASE_PRELOAD_PLATFORMS = [
     "backup",
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "hardware",
@@ -77,8 +77,6 @@ BASE_PRELOAD_PLATFORMS = [
     "logbook",
     "media_source",
     "recorder",
-    "repairs",
-    "system_health",
     "trigger",
 ]
 
@@ -134,6 +132,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, dict[str, float]]] = HassKey("import_timings")
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -272,6 +275,125 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the cache of manifests from the previous run."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[_ManifestCacheData](
+        hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY, private=True
+    )
+    manifest_cache = ManifestCache(hass, store)
+    await manifest_cache.async_load()
+    hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+
+
+class _ManifestCacheEntry(TypedDict):
+    """A manifest in the manifest cache."""
+
+    stat: list[int]
+    manifest: Manifest
+    top_level_files: list[str] | None
+
+
+class _ManifestCacheData(TypedDict):
+    """Data of the manifest cache in storage."""
+
+    ha_version: str
+    manifests: dict[str, _ManifestCacheEntry]
+
+
+class ManifestCache:
+    """Cache of parsed manifests and top level files of integrations.
+
+    Resolving an integration reads and parses its manifest.json and lists
+    its directory. The results are stored for the next run, keyed by the
+    path of the manifest, and used as long as the Home Assistant version
+    and the size and modification time of the manifest and of its
+    directory are unchanged.
+
+    Lookups happen in the executor, the cache is saved in the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: Store[_ManifestCacheData]) -> None:
+        """Initialize the manifest cache."""
+        self._hass = hass
+        self._store = store
+        self._manifests: dict[str, _ManifestCacheEntry] = {}
+        self._used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the manifests of the previous run."""
+        if (data := await self._store.async_load()) is not None and data[
+            "ha_version"
+        ] == __version__:
+            self._manifests = data["manifests"]
+
+    @staticmethod
+    def stat(manifest_path: pathlib.Path) -> list[int] | None:
+        """Return the key for the version of a manifest or None if missing."""
+        try:
+            manifest_stat = manifest_path.stat()
+            dir_stat = manifest_path.parent.stat()
+        except OSError:
+            return None
+        return [manifest_stat.st_mtime_ns, manifest_stat.st_size, dir_stat.st_mtime_ns]
+
+    def get(
+        self, manifest_path: pathlib.Path, stat: list[int]
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the cached manifest and top level files."""
+        key = str(manifest_path)
+        if (entry := self._manifests.get(key)) is None or entry["stat"] != stat:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.add(key)
+        top_level_files = entry["top_level_files"]
+        return (
+            cast(Manifest, dict(entry["manifest"])),
+            None if top_level_files is None else set(top_level_files),
+        )
+
+    def set(
+        self,
+        manifest_path: pathlib.Path,
+        stat: list[int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Store a manifest and top level files."""
+        key = str(manifest_path)
+        self._manifests[key] = {
+            "stat": stat,
+            "manifest": cast(Manifest, dict(manifest)),
+            "top_level_files": None
+            if top_level_files is None
+            else sorted(top_level_files),
+        }
+        self._used.add(key)
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> _ManifestCacheData:
+        """Return the manifests used in this run."""
+        return {
+            "ha_version": __version__,
+            "manifests": {
+                key: entry
+                for key, entry in list(self._manifests.items())
+                if key in self._used
+            },
+        }
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -655,30 +777,44 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
 
-            if not manifest_path.is_file():
+            stat: list[int] | None = None
+            cached: tuple[Manifest, set[str] | None] | None = None
+            if manifest_cache is not None:
+                if (stat := manifest_cache.stat(manifest_path)) is None:
+                    continue
+                cached = manifest_cache.get(manifest_path, stat)
+            elif not manifest_path.is_file():
                 continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+            if cached is not None:
+                manifest, top_level_files = cached
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None and stat is not None:
+                    manifest_cache.set(manifest_path, stat, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1049,9 +1185,7 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[domain] = cast(ComponentProtocol, self._import_module("__init__"))
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1279,7 +1413,26 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(platform_name)
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module of the integration and record how long it took.
+
+        The import time includes the time spent importing the
+        dependencies of the module that were not imported yet.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        module_path = self.pkg_path if name == "__init__" else f"{self.pkg_path}.{name}"
+        if module_path in sys.modules:
+            return importlib.import_module(module_path)
+        start = time.perf_counter()
+        module = importlib.import_module(module_path)
+        self.hass.data[DATA_IMPORT_TIMINGS].setdefault(self.domain, {})[name] = (
+            time.perf_counter() - start
+        )
+        return module
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -54,6 +54,7 @@ class RuntimeConfig:
     open_ui: bool = False
 
     safe_mode: bool = False
+    warm_start: bool = False
 
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
@@ -4,12 +4,33 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+from types import MappingProxyType
+import zlib
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
 from homeassistant import core
+from homeassistant.components.mqtt.client import MQTT
+from homeassistant.components.recorder.db_schema import Base, States
+from homeassistant.components.recorder.table_managers.states import (
+    PendingStatesRow,
+    StatesManager,
+)
+from homeassistant.components.statistics.sensor import (
+    STAT_MEAN,
+    STAT_MEDIAN,
+    STAT_STANDARD_DEVIATION,
+    STATS_NUMERIC_SLIDING_WINDOW,
+    STATS_NUMERIC_SUPPORT,
+)
+from homeassistant.components.websocket_api.messages import result_message
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -116,6 +137,40 @@ async def fire_events_with_filter(hass: core.HomeAssistant) -> float:
     return timer() - start
 
 
+@benchmark
+async def fire_events_indexed_listeners(hass: core.HomeAssistant) -> float:
+    """Fire 100k events across 10k indexed listeners."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listeners = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    entity_ids = [f"light.kitchen{idx}" for idx in range(listeners)]
+    for entity_id in entity_ids:
+        hass.bus.async_listen_indexed(event_name, listener, "entity_id", [entity_id])
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": entity_ids[idx % listeners]})
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+    print(
+        f"Listener invocations: {count}, "
+        f"unindexed event filter invocations: {events_to_fire * listeners}"
+    )
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass: core.HomeAssistant) -> float:
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +363,203 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def websocket_compress_states(hass: core.HomeAssistant) -> float:
+    """Serialize and compress the initial states of 5000 entities."""
+    states = [
+        core.State(
+            f"sensor.power_{idx}",
+            str(idx),
+            {
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "friendly_name": f"Power {idx}",
+            },
+        )
+        for idx in range(5000)
+    ]
+
+    start = timer()
+    message = JSON_DUMP(result_message(1, states)).encode()
+    serialize_time = timer() - start
+    compressobj = zlib.compressobj(zlib.Z_BEST_SPEED, wbits=-15)
+    compressed = compressobj.compress(message) + compressobj.flush(zlib.Z_SYNC_FLUSH)
+    runtime = timer() - start
+    print(
+        f"{len(message)} bytes serialized in {serialize_time:.4f}s, "
+        f"{len(compressed)} bytes compressed in {runtime - serialize_time:.4f}s"
+    )
+    return runtime
+
+
+def _state_changed_events(
+    entities: int, events: int
+) -> list[core.Event[core.EventStateChangedData]]:
+    """Create state changed events for benchmarking the recorder."""
+    old_states: dict[str, core.State | None] = {}
+    state_changed_events: list[core.Event[core.EventStateChangedData]] = []
+    for idx in range(events):
+        entity_id = f"sensor.power_{idx % entities}"
+        new_state = core.State(entity_id, str(idx), {"unit_of_measurement": "W"})
+        state_changed_events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+    return state_changed_events
+
+
+def _insert_states(bulk: bool) -> float:
+    """Insert 100k states of 100 entities in commits of 1000 states."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    events = _state_changed_events(100, 10**5)
+    states_manager = StatesManager()
+
+    start = timer()
+
+    with Session(engine) as session:
+        for idx, event in enumerate(events):
+            entity_id = event.data["entity_id"]
+            dbstate: States | PendingStatesRow
+            if bulk:
+                dbstate = PendingStatesRow.from_event(event)
+            else:
+                dbstate = States.from_event(event)
+            if pending_state := states_manager.pop_pending(entity_id):
+                dbstate.old_state = pending_state
+            elif old_state_id := states_manager.pop_committed(entity_id):
+                dbstate.old_state_id = old_state_id
+            states_manager.add_pending(entity_id, dbstate)
+            if isinstance(dbstate, PendingStatesRow):
+                states_manager.add_pending_row(dbstate)
+            else:
+                session.add(dbstate)
+            if idx % 1000 == 999:
+                states_manager.insert_pending_rows(session)
+                session.commit()
+                states_manager.post_commit_pending()
+
+    runtime = timer() - start
+    print(f"Sustained {len(events) / runtime:.0f} states per second")
+    return runtime
+
+
+@benchmark
+async def recorder_insert_states(hass: core.HomeAssistant) -> float:
+    """Insert 100k states into SQLite through the session."""
+    return await hass.async_add_executor_job(_insert_states, False)
+
+
+@benchmark
+async def recorder_bulk_insert_states(hass: core.HomeAssistant) -> float:
+    """Insert 100k states into SQLite with bulk inserts."""
+    return await hass.async_add_executor_job(_insert_states, True)
+
+
+@benchmark
+async def mqtt_route_messages(hass: core.HomeAssistant) -> float:
+    """Route 100k MQTT messages to 10k subscriptions."""
+    config_entry = ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source=SOURCE_USER,
+        subentries_data=None,
+        title="MQTT",
+        unique_id=None,
+        version=1,
+    )
+    mqtt_client = MQTT(hass, config_entry, {})
+
+    @core.callback
+    def msg_callback(_):
+        """Handle message."""
+
+    # One in ten subscriptions uses a wildcard, like the availability and
+    # command topics of discovered entities
+    for idx in range(10**4):
+        if idx % 10:
+            topic = f"zigbee2mqtt/device_{idx}/state"
+        else:
+            topic = f"zigbee2mqtt/device_{idx}/+/set"
+        mqtt_client.async_subscribe(topic, msg_callback, 0)
+    # The topics include changing ids so most are not cached
+    topics = [
+        f"zigbee2mqtt/device_{idx % 10**3 * 10}/{idx}/set"
+        if idx % 2
+        else f"zigbee2mqtt/device_{idx % 10**4}/state"
+        for idx in range(10**5)
+    ]
+    routed = 0
+
+    start = timer()
+
+    for topic in topics:
+        routed += len(mqtt_client._matching_subscriptions(topic))  # noqa: SLF001
+
+    runtime = timer() - start
+    print(f"Routed {len(topics) / runtime:.0f} messages per second to {routed}")
+    mqtt_client.cleanup()
+    return runtime
+
+
+@benchmark
+async def statistics_sliding_window(hass: core.HomeAssistant) -> float:
+    """Update the statistics of a 10k samples window with 1k samples."""
+    window_size = 10**4
+    updates = 10**3
+    samples = [float(idx * 7919 % 1000) for idx in range(window_size + updates)]
+
+    def _update_functions(characteristic: str) -> None:
+        """Compute a statistic from all the samples after each update."""
+        function = STATS_NUMERIC_SUPPORT[characteristic]
+        states: deque[bool | float] = deque(maxlen=window_size)
+        ages: deque[float] = deque(maxlen=window_size)
+        for age, value in enumerate(samples):
+            states.append(value)
+            ages.append(float(age))
+            if age >= window_size:
+                function(states, ages, 50)
+
+    def _update_sliding_window(characteristic: str) -> None:
+        """Update a sliding window statistic with each sample."""
+        statistic = STATS_NUMERIC_SLIDING_WINDOW[characteristic](50)
+        states: deque[bool | float] = deque(maxlen=window_size)
+        ages: deque[float] = deque(maxlen=window_size)
+        for age, value in enumerate(samples):
+            if len(states) == window_size:
+                statistic.remove_oldest(states, ages)
+            states.append(value)
+            ages.append(float(age))
+            statistic.append(states, ages)
+            if age >= window_size:
+                statistic.value(states, ages)
+
+    start = timer()
+
+    for characteristic in (STAT_MEAN, STAT_MEDIAN, STAT_STANDARD_DEVIATION):
+        function_start = timer()
+        _update_functions(characteristic)
+        function_runtime = timer() - function_start
+        sliding_window_start = timer()
+        _update_sliding_window(characteristic)
+        sliding_window_runtime = timer() - sliding_window_start
+        print(
+            f"{characteristic}: {updates / function_runtime:.0f} updates per "
+            f"second with the function, {updates / sliding_window_runtime:.0f} "
+            "updates per second with the sliding window"
+        )
+
+    return timer() - start
@@ -182,9 +182,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable-next=possibly-unused-variable
-    def mock_load(filename, secrets=None):
+    def mock_load(filename, secrets=None, yaml_cache=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
+        # The YAML cache is not used so every included file is reported
         return MOCKS["load"][1](filename, secrets)
 
     # pylint: disable-next=possibly-unused-variable
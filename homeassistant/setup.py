@@ -826,6 +826,16 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_import_timings(hass: core.HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return the import time of each module for each integration.
+
+    Modules are keyed by platform name, the integration
+    itself is keyed as __init__.
+    """
+    return hass.data.get(loader.DATA_IMPORT_TIMINGS, {})
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
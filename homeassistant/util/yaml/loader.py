@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+import fnmatch
 from io import StringIO
+import math
 import os
-from typing import TextIO
+from pathlib import Path
+from typing import Any, TextIO, TypedDict
 
-from annotatedyaml import YAMLException, YamlTypeError
+from annotatedyaml import SECRET_YAML, YAMLException, YamlTypeError
 from annotatedyaml.loader import (
     HAS_C_LOADER,
     JSON_TYPE,
+    FastSafeLoader,
     LoaderType,
     Secrets,
     add_constructor,
@@ -22,10 +28,13 @@ import yaml
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
+
 __all__ = [
     "HAS_C_LOADER",
     "JSON_TYPE",
     "Secrets",
+    "YAMLCache",
     "YamlTypeError",
     "add_constructor",
     "load_yaml",
@@ -35,8 +44,358 @@ __all__ = [
 ]
 
 
+type _FileSignature = list[int] | None
+
+
+class YAMLCacheEntry(TypedDict):
+    """A parsed YAML file and the files and variables it was loaded from."""
+
+    files: dict[str, _FileSignature]
+    dirs: dict[str, dict[str, _FileSignature]]
+    env: dict[str, str | None]
+    paths: list[str]
+    tree: Any
+
+
+class _Dependencies:
+    """The files and variables a YAML file was loaded from."""
+
+    __slots__ = ("cacheable", "dirs", "env", "files", "secrets")
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        self.files: dict[str, _FileSignature] = {}
+        self.dirs: dict[str, dict[str, _FileSignature]] = {}
+        self.env: dict[str, str | None] = {}
+        # The values of the secrets by id, with the file and the name they
+        # were requested with. The values are kept so the ids stay unique.
+        self.secrets: dict[int, tuple[Any, str, str]] = {}
+        self.cacheable = True
+
+    def add_file(self, path: str) -> None:
+        """Add a file."""
+        if path not in self.files:
+            self.files[path] = _file_signature(path)
+
+    def add_dir(self, path: str) -> None:
+        """Add a directory included with one of the !include_dir tags."""
+        if path not in self.dirs:
+            self.dirs[path] = _dir_signature(path)
+
+    def add_secrets(self, requester_path: str, config_dir: Path) -> None:
+        """Add the secrets files that are searched for a secret."""
+        secret_dir = Path(requester_path)
+        while True:
+            secret_dir = secret_dir.parent
+            try:
+                secret_dir.relative_to(config_dir)
+            except ValueError:
+                break
+            self.add_file(str(secret_dir / SECRET_YAML))
+
+    def add_secret(self, value: Any, requester_path: str, secret: str) -> None:
+        """Add a secret so it is stored as a reference instead of its value."""
+        if isinstance(value, (dict, list)):
+            # The items of a secret can be merged into other mappings
+            self.cacheable = False
+        elif type(value) is not bool and value is not None:
+            self.secrets[id(value)] = (value, requester_path, secret)
+
+
+_dependencies: ContextVar[_Dependencies | None] = ContextVar(
+    "yaml_dependencies", default=None
+)
+
+
+def _file_signature(path: str) -> _FileSignature:
+    """Return the modification time and size of a file, None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _dir_signature(path: str) -> dict[str, _FileSignature]:
+    """Return the signature of the YAML files the !include_dir tags load."""
+    return {fname: _file_signature(fname) for fname in _find_yaml_files(path)}
+
+
+def _find_yaml_files(directory: str) -> Iterator[str]:
+    """Recursively find the YAML files in a directory like the loader does."""
+    for root, dirs, files in os.walk(directory, topdown=True):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for basename in sorted(files):
+            if not basename.startswith(".") and fnmatch.fnmatch(basename, "*.yaml"):
+                yield os.path.join(root, basename)
+
+
+def _track_dependencies(
+    tag: str, track: Callable[[_Dependencies, LoaderType, yaml.nodes.Node], None]
+) -> None:
+    """Record the dependencies of tag while a YAMLCache loads a file."""
+    constructor = FastSafeLoader.yaml_constructors[tag]
+
+    def _construct(loader: LoaderType, node: yaml.nodes.Node) -> Any:
+        if (dependencies := _dependencies.get()) is not None and node.value:
+            track(dependencies, loader, node)
+        return constructor(loader, node)
+
+    add_constructor(tag, _construct)
+
+
+def _include_path(loader: LoaderType, node: yaml.nodes.Node) -> str:
+    """Return the path included by a node."""
+    return os.path.join(os.path.dirname(loader.get_name), node.value)
+
+
+def _construct_secret(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
+    """Record a secret and the secrets files searched for it."""
+    if (dependencies := _dependencies.get()) is not None and loader.secrets is not None:
+        dependencies.add_secrets(loader.get_name, loader.secrets.config_dir)
+    value = annotated_secret_yaml(loader, node)
+    if dependencies is not None:
+        dependencies.add_secret(value, loader.get_name, node.value)
+    return value
+
+
+def _track_env_var(
+    dependencies: _Dependencies, loader: LoaderType, node: yaml.nodes.Node
+) -> None:
+    """Record the environment variable used by a node."""
+    name = node.value.split()[0]
+    dependencies.env[name] = os.environ.get(name)
+
+
+_track_dependencies(
+    "!include", lambda deps, loader, node: deps.add_file(_include_path(loader, node))
+)
+for _tag in (
+    "!include_dir_list",
+    "!include_dir_merge_list",
+    "!include_dir_named",
+    "!include_dir_merge_named",
+):
+    _track_dependencies(
+        _tag, lambda deps, loader, node: deps.add_dir(_include_path(loader, node))
+    )
+_track_dependencies("!env_var", _track_env_var)
+add_constructor("!secret", _construct_secret)
+
+
+class _UncacheableError(Exception):
+    """Raised when a parsed YAML file can't be stored in the cache."""
+
+
+class _TreeEncoder:
+    """Encode parsed YAML as JSON compatible data.
+
+    Secrets are stored as references, their values are never stored.
+    """
+
+    def __init__(self, dependencies: _Dependencies) -> None:
+        """Initialize the encoder."""
+        self.dependencies = dependencies
+        self.secrets = dependencies.secrets
+        self.paths: dict[str, int] = {}
+
+    def encode_tree(self, obj: Any) -> Any:
+        """Encode a parsed YAML file."""
+        if not self.dependencies.cacheable:
+            raise _UncacheableError("A secret is not a scalar")
+        return self.encode(obj)
+
+    def _annotate(self, encoded: dict[str, Any], obj: Any) -> dict[str, Any]:
+        """Add the file and line annotations of a node."""
+        if (path := getattr(obj, "__config_file__", None)) is not None:
+            encoded["f"] = self.paths.setdefault(path, len(self.paths))
+            encoded["l"] = getattr(obj, "__line__", None)
+        return encoded
+
+    def encode(self, obj: Any) -> Any:
+        """Encode an object."""
+        if (secret := self.secrets.get(id(obj))) is not None and secret[0] is obj:
+            return {
+                "t": "secret",
+                "v": secret[2],
+                "f": self.paths.setdefault(secret[1], len(self.paths)),
+            }
+        obj_type = type(obj)
+        if obj is None or obj_type in (str, int, bool):
+            return obj
+        if obj_type is float:
+            return obj if math.isfinite(obj) else {"t": "float", "v": repr(obj)}
+        if obj_type is NodeStrClass:
+            return self._annotate({"t": "str", "v": str(obj)}, obj)
+        if obj_type in (dict, NodeDictClass):
+            return self._annotate(
+                {
+                    "t": "dict" if obj_type is dict else "node_dict",
+                    "v": [
+                        [self.encode(key), self.encode(val)] for key, val in obj.items()
+                    ],
+                },
+                obj,
+            )
+        if obj_type in (list, NodeListClass):
+            return self._annotate(
+                {
+                    "t": "list" if obj_type is list else "node_list",
+                    "v": [self.encode(item) for item in obj],
+                },
+                obj,
+            )
+        if obj_type is Input:
+            return {"t": "input", "v": obj.name}
+        raise _UncacheableError(f"Can't cache {obj_type.__name__}")
+
+
+class _TreeDecoder:
+    """Decode the JSON compatible data written by _TreeEncoder."""
+
+    def __init__(self, paths: list[str], secrets: Secrets | None) -> None:
+        """Initialize the decoder."""
+        self.paths = paths
+        self.secrets = secrets
+
+    def _annotate[_NodeT: (NodeStrClass, NodeDictClass, NodeListClass)](
+        self, node: _NodeT, encoded: dict[str, Any]
+    ) -> _NodeT:
+        """Restore the file and line annotations of a node."""
+        if "f" in encoded:
+            node.__config_file__ = self.paths[encoded["f"]]
+            node.__line__ = encoded["l"]
+        return node
+
+    def decode(self, encoded: Any) -> Any:
+        """Decode an object."""
+        if not isinstance(encoded, dict):
+            return encoded
+        value = encoded["v"]
+        match encoded["t"]:
+            case "str":
+                return self._annotate(NodeStrClass(value), encoded)
+            case "float":
+                return float(value)
+            case "dict":
+                return {self.decode(key): self.decode(val) for key, val in value}
+            case "node_dict":
+                return self._annotate(
+                    NodeDictClass(
+                        (self.decode(key), self.decode(val)) for key, val in value
+                    ),
+                    encoded,
+                )
+            case "list":
+                return [self.decode(item) for item in value]
+            case "node_list":
+                return self._annotate(
+                    NodeListClass(self.decode(item) for item in value), encoded
+                )
+            case "input":
+                return Input(value)
+            case "secret":
+                if self.secrets is None:
+                    raise _UncacheableError("Secrets not supported")
+                return self.secrets.get(self.paths[encoded["f"]], value)
+        raise _UncacheableError(f"Unknown type {encoded['t']}")
+
+
+class YAMLCache:
+    """Cache of parsed YAML files.
+
+    A file is parsed again when it, one of the files it includes, one of
+    the secrets files its secrets are searched in or one of the
+    environment variables it uses has changed. Files are compared by
+    modification time and size. The parsed files are stored as JSON
+    compatible data so every load returns new objects which can be
+    modified by the caller. Secrets are stored by name and looked up again
+    on every load.
+    """
+
+    def __init__(self, entries: dict[str, YAMLCacheEntry] | None = None) -> None:
+        """Initialize the cache."""
+        self.entries: dict[str, YAMLCacheEntry] = entries or {}
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+
+    def load_yaml(
+        self, fname: str | os.PathLike[str], secrets: Secrets | None = None
+    ) -> JSON_TYPE | None:
+        """Load a YAML file from the cache or parse it."""
+        path = os.fspath(fname)
+        key = f"{path}|{secrets.config_dir if secrets else ''}"
+        if (
+            (entry := self.entries.get(key)) is not None
+            and "tree" in entry
+            and _entry_is_valid(entry)
+        ):
+            try:
+                loaded: JSON_TYPE | None = _TreeDecoder(entry["paths"], secrets).decode(
+                    entry["tree"]
+                )
+            except (
+                _UncacheableError,
+                YAMLException,
+                LookupError,
+                TypeError,
+                ValueError,
+            ):
+                pass
+            else:
+                self.hits += 1
+                return loaded
+
+        self.misses += 1
+        dependencies = _Dependencies()
+        dependencies.add_file(path)
+        token = _dependencies.set(dependencies)
+        try:
+            loaded = load_annotated_yaml(fname, secrets)
+        finally:
+            _dependencies.reset(token)
+
+        if dependencies.files[path] is None:
+            # The file was not read from disk
+            return loaded
+        encoder = _TreeEncoder(dependencies)
+        try:
+            tree = encoder.encode_tree(loaded)
+        except _UncacheableError:
+            if self.entries.pop(key, None) is None:
+                return loaded
+        else:
+            self.entries[key] = {
+                "files": dependencies.files,
+                "dirs": dependencies.dirs,
+                "env": dependencies.env,
+                "paths": list(encoder.paths),
+                "tree": tree,
+            }
+        self.changed = True
+        return loaded
+
+
+def _entry_is_valid(entry: YAMLCacheEntry) -> bool:
+    """Return if none of the dependencies of a cache entry changed."""
+    return (
+        all(
+            _file_signature(path) == signature
+            for path, signature in entry["files"].items()
+        )
+        and all(
+            _dir_signature(path) == signature
+            for path, signature in entry["dirs"].items()
+        )
+        and all(os.environ.get(name) == value for name, value in entry["env"].items())
+    )
+
+
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YAMLCache | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
@@ -44,25 +403,37 @@ def load_yaml(
     except for FileNotFoundError which will be re-raised.
     """
     try:
+        if cache is not None:
+            return cache.load_yaml(fname, secrets)
         return load_annotated_yaml(fname, secrets)
     except YAMLException as exc:
         raise HomeAssistantError(str(exc)) from exc
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YAMLCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    try:
-        return load_annotated_yaml_dict(fname, secrets)
-    except YamlTypeError:
-        raise
-    except YAMLException as exc:
-        raise HomeAssistantError(str(exc)) from exc
+    if cache is None:
+        try:
+            return load_annotated_yaml_dict(fname, secrets)
+        except YamlTypeError:
+            raise
+        except YAMLException as exc:
+            raise HomeAssistantError(str(exc)) from exc
+
+    loaded_yaml = load_yaml(fname, secrets, cache)
+    if loaded_yaml is None:
+        loaded_yaml = {}
+    if not isinstance(loaded_yaml, dict):
+        raise YamlTypeError(f"YAML file {fname} does not contain a dict")
+    return loaded_yaml
 
 
 def parse_yaml(
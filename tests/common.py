@@ -42,7 +42,11 @@ from homeassistant.auth import (
     providers as auth_providers,
 )
 from homeassistant.auth.permissions import system_policies
-from homeassistant.components import device_automation, persistent_notification as pn
+from homeassistant.components import (
+    device_automation,
+    persistent_notification as pn,
+    system_health,
+)
 from homeassistant.components.device_automation import (  # noqa: F401
     _async_get_device_automation_capabilities as async_get_device_automation_capabilities,
 )
@@ -1515,7 +1519,8 @@ async def flush_store(store: storage.Store) -> None:
 
 async def get_system_health_info(hass: HomeAssistant, domain: str) -> dict[str, Any]:
     """Get system health info."""
-    return await hass.data["system_health"][domain].info_callback(hass)
+    registrations = await system_health.async_get_registrations(hass)
+    return await registrations[domain].info_callback(hass)
 
 
 @contextmanager
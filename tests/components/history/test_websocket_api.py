@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -10,6 +10,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.websocket_api import ActiveConnection
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -173,6 +174,310 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_stream(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streams the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.other", "1", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.other", "2", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test", "sensor.other"],
+                "minimal_response": True,
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["result"] is None
+
+        chunks: list[dict[str, list[dict]]] = []
+        while not (response := await client.receive_json())["event"].get("complete"):
+            assert response["id"] == 1
+            assert response["type"] == "event"
+            chunks.append(response["event"]["states"])
+
+    assert response["event"] == {"states": {}, "complete": True}
+    # Each message holds at most STREAM_CHUNK_SIZE states of a single entity
+    assert [{key: len(val) for key, val in chunk.items()} for chunk in chunks] == [
+        {"sensor.test": 2},
+        {"sensor.test": 1},
+        {"sensor.other": 2},
+    ]
+    sensor_test_history = chunks[0]["sensor.test"] + chunks[1]["sensor.test"]
+    assert [state["s"] for state in sensor_test_history] == ["on", "off", "on"]
+    assert sensor_test_history[0]["a"] == {"any": "attr"}
+    assert "a" not in sensor_test_history[1]
+    assert [state["s"] for state in chunks[2]["sensor.other"]] == ["1", "2"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "complete": True}
+
+
+async def test_history_during_period_downsampled(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples the states to the resolution."""
+    start = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(20):
+        with freeze_time(start + timedelta(seconds=idx + 0.5)):
+            hass.states.async_set("sensor.test", str(idx), {"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(seconds=20)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "resolution": 4,
+            "downsample": "mean",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_test_history = response["result"]["sensor.test"]
+    assert [state["s"] for state in sensor_test_history] == [
+        "2.0",
+        "7.0",
+        "12.0",
+        "17.0",
+    ]
+    assert sensor_test_history[0]["a"] == {"any": "attr"}
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(seconds=20)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "resolution": 2,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.test"]] == [
+        "0",
+        "19",
+    ]
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "complete": True}
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "resolution": 2,
+            "downsample": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_stream_waits_for_drain(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next chunk is only read once the previous one was sent."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.test", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    sent_before_drain: list[int] = []
+
+    async def _async_wait_for_drain(connection: ActiveConnection) -> None:
+        sent_before_drain.append(len(received))
+
+    client = await hass_ws_client()
+    received: list[dict] = []
+    with (
+        patch.object(websocket_api, "STREAM_CHUNK_SIZE", 1),
+        patch.object(
+            ActiveConnection,
+            "async_wait_for_drain",
+            autospec=True,
+            side_effect=_async_wait_for_drain,
+        ) as mock_wait_for_drain,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "minimal_response": True,
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        while not (response := await client.receive_json())["event"].get("complete"):
+            received.append(response["event"]["states"])
+
+    assert [chunk["sensor.test"][0]["s"] for chunk in received] == ["1", "2", "3"]
+    assert mock_wait_for_drain.call_count == 3
+
+
+async def test_history_during_period_stream_unsubscribe_while_draining(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test unsubscribing stops a stream waiting for a stalled client."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.test", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    drain_started = asyncio.Event()
+    drain_cancelled = asyncio.Event()
+
+    async def _async_wait_for_drain(connection: ActiveConnection) -> None:
+        drain_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            drain_cancelled.set()
+            raise
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "STREAM_CHUNK_SIZE", 1),
+        patch.object(
+            ActiveConnection,
+            "async_wait_for_drain",
+            autospec=True,
+            side_effect=_async_wait_for_drain,
+        ),
+        patch.object(
+            websocket_api,
+            "_read_stream_message",
+            wraps=websocket_api._read_stream_message,
+        ) as mock_read_stream_message,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "minimal_response": True,
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["states"]["sensor.test"][0]["s"] == "1"
+        await drain_started.wait()
+
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        await drain_cancelled.wait()
+        await hass.async_block_till_done()
+
+    # Only the chunk that was sent has been read
+    assert mock_read_stream_message.call_count == 1
+
+
+async def test_history_during_period_stream_error(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the stream subscription is removed when reading the states fails."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    chunks: list[tuple[str, list] | Exception] = [
+        ("sensor.test", [{"s": "on"}]),
+        ValueError("Boom"),
+    ]
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.significant_states_reader",
+        return_value=Mock(read_chunk=Mock(side_effect=chunks)),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"] == {"states": {"sensor.test": [{"s": "on"}]}}
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"]["code"] == "unknown_error"
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
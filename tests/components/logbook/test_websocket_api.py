@@ -4,16 +4,20 @@ import asyncio
 from collections.abc import Callable
 from datetime import timedelta
 from typing import Any
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, PropertyMock, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.helpers import async_determine_event_types
+from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.services import SERVICE_PURGE
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api import TYPE_RESULT
@@ -453,6 +457,98 @@ async def test_get_events_invalid_filters(
     assert response["error"]["code"] == "invalid_format"
 
 
+async def test_get_events_caches_closed_hours(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test logbook get_events serves the closed hours from the cache."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    freezer.move_to(start + timedelta(minutes=10))
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    entity_registry.async_get_or_create(
+        "light", "test", "kitchen", suggested_object_id="kitchen"
+    )
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(hours=1))
+    await async_wait_recording_done(hass)
+
+    async def _async_get_events() -> list[dict[str, Any]]:
+        event_processor = EventProcessor(
+            hass,
+            async_determine_event_types(hass, ["light.kitchen"], None),
+            ["light.kitchen"],
+            None,
+            None,
+            timestamp=True,
+            include_entity_name=False,
+        )
+        return await get_instance(hass).async_add_executor_job(
+            event_processor.get_events, start, dt_util.utcnow()
+        )
+
+    with patch.object(
+        EventProcessor,
+        "_get_events",
+        autospec=True,
+        side_effect=EventProcessor._get_events,
+    ) as mock_get_events:
+        # Nothing is cached while the recorder has a backlog
+        with patch.object(
+            Recorder, "backlog", new_callable=PropertyMock, return_value=1
+        ):
+            results = await _async_get_events()
+        assert [result["state"] for result in results] == [
+            STATE_ON,
+            STATE_OFF,
+            STATE_ON,
+            STATE_OFF,
+        ]
+        assert mock_get_events.call_count == 1
+        assert mock_get_events.call_args[0][1] == start
+
+        # The missing hours are queried at once
+        mock_get_events.reset_mock()
+        assert await _async_get_events() == results
+        assert mock_get_events.call_count == 1
+        assert mock_get_events.call_args[0][1] == start
+
+        # Only the open hour is queried when the closed hours are cached
+        mock_get_events.reset_mock()
+        assert await _async_get_events() == results
+        assert mock_get_events.call_count == 1
+        assert mock_get_events.call_args[0][1] > start + timedelta(hours=3, seconds=-1)
+
+        # Renaming the entity clears the cache
+        entity_registry.async_update_entity("light.kitchen", name="Kitchen")
+        await hass.async_block_till_done()
+        mock_get_events.reset_mock()
+        assert await _async_get_events() == results
+        assert mock_get_events.call_count == 1
+        assert mock_get_events.call_args[0][1] == start
+
+        # Purging clears the cache
+        await hass.services.async_call(
+            recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 10}
+        )
+        await async_wait_recording_done(hass)
+        mock_get_events.reset_mock()
+        assert await _async_get_events() == results
+        assert mock_get_events.call_count == 1
+        assert mock_get_events.call_args[0][1] == start
+
+
 async def test_get_events_with_device_ids(
     recorder_mock: Recorder,
     hass: HomeAssistant,
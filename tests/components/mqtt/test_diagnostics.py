@@ -40,6 +40,14 @@ async def test_entry_diagnostics(
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [],
+        "discovery": {
+            "messages": 0,
+            "batches": 0,
+            "batched_messages": 0,
+            "deduplicated_messages": 0,
+            "processing_time": 0.0,
+            "messages_per_second": None,
+        },
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
@@ -125,6 +133,7 @@ async def test_entry_diagnostics(
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [expected_device],
+        "discovery": ANY,
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
         "mqtt_debug_info": expected_debug_info,
     }
@@ -261,6 +270,7 @@ async def test_redact_diagnostics(
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [expected_device],
+        "discovery": ANY,
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
     }
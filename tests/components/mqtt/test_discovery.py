@@ -2,6 +2,7 @@
 
 import asyncio
 import copy
+from datetime import timedelta
 import json
 import logging
 from pathlib import Path
@@ -20,8 +21,10 @@ from homeassistant.components.mqtt.abbreviations import (
 )
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.discovery import (
+    DISCOVERY_BATCH_WINDOW,
     MQTT_DISCOVERY_DONE,
     MQTT_DISCOVERY_NEW,
+    MQTT_DISCOVERY_NEW_BATCH,
     MQTT_DISCOVERY_UPDATED,
     MQTTDiscoveryPayload,
     async_start,
@@ -44,6 +47,7 @@ from homeassistant.helpers.dispatcher import (
 )
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.signal_type import SignalTypeFormat
 
 from .common import help_all_subscribe_calls, help_test_unload_config_entry
@@ -55,6 +59,7 @@ from tests.common import (
     MockModule,
     async_capture_events,
     async_fire_mqtt_message,
+    async_fire_time_changed,
     async_get_device_automations,
     mock_config_flow,
     mock_integration,
@@ -470,6 +475,70 @@ async def test_correct_config_discovery_component(
     assert device_entry is None
 
 
+async def test_retained_discovery_batch(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test retained discovery messages are processed in a batch."""
+    await mqtt_mock_entry()
+    batches: list[list[MQTTDiscoveryPayload]] = []
+
+    @callback
+    def _capture_batch(discovery_payloads: list[MQTTDiscoveryPayload]) -> None:
+        batches.append(discovery_payloads)
+
+    async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_NEW_BATCH.format("sensor", "mqtt"), _capture_batch
+    )
+
+    for object_id, name in (("bla1", "Beer"), ("bla2", "Milk"), ("bla3", "Soda")):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/sensor/{object_id}/config",
+            json.dumps({"name": name, "state_topic": f"test-topic/{object_id}"}),
+            retain=True,
+        )
+    # A live message replaces the buffered retained message of its topic
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/bla1/config",
+        json.dumps({"name": "Wine", "state_topic": "test-topic/bla1"}),
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.wine") is not None
+    assert hass.states.get("sensor.milk") is None
+    assert hass.states.get("sensor.soda") is None
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DISCOVERY_BATCH_WINDOW)
+    )
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert [payload["name"] for payload in batches[0]] == ["Milk", "Soda"]
+    assert hass.states.get("sensor.beer") is None
+    assert hass.states.get("sensor.milk") is not None
+    assert hass.states.get("sensor.soda") is not None
+    assert ("sensor", "bla2") in hass.data["mqtt"].discovery_already_discovered
+
+    discovery_stats = hass.data["mqtt"].discovery_stats
+    assert discovery_stats.batches == 1
+    assert discovery_stats.batched_messages == 2
+    assert discovery_stats.deduplicated_messages == 1
+
+    # Updates are not batched
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/sensor/bla2/config",
+        json.dumps({"name": "Juice", "state_topic": "test-topic/bla2"}),
+    )
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.milk")
+    assert state is not None
+    assert state.name == "Juice"
+
+
 @pytest.mark.parametrize(
     ("discovery_topic", "discovery_hash"),
     [
@@ -21,6 +21,7 @@ from homeassistant.components.mqtt.models import (
     MqttCommandTemplateException,
     MqttValueTemplateException,
     ReceiveMessage,
+    ReceivePayloadViews,
 )
 from homeassistant.components.mqtt.schemas import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.sensor import SensorDeviceClass
@@ -40,6 +41,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
@@ -244,6 +246,60 @@ async def test_value_template_fails(hass: HomeAssistant) -> None:
     )
 
 
+async def test_value_template_message_views(hass: HomeAssistant) -> None:
+    """Test value templates rendering a message share the parsed payload."""
+    views = ReceivePayloadViews(b'{"id": 4321}')
+    msg = ReceiveMessage(
+        "test/topic", views.text(), 0, False, "test/topic", time.monotonic(), views
+    )
+    tpl1 = template.Template("{{ value_json.id }}", hass=hass)
+    tpl2 = template.Template("{{ value_json.id + 1 }}", hass=hass)
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads",
+        wraps=json_loads,
+    ) as mock_json_loads:
+        assert (
+            mqtt.MqttValueTemplate(tpl1).async_render_with_possible_json_value(msg)
+            == "4321"
+        )
+        assert (
+            mqtt.MqttValueTemplate(tpl2).async_render_with_possible_json_value(msg)
+            == "4322"
+        )
+    assert mock_json_loads.call_count == 1
+    assert msg.text == '{"id": 4321}'
+    assert msg.json is msg.json
+
+    # Payloads that are not JSON are still exposed as value
+    views = ReceivePayloadViews(b"ON")
+    msg = ReceiveMessage(
+        "test/topic", views.text(), 0, False, "test/topic", time.monotonic(), views
+    )
+    tpl = template.Template("{{ value }} {{ value_json is defined }}", hass=hass)
+    val_tpl = mqtt.MqttValueTemplate(tpl)
+    with (
+        patch(
+            "homeassistant.components.mqtt.models.json_loads",
+            wraps=json_loads,
+        ) as mock_json_loads,
+        patch.object(template, "json_loads", wraps=json_loads) as mock_tpl_json_loads,
+    ):
+        assert val_tpl.async_render_with_possible_json_value(msg) == "ON False"
+        assert val_tpl.async_render_with_possible_json_value(msg) == "ON False"
+        with pytest.raises(ValueError):
+            _ = msg.json
+    # The template does not parse a payload which is known not to be JSON
+    assert mock_json_loads.call_count == 1
+    assert mock_tpl_json_loads.call_count == 0
+
+    # Messages without views parse the payload
+    msg = ReceiveMessage(
+        "test/topic", b'{"id": 1}', 0, False, "test/topic", time.monotonic()
+    )
+    assert msg.text == '{"id": 1}'
+    assert msg.json == {"id": 1}
+
+
 async def test_service_call_without_topic_does_not_publish(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -0,0 +1,67 @@
+"""The tests for the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("home/kitchen/temperature", "home/kitchen/temperature", True),
+        ("home/kitchen/temperature", "home/kitchen/humidity", False),
+        ("home/+/temperature", "home/kitchen/temperature", True),
+        ("home/+/temperature", "home/kitchen/sink/temperature", False),
+        ("home/+", "home/", True),
+        ("home/+", "home", False),
+        ("+/+", "/home", True),
+        ("home/#", "home/kitchen/sink/temperature", True),
+        ("home/#", "home", True),
+        ("home/#", "garden", False),
+        ("#", "home/kitchen", True),
+        ("+/kitchen/#", "home/kitchen", True),
+        ("#", "$SYS/broker/uptime", False),
+        ("+/broker/uptime", "$SYS/broker/uptime", False),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against a topic filter."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_match_order_and_remove() -> None:
+    """Test matches keep the order values were added in and are removed."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/#", "all")
+    trie.add("home/+/temperature", "temperature")
+    trie.add("home/kitchen/temperature", "kitchen")
+    trie.add("home/+/temperature", "temperature_2")
+
+    assert trie.match("home/kitchen/temperature") == [
+        "all",
+        "temperature",
+        "kitchen",
+        "temperature_2",
+    ]
+    assert "home/+/temperature" in trie
+    assert "home/+" not in trie
+
+    trie.remove("home/+/temperature", "temperature")
+    trie.remove("home/#", "all")
+    assert trie.match("home/kitchen/temperature") == ["kitchen", "temperature_2"]
+    assert "home/#" not in trie
+
+    with pytest.raises(KeyError):
+        trie.remove("home/#", "all")
+    with pytest.raises(KeyError):
+        trie.remove("garden/#", "all")
+
+    trie.remove("home/+/temperature", "temperature_2")
+    trie.remove("home/kitchen/temperature", "kitchen")
+    assert trie.match("home/kitchen/temperature") == []
+    # All levels are pruned when the last value is removed
+    assert not trie._root.children
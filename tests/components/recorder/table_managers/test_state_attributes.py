@@ -0,0 +1,137 @@
+"""The tests for the recorder state attributes manager."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    WARM_CACHE_STORAGE_KEY,
+    WARM_CACHE_STORAGE_VERSION,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _state_changed_event(
+    old_state: State | None, new_state: State | None
+) -> Event[EventStateChangedData]:
+    """Create a state_changed event."""
+    entity_id = (new_state or old_state).entity_id
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+    )
+
+
+async def test_serialize_from_event_reuses_identical_attributes(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test attributes are not encoded again when the object is unchanged."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    manager = instance.state_attributes_manager
+    state_1 = State("sensor.power", "1", {"unit_of_measurement": "W"})
+    state_2 = State("sensor.power", "2", state_1.attributes)
+    state_3 = State("sensor.power", "3", {"unit_of_measurement": "W"})
+    state_4 = State("sensor.power", "4", state_3.attributes)
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as mock_serialize:
+        assert (
+            manager.serialize_from_event(_state_changed_event(None, state_1))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert mock_serialize.call_count == 1
+        assert (
+            manager.serialize_from_event(_state_changed_event(state_1, state_2))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert mock_serialize.call_count == 1
+
+        # Equal attributes in a new object are encoded again
+        assert (
+            manager.serialize_from_event(_state_changed_event(state_2, state_3))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert mock_serialize.call_count == 2
+
+        # Removing the entity evicts the last serialized attributes
+        assert (
+            manager.serialize_from_event(_state_changed_event(state_3, None)) == b"{}"
+        )
+        assert mock_serialize.call_count == 3
+        assert (
+            manager.serialize_from_event(_state_changed_event(None, state_4))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert mock_serialize.call_count == 4
+
+        # Resetting clears the last serialized attributes
+        manager.reset()
+        assert (
+            manager.serialize_from_event(_state_changed_event(state_3, state_4))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert mock_serialize.call_count == 5
+
+
+async def test_warm_cache_saved_at_shutdown(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the hashes of the cached attributes are saved at shutdown."""
+    await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 0})
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+
+    await hass.async_stop()
+
+    assert hass_storage[WARM_CACHE_STORAGE_KEY]["data"] == [
+        StateAttributes.hash_shared_attrs_bytes(b'{"unit_of_measurement":"W"}')
+    ]
+
+
+async def test_warm_cache_loaded_from_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the saved hashes are resolved against the database."""
+    power_attrs = b'{"unit_of_measurement":"W"}'
+    hass_storage[WARM_CACHE_STORAGE_KEY] = {
+        "version": WARM_CACHE_STORAGE_VERSION,
+        "data": [StateAttributes.hash_shared_attrs_bytes(power_attrs)],
+    }
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    manager = instance.state_attributes_manager
+    # The database was empty at startup
+    assert manager.get_from_cache(power_attrs.decode()) is None
+
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    attributes_id = manager.get_from_cache(power_attrs.decode())
+    assert attributes_id is not None
+
+    def _restart_with_warm_cache() -> None:
+        manager.prepare_warm_cache()
+        manager.reset()
+        with session_scope(session=instance.get_session()) as session:
+            manager.load_warm_cache(session)
+
+    await instance.async_add_executor_job(_restart_with_warm_cache)
+    assert manager.get_from_cache(power_attrs.decode()) == attributes_id
@@ -6,6 +6,7 @@ from collections.abc import Generator
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
@@ -19,6 +20,7 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history import modern as history_modern
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
@@ -533,6 +535,205 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+async def test_stream_significant_states(
+    hass: HomeAssistant,
+    chunk_size: int,
+    minimal_response: bool,
+    compressed_state_format: bool,
+) -> None:
+    """Test streamed significant states match the materialized ones."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        compressed_state_format=compressed_state_format,
+    )
+    streamed: dict[str, list[State | dict[str, Any]]] = {}
+    for entity_id, chunk in history_modern.stream_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        compressed_state_format=compressed_state_format,
+        chunk_size=chunk_size,
+    ):
+        assert 0 < len(chunk) <= chunk_size
+        streamed.setdefault(entity_id, []).extend(chunk)
+
+    assert streamed.keys() == hist.keys()
+    for entity_id, entity_states in hist.items():
+        assert len(streamed[entity_id]) == len(entity_states)
+        for streamed_state, state in zip(
+            streamed[entity_id], entity_states, strict=True
+        ):
+            if isinstance(state, State):
+                assert isinstance(streamed_state, State)
+                assert_states_equal_without_context(streamed_state, state)
+            else:
+                assert streamed_state == state
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+async def test_stream_significant_states_same_last_updated(
+    hass: HomeAssistant, chunk_size: int
+) -> None:
+    """Test states with the same last_updated are not lost between chunks."""
+    start = dt_util.utcnow()
+    with freeze_time(start + timedelta(seconds=1)):
+        for state in ("1", "2", "3", "4"):
+            hass.states.async_set("sensor.test", state)
+    with freeze_time(start + timedelta(seconds=2)):
+        hass.states.async_set("sensor.test", "5")
+    await async_wait_recording_done(hass)
+
+    streamed = [
+        state.state
+        for _, chunk in history.stream_significant_states(
+            hass,
+            start,
+            start + timedelta(seconds=3),
+            entity_ids=["sensor.test"],
+            chunk_size=chunk_size,
+        )
+        for state in chunk
+        if isinstance(state, State)
+    ]
+    assert streamed == ["1", "2", "3", "4", "5"]
+
+
+async def test_stream_significant_states_with_non_existent_entity_ids(
+    hass: HomeAssistant,
+) -> None:
+    """Test streaming significant states returns nothing for unknown entity ids."""
+    assert (
+        list(
+            history.stream_significant_states(
+                hass, dt_util.utcnow(), entity_ids=["sensor.not_existing_entity"]
+            )
+        )
+        == []
+    )
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"),
+    [
+        (history.DownsampleMethod.LAST, ["4", "9", "unavailable", "19"]),
+        (history.DownsampleMethod.MIN, ["0", "5", "unavailable", "15"]),
+        (history.DownsampleMethod.MAX, ["4", "9", "unavailable", "19"]),
+        (history.DownsampleMethod.MEAN, ["2.0", "7.0", "unavailable", "17.0"]),
+        (history.DownsampleMethod.LTTB, ["0", "5", "unavailable", "19"]),
+    ],
+)
+def test_downsample_compressed_states(
+    method: history.DownsampleMethod, expected: list[str]
+) -> None:
+    """Test downsampling compressed states into time buckets."""
+    states: list[dict[str, Any]] = [
+        {"s": str(idx), "lu": float(idx)} for idx in range(20)
+    ]
+    states[0]["a"] = {"unit_of_measurement": "W"}
+    # The third bucket only has states that are not numbers
+    for idx in range(10, 15):
+        states[idx]["s"] = "unavailable"
+
+    downsampled = history.downsample_compressed_states(iter(states), 0, 20, 4, method)
+
+    assert [state["s"] for state in downsampled] == expected
+    assert downsampled[0]["a"] == {"unit_of_measurement": "W"}
+    assert all(
+        downsampled[idx]["lu"] < downsampled[idx + 1]["lu"]
+        for idx in range(len(downsampled) - 1)
+    )
+
+
+def test_downsample_compressed_states_lttb_keeps_peaks() -> None:
+    """Test LTTB keeps the peaks of the series."""
+    states: list[dict[str, Any]] = [{"s": "0", "lu": float(idx)} for idx in range(100)]
+    states[33]["s"] = "100"
+    states[66]["s"] = "-100"
+
+    downsampled = history.downsample_compressed_states(
+        iter(states), 0, 100, 10, history.DownsampleMethod.LTTB
+    )
+
+    assert len(downsampled) <= 10
+    assert [state["lu"] for state in downsampled if state["s"] != "0"] == [
+        33.0,
+        66.0,
+    ]
+
+
+async def test_downsample_significant_states(hass: HomeAssistant) -> None:
+    """Test downsampling the significant states of the database."""
+    start = dt_util.utcnow()
+    for idx in range(10):
+        with freeze_time(start + timedelta(seconds=idx)):
+            hass.states.async_set("sensor.power", str(idx), {"any": "attr"})
+            hass.states.async_set("sensor.other", str(idx * 2))
+    await async_wait_recording_done(hass)
+
+    downsampled = dict(
+        history.downsample_significant_states(
+            hass,
+            start,
+            start + timedelta(seconds=10),
+            ["sensor.power", "sensor.other", "sensor.not_existing_entity"],
+            2,
+            history.DownsampleMethod.MAX,
+            minimal_response=True,
+        )
+    )
+
+    assert downsampled.keys() == {"sensor.power", "sensor.other"}
+    assert [state["s"] for state in downsampled["sensor.power"]] == ["4", "9"]
+    assert downsampled["sensor.power"][0]["a"] == {"any": "attr"}
+    assert [state["s"] for state in downsampled["sensor.other"]] == ["8", "18"]
+
+
+async def test_downsample_significant_states_removed_entity(
+    hass: HomeAssistant,
+) -> None:
+    """Test downsampling the states of an entity that was removed and re-added."""
+    start = dt_util.utcnow()
+    for idx in range(10):
+        with freeze_time(start + timedelta(seconds=idx)):
+            if idx == 5:
+                hass.states.async_remove("sensor.power")
+            else:
+                hass.states.async_set("sensor.power", str(idx))
+    await async_wait_recording_done(hass)
+
+    downsampled = dict(
+        history.downsample_significant_states(
+            hass,
+            start,
+            start + timedelta(seconds=10),
+            ["sensor.power"],
+            2,
+            history.DownsampleMethod.MEAN,
+            minimal_response=True,
+        )
+    )
+
+    # The removal is kept as a gap, the state at the start time is not included
+    assert [state["s"] for state in downsampled["sensor.power"]] == [
+        "2.5",
+        None,
+        "7.5",
+    ]
+
+
 @pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
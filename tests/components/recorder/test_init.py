@@ -397,11 +397,9 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        # States are inserted in bulk after flushing the session
+        if get_instance(hass).states_manager._pending_rows:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1475,6 +1473,82 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_sets_old_state_in_bulk(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving many states of the same entity in one commit sets old state."""
+    for idx in range(5):
+        hass.states.async_set("test.one", f"one_{idx}", {"idx": idx % 2})
+        hass.states.async_set("test.two", f"two_{idx}", {})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "one_5", {"idx": 1})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 11
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["one_0"].old_state_id is None
+        assert states_by_state["two_0"].old_state_id is None
+        for idx in range(1, 5):
+            assert (
+                states_by_state[f"one_{idx}"].old_state_id
+                == states_by_state[f"one_{idx - 1}"].state_id
+            )
+            assert (
+                states_by_state[f"two_{idx}"].old_state_id
+                == states_by_state[f"two_{idx - 1}"].state_id
+            )
+        assert (
+            states_by_state["one_5"].old_state_id == states_by_state["one_4"].state_id
+        )
+        for idx in range(6):
+            assert states_by_state[f"one_{idx}"].entity_id == "test.one"
+            assert states_by_state[f"one_{idx}"].shared_attrs == f'{{"idx":{idx % 2}}}'
+        for idx in range(5):
+            assert states_by_state[f"two_{idx}"].entity_id == "test.two"
+            assert states_by_state[f"two_{idx}"].shared_attrs == "{}"
+
+
+async def test_saving_state_while_entity_id_migration_is_running(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states keep their entity_id until the entity_id migration is done."""
+    instance = get_instance(hass)
+    instance.states_meta_manager.active = False
+    try:
+        for idx in range(3):
+            hass.states.async_set("test.one", f"one_{idx}", {"idx": idx})
+        await async_wait_recording_done(hass)
+        assert not instance.states_manager._pending_rows
+    finally:
+        instance.states_meta_manager.active = True
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(States.entity_id, States.state_id, States.old_state_id)
+            .where(States.entity_id == "test.one")
+            .order_by(States.state_id)
+        )
+        assert len(states) == 3
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id == states[1].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1,18 +1,20 @@
 """The tests for sensor recorder platform."""
 
 from collections.abc import Generator
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
 from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticMeanType,
+    StatisticMetaData,
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
@@ -3335,6 +3337,168 @@ async def test_recorder_platform_with_statistics(
     recorder_platform.validate_statistics.assert_called_once_with(hass)
 
 
+async def test_compile_hourly_statistics_from_running_summaries(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test hourly statistics are summarized while the 5-minute ones are compiled."""
+    metadata: dict[str, StatisticMetaData] = {
+        "some_domain:mean": {
+            "mean_type": StatisticMeanType.ARITHMETIC,
+            "has_sum": False,
+            "name": None,
+            "source": "some_domain",
+            "statistic_id": "some_domain:mean",
+            "unit_of_measurement": "W",
+        },
+        "some_domain:circular": {
+            "mean_type": StatisticMeanType.CIRCULAR,
+            "has_sum": False,
+            "name": None,
+            "source": "some_domain",
+            "statistic_id": "some_domain:circular",
+            "unit_of_measurement": "°",
+        },
+        "some_domain:sum": {
+            "mean_type": StatisticMeanType.NONE,
+            "has_sum": True,
+            "name": None,
+            "source": "some_domain",
+            "statistic_id": "some_domain:sum",
+            "unit_of_measurement": "kWh",
+        },
+    }
+
+    def _compile_statistics(
+        hass: HomeAssistant, session: Session, start: datetime, end: datetime
+    ) -> PlatformCompiledStatistics:
+        idx = start.minute // 5
+        return PlatformCompiledStatistics(
+            [
+                {
+                    "meta": metadata["some_domain:mean"],
+                    "stat": {
+                        "start": start,
+                        "mean": idx * 2,
+                        "min": idx,
+                        "max": idx * 3,
+                    },
+                },
+                {
+                    "meta": metadata["some_domain:circular"],
+                    "stat": {
+                        "start": start,
+                        "mean": 350 + idx * 2,
+                        "mean_weight": 1,
+                        "min": 350,
+                        "max": 372,
+                    },
+                },
+                {
+                    "meta": metadata["some_domain:sum"],
+                    "stat": {"start": start, "state": idx, "sum": idx * 10},
+                },
+            ],
+            get_metadata_with_session(
+                recorder.get_instance(hass), session, statistic_ids=set(metadata)
+            ),
+        )
+
+    await _setup_mock_domain(
+        hass, Mock(compile_statistics=Mock(wraps=_compile_statistics))
+    )
+    await async_recorder_block_till_done(hass)
+
+    zero = get_start_time(dt_util.utcnow()).replace(minute=0) - timedelta(hours=3)
+    with patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary_mean_stmt",
+        wraps=statistics._compile_hourly_statistics_summary_mean_stmt,
+    ) as summary_mean_stmt_mock:
+        for idx in range(12):
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * idx))
+        await async_wait_recording_done(hass)
+        # The hour was summarized without querying the 5-minute statistics
+        assert summary_mean_stmt_mock.call_count == 0
+
+        # The first period of the next hour is missing, it must be queried
+        next_hour = zero + timedelta(hours=1)
+        for idx in range(1, 12):
+            do_adhoc_statistics(hass, start=next_hour + timedelta(minutes=5 * idx))
+        await async_wait_recording_done(hass)
+        assert summary_mean_stmt_mock.call_count == 1
+
+    stats = statistics_during_period(hass, zero, period="hour")
+    assert stats == {
+        "some_domain:mean": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(11.0),
+                "min": 0.0,
+                "max": 33.0,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": next_hour.timestamp(),
+                "end": (next_hour + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(12.0),
+                "min": 1.0,
+                "max": 33.0,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ],
+        "some_domain:circular": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(1.0),
+                "min": 350.0,
+                "max": 372.0,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": next_hour.timestamp(),
+                "end": (next_hour + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(2.0),
+                "min": 350.0,
+                "max": 372.0,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ],
+        "some_domain:sum": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(hours=1)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": 11.0,
+                "sum": 110.0,
+            },
+            {
+                "start": next_hour.timestamp(),
+                "end": (next_hour + timedelta(hours=1)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": 11.0,
+                "sum": 110.0,
+            },
+        ],
+    }
+
+
 async def test_recorder_platform_without_statistics(
     hass: HomeAssistant,
     setup_recorder: None,
@@ -3421,3 +3585,158 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-06 12:00:00+00:00")
+async def test_daily_statistics_from_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+) -> None:
+    """Test completed days are reduced once and reused for days and months."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    day1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    day2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-05 00:00:00"))
+    day3 = dt_util.as_utc(dt_util.parse_datetime("2022-10-06 00:00:00"))
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    external_statistics = [
+        {
+            "start": start,
+            "last_reset": None,
+            "max": mean + 1,
+            "mean": mean,
+            "min": mean - 1,
+            "state": mean,
+            "sum": mean,
+        }
+        for start, mean in (
+            (day1, 10),
+            (day1 + timedelta(hours=1), 20),
+            (day2, 30),
+            (day3, 40),
+        )
+    ]
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _day(start: datetime, **values: float) -> dict[str, Any]:
+        return {
+            "start": start.timestamp(),
+            "end": (start + timedelta(days=1)).timestamp(),
+            "last_reset": None,
+            **values,
+        }
+
+    expected_days = {
+        "test:total_energy_import": [
+            _day(day1, max=21, mean=15, min=9, state=20, sum=20),
+            _day(day2, max=31, mean=30, min=29, state=30, sum=30),
+            _day(day3, max=41, mean=40, min=39, state=40, sum=40),
+        ]
+    }
+    month_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    expected_month = {
+        "test:total_energy_import": [
+            {
+                "start": month_start.timestamp(),
+                "end": dt_util.as_utc(
+                    dt_util.parse_datetime("2022-11-01 00:00:00")
+                ).timestamp(),
+                "last_reset": None,
+                "max": 41,
+                "mean": 25,
+                "min": 9,
+                "state": 40,
+                "sum": 40,
+            }
+        ]
+    }
+
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=_generate_statistics_during_period_stmt,
+    ) as stmt_mock:
+        stats = statistics_during_period(
+            hass, month_start, period="day", statistic_ids={"test:total_energy_import"}
+        )
+        assert stats == expected_days
+        assert stmt_mock.call_args[0][0] == month_start
+
+        # The completed days are cached, only the current day is read
+        stats = statistics_during_period(
+            hass,
+            month_start,
+            period="month",
+            statistic_ids={"test:total_energy_import"},
+        )
+        assert stats == expected_month
+        assert stmt_mock.call_args[0][0] == day3
+
+        # Nothing is read if all days are cached
+        stats = statistics_during_period(
+            hass,
+            month_start,
+            day2,
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+        )
+        assert stats == {
+            "test:total_energy_import": expected_days["test:total_energy_import"][:2]
+        }
+        assert stmt_mock.call_count == 2
+
+        # The current day is not returned when the period starts after it
+        stats = statistics_during_period(
+            hass,
+            day3 + timedelta(days=1),
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+        )
+        assert stats == {}
+        assert stmt_mock.call_args[0][0] == day3 + timedelta(days=1)
+
+    # Importing statistics forgets the cached days
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [{**external_statistics[2], "max": 100}],
+    )
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass, day1, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats["test:total_energy_import"][1]["max"] == 100
+
+
+async def test_statistics_rollup_cache_invalidated_after_commit(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test rollups read before the commit of a write are not kept."""
+    rollup_cache = statistics.get_statistics_rollup_cache(hass)
+    key = (1, "kWh", "kWh")
+
+    with session_scope(hass=hass) as session:
+        session.query(recorder.db_schema.StatisticsMeta).all()
+        rollup_cache.invalidate_after_commit(session, {1})
+        # A reader before the commit still reads the statistics before the write
+        generation = rollup_cache.generation()
+        rollup_cache.set_days(generation, key, {0.0: None})
+        assert rollup_cache.get_days(key) == {0.0: None}
+
+    assert rollup_cache.get_days(key) == {}
+    # A reader which started before the commit can not cache its rollups
+    rollup_cache.set_days(generation, key, {0.0: None})
+    assert rollup_cache.get_days(key) == {}
+    rollup_cache.set_days(rollup_cache.generation(), key, {0.0: None})
+    assert rollup_cache.get_days(key) == {0.0: None}
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from asyncio import Event as AsyncioEvent
+from collections import deque
 from collections.abc import Sequence
 from datetime import datetime, timedelta
+import math
+import random
 import statistics
 from threading import Event
 from typing import Any
@@ -17,6 +20,7 @@ from homeassistant import config as hass_config
 from homeassistant.components.recorder import Recorder, history
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
+    DATA_COMPONENT as SENSOR_DATA_COMPONENT,
     SensorDeviceClass,
     SensorStateClass,
 )
@@ -28,6 +32,8 @@ from homeassistant.components.statistics.sensor import (
     CONF_SAMPLES_MAX_BUFFER_SIZE,
     CONF_STATE_CHARACTERISTIC,
     STAT_MEAN,
+    STATS_NUMERIC_SLIDING_WINDOW,
+    STATS_NUMERIC_SUPPORT,
     StatisticsSensor,
 )
 from homeassistant.const import (
@@ -42,7 +48,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -741,6 +747,50 @@ async def test_precision(hass: HomeAssistant) -> None:
     assert state.state == str(round(mean, 3))
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "non_finite"),
+    [("percentile", "nan"), ("median", "nan"), ("mean", "inf"), ("value_max", "inf")],
+)
+async def test_non_finite_samples(
+    hass: HomeAssistant, characteristic: str, non_finite: str
+) -> None:
+    """Test the statistics recover once non finite samples leave the window."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 5,
+                }
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    entity = hass.data[SENSOR_DATA_COMPONENT].get_entity("sensor.test")
+    assert isinstance(entity, StatisticsSensor)
+
+    # The sensor can't write a state which is not finite,
+    # so the samples are added without updating the state
+    values: list[float] = []
+    for value in ("5", non_finite, "1", "9", "10", "0.5", "7", "12", "3", "1"):
+        entity._add_state_to_queue(State("sensor.test_monitored", value))
+        entity._update_value()
+        values = [*values[-4:], float(value)]
+        if all(math.isfinite(sample) for sample in values):
+            assert entity.native_value == pytest.approx(
+                STATS_NUMERIC_SUPPORT[characteristic](
+                    deque(values), entity.ages, entity._percentile
+                ),
+                abs=0.01,
+            )
+    assert list(entity.states) == [0.5, 7, 12, 3, 1]
+
+
 async def test_percentile(hass: HomeAssistant) -> None:
     """Test correct results for percentile characteristic."""
     assert await async_setup_component(
@@ -2089,3 +2139,44 @@ async def test_attributes_remains(recorder_mock: Recorder, hass: HomeAssistant)
             "state_class": SensorStateClass.MEASUREMENT,
             "unit_of_measurement": "°C",
         }
+
+
+@pytest.mark.parametrize(
+    ("characteristic", "max_buffer_size"),
+    [
+        (characteristic, max_buffer_size)
+        for characteristic in STATS_NUMERIC_SLIDING_WINDOW
+        for max_buffer_size in (1, 2, 7)
+    ],
+)
+def test_sliding_window_statistics_match_functions(
+    characteristic: str, max_buffer_size: int
+) -> None:
+    """Test the sliding window statistics match the statistics functions."""
+    rng = random.Random(characteristic)
+    statistic = STATS_NUMERIC_SLIDING_WINDOW[characteristic](90)
+    states: deque[bool | float] = deque(maxlen=max_buffer_size)
+    ages: deque[float] = deque(maxlen=max_buffer_size)
+    age = 1700000000.0
+    for _ in range(3000):
+        if states and rng.random() < 0.3:
+            # Purge the oldest samples as the sensor does for the max age
+            for _ in range(rng.randint(1, len(states))):
+                statistic.remove_oldest(states, ages)
+                states.popleft()
+                ages.popleft()
+        else:
+            if len(states) == max_buffer_size:
+                statistic.remove_oldest(states, ages)
+            # Repeated values test the order of equal extremes
+            states.append(float(rng.choice((rng.uniform(-500, 500), 3, 7, 355))))
+            age += rng.uniform(0.1, 60)
+            ages.append(age)
+            statistic.append(states, ages)
+
+        expected = STATS_NUMERIC_SUPPORT[characteristic](states, ages, 90)
+        value = statistic.value(states, ages)
+        if isinstance(expected, float):
+            assert value == pytest.approx(expected, rel=1e-9, abs=1e-6)
+        else:
+            assert value == expected
@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -19,7 +20,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -35,6 +36,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_integration,
     mock_platform,
@@ -1270,6 +1272,124 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shares_listener(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscriptions with the same filter share one state_changed listener."""
+    hass.states.async_set("light.kitchen", "off")
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    ws_client_1 = await hass_ws_client(hass)
+    ws_client_2 = await hass_ws_client(hass)
+
+    subscriptions = []
+    for ws_client in (ws_client_1, ws_client_2):
+        await ws_client.send_json_auto_id(
+            {"type": "subscribe_entities", "include": {"domains": ["light"]}}
+        )
+        msg = await ws_client.receive_json()
+        assert msg["success"]
+        subscriptions.append(msg["id"])
+        msg = await ws_client.receive_json()
+        assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("switch.not_included", "on")
+    hass.states.async_set("light.kitchen", "on")
+    for ws_client, subscription in zip(
+        (ws_client_1, ws_client_2), subscriptions, strict=True
+    ):
+        msg = await ws_client.receive_json()
+        assert msg["id"] == subscription
+        assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+
+    await ws_client_1.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscriptions[0]}
+    )
+    assert (await ws_client_1.receive_json())["success"]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.kitchen", "off")
+    msg = await ws_client_2.receive_json()
+    assert msg["id"] == subscriptions[1]
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+
+    await ws_client_2.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscriptions[1]}
+    )
+    assert (await ws_client_2.receive_json())["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_subscribe_entities_coalesce_window(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test changes within the coalesce window are sent as one diff."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    hass.states.async_set("light.hall", "off")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "coalesce_window": 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    subscription = msg["id"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.hall", "off")
+    hass.states.async_remove("light.hall")
+    hass.states.async_set("light.new", "on")
+    await hass.async_block_till_done()
+
+    freezer.tick(1)
+    async_fire_time_changed(hass)
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert msg["event"] == {
+        "a": {
+            "light.new": {
+                "a": {},
+                "c": ANY,
+                "lc": ANY,
+                "s": "on",
+            }
+        },
+        "c": {"light.kitchen": {"+": {"a": {"brightness": 100}, "c": ANY, "s": "on"}}},
+        "r": ["light.hall"],
+    }
+
+    # Nothing is sent when the entities did not change during the window
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+    await hass.async_block_till_done()
+    freezer.tick(1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    await websocket_client.send_json_auto_id({"type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+    # Pending changes are dropped when unsubscribing
+    hass.states.async_set("light.kitchen", "off")
+    await websocket_client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    freezer.tick(1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    await websocket_client.send_json_auto_id({"type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
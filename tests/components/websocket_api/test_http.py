@@ -3,13 +3,15 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -20,7 +22,11 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -186,6 +192,44 @@ async def test_delayed_response_handler(
     assert "on closed connection" in caplog.text
 
 
+async def test_wait_for_drain(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test waiting until the queued messages have been sent."""
+    pending_after_drain: list[int] = []
+    connections: list[ActiveConnection] = []
+
+    @websocket_command({"type": "drain_sender"})
+    @async_response
+    async def async_drain_sender(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connections.append(connection)
+        assert connection.wait_for_drain is not None
+        handler = cast(http.WebSocketHandler, connection.wait_for_drain.__self__)  # type: ignore[attr-defined]
+        for idx in range(20):
+            connection.send_event(msg["id"], {"idx": idx})
+        await connection.async_wait_for_drain()
+        pending_after_drain.append(len(handler._message_queue))
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, async_drain_sender)
+
+    await websocket_client.send_json({"id": 1, "type": "drain_sender"})
+    for idx in range(20):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"idx": idx}
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "result"
+    assert pending_after_drain == [0]
+
+    assert await websocket_client.close()
+    await hass.async_block_till_done()
+    assert connections[0].wait_for_drain is None
+    # Waiting on a closed connection returns immediately
+    await connections[0].async_wait_for_drain()
+
+
 async def test_ensure_disconnect_invalid_json(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -557,3 +601,75 @@ async def test_enable_disable_debug_logging(
     assert msg["id"] == 2
     assert msg["type"] == "pong"
     assert 'Sending b\'{"id":2,"type":"pong"}\'' not in caplog.text
+
+
+async def test_compress_large_messages(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    socket_enabled: None,
+) -> None:
+    """Test only large messages are compressed with permessage-deflate."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+    hass.states.async_set("sensor.large", "on", {"data": "x" * 4096})
+
+    frame_compress: list[int | None] = []
+    send_frame = WebSocketWriter.send_frame
+
+    async def _send_frame(
+        writer: WebSocketWriter,
+        message: bytes,
+        opcode: int,
+        compress: int | None = None,
+    ) -> None:
+        # Only the server does not mask its frames
+        if opcode == WSMsgType.TEXT and not writer.use_mask:
+            frame_compress.append(compress)
+        await send_frame(writer, message, opcode, compress)
+
+    with patch.object(WebSocketWriter, "send_frame", _send_frame):
+        async with client.ws_connect(const.URL, compress=15) as websocket:
+            assert websocket.compress == 15
+            assert (await websocket.receive_json())["type"] == "auth_required"
+            await websocket.send_json(
+                {"type": "auth", "access_token": hass_access_token}
+            )
+            assert (await websocket.receive_json())["type"] == "auth_ok"
+            frame_compress.clear()
+
+            await websocket.send_json({"id": 1, "type": "ping"})
+            assert (await websocket.receive_json())["type"] == "pong"
+            assert frame_compress == [None]
+
+            await websocket.send_json({"id": 2, "type": "get_states"})
+            msg = await websocket.receive_json()
+            assert msg["result"][0]["attributes"]["data"] == "x" * 4096
+            assert frame_compress == [None, 15]
+
+            await websocket.send_json({"id": 3, "type": "ping"})
+            assert (await websocket.receive_json())["type"] == "pong"
+            assert frame_compress == [None, 15, None]
+
+
+async def test_websocket_writer_compress_per_frame() -> None:
+    """Test the aiohttp writer only compresses the frames we ask it to.
+
+    The text frame sender turns off the compression of the negotiated
+    extension and passes compress for large messages.
+    """
+    transport = Mock(is_closing=Mock(return_value=False))
+    writer = WebSocketWriter(Mock(), transport, compress=15)
+    writer.compress = 0
+
+    await writer.send_frame(b'{"id":1,"type":"pong"}', WSMsgType.TEXT)
+    frame = transport.write.call_args[0][0]
+    # RSV1 is not set for uncompressed frames
+    assert frame[0] == 0x80 | WSMsgType.TEXT
+    assert frame.endswith(b'{"id":1,"type":"pong"}')
+
+    await writer.send_frame(b"x" * 4096, WSMsgType.TEXT, 15)
+    frame = transport.write.call_args[0][0]
+    # RSV1 is set for compressed frames
+    assert frame[0] == 0x80 | 0x40 | WSMsgType.TEXT
+    assert len(frame) < 4096
@@ -3260,6 +3260,61 @@ async def test_async_track_template_result_multiple_templates_mixing_domain(
     ]
 
 
+async def test_track_template_result_memoized(hass: HomeAssistant) -> None:
+    """Test templates are not re-rendered when the states they read are unchanged."""
+    hass.states.async_set("sensor.power", "1", {"unit": "W", "voltage": 230})
+    template_power = Template(
+        "{{ states('sensor.power') }} {{ state_attr('sensor.power', 'unit') }}", hass
+    )
+    template_attributes = Template("{{ states.sensor.power.attributes.voltage }}", hass)
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append({update.template: update.result for update in updates})
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_power, None),
+            TrackTemplate(template_attributes, None),
+        ],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    assert info.memo_stats == {}
+    renders = template_power._renders
+
+    hass.states.async_set("sensor.power", "1", {"unit": "W", "voltage": 231})
+    await hass.async_block_till_done()
+    assert refresh_runs[-1] == {template_attributes: 231}
+    assert template_power._renders == renders
+    assert info.memo_stats[template_power].hits == 1
+    assert info.memo_stats[template_power].misses == 0
+    assert info.memo_stats[template_attributes].hits == 0
+    assert info.memo_stats[template_attributes].misses == 1
+
+    hass.states.async_set("sensor.power", "2", {"unit": "W", "voltage": 231})
+    await hass.async_block_till_done()
+    assert refresh_runs[-1] == {template_power: "2 W"}
+    assert info.memo_stats[template_power].misses == 1
+    assert info.memo_stats[template_power].hit_rate == 0.5
+
+    hass.states.async_set("sensor.power", "2", {"unit": "kW", "voltage": 231})
+    await hass.async_block_till_done()
+    assert refresh_runs[-1] == {template_power: "2 kW"}
+
+    # A forced refresh always renders
+    renders = template_power._renders
+    info.async_refresh()
+    assert template_power._renders > renders
+    assert info.memo_stats[template_power].hits == 1
+    assert info.memo_stats[template_power].misses == 2
+
+
 async def test_track_template_with_time(hass: HomeAssistant) -> None:
     """Test tracking template with time."""
 
@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_REFRESH_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -119,7 +122,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     assert mock_write_data.called
 
@@ -185,7 +188,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
     # Verify still saving
     assert mock_write_data.called
 
@@ -342,6 +345,54 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_only_encodes_changed_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test unchanged states are not encoded again."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for entity_id in ("input_boolean.b1", "input_boolean.b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await platform.async_add_entities([entity])
+    data = async_get(hass)
+    data.last_states = {
+        "input_boolean.b3": StoredState(
+            State("input_boolean.b3", "off"), None, dt_util.utcnow()
+        )
+    }
+
+    async def _async_dump_states() -> list[Any]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]
+
+    written_states = await _async_dump_states()
+    assert [
+        json_round_trip(state)["state"]["entity_id"] for state in written_states
+    ] == ["input_boolean.b1", "input_boolean.b2", "input_boolean.b3"]
+
+    freezer.tick(timedelta(minutes=15))
+    hass.states.async_set("input_boolean.b1", "on")
+    new_written_states = await _async_dump_states()
+    assert json_round_trip(new_written_states[0])["state"]["state"] == "on"
+    assert new_written_states[0] is not written_states[0]
+    assert new_written_states[1] is written_states[1]
+    assert new_written_states[2] is written_states[2]
+
+    # The last seen time of unchanged states is refreshed
+    freezer.tick(LAST_SEEN_REFRESH_INTERVAL)
+    written_states = await _async_dump_states()
+    assert written_states[0] is not new_written_states[0]
+    assert written_states[1] is not new_written_states[1]
+    assert json_round_trip(written_states[1])["last_seen"] == (
+        dt_util.utcnow().isoformat()
+    )
+    assert written_states[2] is new_written_states[2]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
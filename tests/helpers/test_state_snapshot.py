@@ -0,0 +1,108 @@
+"""Test the state snapshot helper."""
+
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.state_snapshot import (
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    async_load,
+)
+
+
+def _mock_snapshot(hass_storage: dict[str, Any]) -> None:
+    """Mock the states saved at the last shutdown."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "sensor.power": {
+                "s": "10",
+                "a": {"unit_of_measurement": "W"},
+                "c": "01JA000000000000000000000A",
+                "lc": 1700000000.0,
+                "lu": 1700000100.0,
+            },
+            "sensor.energy": {
+                "s": "5",
+                "a": {},
+                "c": "01JA000000000000000000000B",
+                "lc": 1700000000.0,
+            },
+            "sensor.not_registered": {
+                "s": "1",
+                "a": {},
+                "c": "01JA000000000000000000000C",
+                "lc": 1700000000.0,
+            },
+            "sensor.invalid": {"s": "1"},
+        },
+    }
+
+
+async def test_warm_start_disabled(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the snapshot is not loaded when warm start is disabled."""
+    _mock_snapshot(hass_storage)
+    entity_registry.async_get_or_create("sensor", "test", "power")
+
+    await async_load(hass)
+
+    assert hass.states.async_all() == []
+
+
+async def test_warm_start(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the states of registered entities are restored and saved at stop."""
+    _mock_snapshot(hass_storage)
+    for object_id in ("power", "energy", "invalid"):
+        entity_registry.async_get_or_create(
+            "sensor", "test", object_id, suggested_object_id=object_id
+        )
+    hass.config.warm_start = True
+
+    await async_load(hass)
+
+    assert sorted(hass.states.async_entity_ids()) == ["sensor.energy", "sensor.power"]
+    power = hass.states.get("sensor.power")
+    assert power.state == "10"
+    assert power.attributes == {"unit_of_measurement": "W", ATTR_RESTORED: True}
+    assert power.last_changed_timestamp == 1700000000.0
+    assert power.last_updated_timestamp == 1700000100.0
+    assert power.context.id == "01JA000000000000000000000A"
+    energy = hass.states.get("sensor.energy")
+    assert energy.state == "5"
+    assert energy.last_updated_timestamp == 1700000000.0
+
+    # The entity replaces its restored state when it is added
+    hass.states.async_set("sensor.power", "12", {"unit_of_measurement": "W"})
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.power").state == "12"
+    assert hass.states.get("sensor.energy").state == STATE_UNAVAILABLE
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert hass_storage[STORAGE_KEY]["data"] == {
+        "sensor.power": {
+            "s": "12",
+            "a": {"unit_of_measurement": "W"},
+            "c": hass.states.get("sensor.power").context.id,
+            "lc": hass.states.get("sensor.power").last_changed_timestamp,
+        }
+    }
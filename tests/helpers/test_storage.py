@@ -842,6 +842,96 @@ async def test_json_load_failure(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and compacted."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    items = [{"id": idx, "name": "x" * 100} for idx in range(10)]
+
+    def _read_files(store: storage.Store) -> tuple[dict[str, Any], list[str]]:
+        with open(store.path, encoding="utf8") as snapshot:
+            snapshot_data = json.load(snapshot)
+        with open(f"{store.path}{storage.JOURNAL_SUFFIX}", encoding="utf8") as journal:
+            return snapshot_data, journal.read().splitlines()
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": items, "count": 10})
+        snapshot, journal = await hass.async_add_executor_job(_read_files, store)
+        assert snapshot["data"] == {"items": items, "count": 10}
+        assert journal == [json_bytes({"journal": snapshot["journal"]}).decode()]
+
+        items[2] = {"id": 2, "name": "changed"}
+        items.append({"id": 10, "name": "new"})
+        await store.async_save({"items": items, "count": 11})
+        assert await hass.async_add_executor_job(_read_files, store) == (
+            snapshot,
+            [
+                journal[0],
+                '{"c":"items","i":2,"v":{"id":2,"name":"changed"}}',
+                '{"c":"items","i":10,"v":{"id":10,"name":"new"}}',
+                '{"c":"count","v":11}',
+            ],
+        )
+
+        # Nothing is appended when nothing changed
+        await store.async_save({"items": items, "count": 11})
+        del items[5:]
+        await store.async_save({"items": items, "count": 5})
+        _, journal = await hass.async_add_executor_job(_read_files, store)
+        assert journal[4:] == ['{"c":"items","n":5}', '{"c":"count","v":5}']
+
+        # The journal is replayed when loading
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"items": items, "count": 5}
+
+        # A partially written change is ignored
+        def _append_partial_change() -> None:
+            with open(
+                f"{store.path}{storage.JOURNAL_SUFFIX}", "a", encoding="utf8"
+            ) as journal:
+                journal.write('{"c":"count","v":')
+
+        await hass.async_add_executor_job(_append_partial_change)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"items": items, "count": 5}
+
+        # The journal is compacted into the snapshot at the final write
+        store.async_delay_save(lambda: {"items": items, "count": 6}, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        new_snapshot, journal = await hass.async_add_executor_job(_read_files, store)
+        assert new_snapshot["data"] == {"items": items, "count": 6}
+        assert new_snapshot["journal"] != snapshot["journal"]
+        assert journal == [json_bytes({"journal": new_snapshot["journal"]}).decode()]
+
+        # A journal of an older snapshot is not replayed
+        await hass.async_add_executor_job(
+            _write_journal, store, snapshot["journal"], '{"c":"count","v":99}'
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"items": items, "count": 6}
+
+        # A journal larger than the snapshot is compacted
+        await store.async_save({"items": items, "count": 6, "big": "x" * 2000})
+        new_snapshot, journal = await hass.async_add_executor_job(_read_files, store)
+        assert new_snapshot["data"]["big"] == "x" * 2000
+        assert len(journal) == 1
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(
+            os.path.exists, f"{store.path}{storage.JOURNAL_SUFFIX}"
+        )
+
+        await hass.async_stop(force=True)
+
+
+def _write_journal(store: storage.Store, generation: str, *changes: str) -> None:
+    """Write a journal for a store."""
+    with open(f"{store.path}{storage.JOURNAL_SUFFIX}", "w", encoding="utf8") as journal:
+        journal.write("\n".join((json.dumps({"journal": generation}), *changes, "")))
+
+
 async def test_read_only_store(
     hass: HomeAssistant, read_only_store: storage.Store, hass_storage: dict[str, Any]
 ) -> None:
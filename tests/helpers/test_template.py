@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from pytest_unordered import unordered
@@ -239,6 +240,50 @@ def test_iterating_all_states(hass: HomeAssistant) -> None:
     assert_result_info(info, "10happy", entities=[], all_states=True)
 
 
+def test_state_fingerprint(hass: HomeAssistant) -> None:
+    """Test the fingerprint of the states read by a render."""
+    hass.states.async_set("sensor.a", "1", {"unit": "W", "other": 1})
+    hass.states.async_set("sensor.b", "on", {"other": 1})
+
+    info = render_to_info(
+        hass, "{{ states('sensor.a') }} {{ state_attr('sensor.a', 'unit') }}"
+    )
+    assert info.entity_reads == {"sensor.a": {"unit"}}
+    fingerprint = info.state_fingerprint(hass)
+    assert fingerprint == (("sensor.a", "1", "W"),)
+
+    # Attributes that were not read do not change the fingerprint
+    hass.states.async_set("sensor.a", "1", {"unit": "W", "other": 2})
+    assert info.state_fingerprint(hass) == fingerprint
+    hass.states.async_set("sensor.a", "1", {"unit": "kW", "other": 2})
+    assert info.state_fingerprint(hass) != fingerprint
+
+    info = render_to_info(hass, "{{ states.sensor.b.state }}")
+    assert info.entity_reads == {"sensor.b": set()}
+    assert info.state_fingerprint(hass) == (("sensor.b", "on"),)
+
+    info = render_to_info(hass, "{{ states.sensor.b.attributes }}")
+    assert info.entity_reads == {"sensor.b": None}
+    assert info.state_fingerprint(hass) == (("sensor.b", hass.states.get("sensor.b")),)
+
+    info = render_to_info(hass, "{{ states('sensor.missing') }}")
+    assert info.state_fingerprint(hass) == (("sensor.missing", None),)
+
+    # Renders that depend on more than the collected states
+    for tmpl_str in (
+        "{{ states.sensor | count }}",
+        "{{ states('sensor.a') }} {{ now() }}",
+        "{{ states('sensor.a') }} {{ [1, 2] | random }}",
+        "{{ states('sensor.a') }} {{ this.state }}",
+    ):
+        info = render_to_info(
+            hass,
+            tmpl_str,
+            {"this": template.TemplateState(hass, hass.states.get("sensor.b"), False)},
+        )
+        assert info.state_fingerprint(hass) is None
+
+
 def test_iterating_all_states_unavailable(hass: HomeAssistant) -> None:
     """Test iterating all states unavailable."""
     hass.states.async_set("test.object", "on")
@@ -1842,6 +1887,32 @@ def test_render_with_possible_json_value_valid_with_is_defined(
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_parsed_json(hass: HomeAssistant) -> None:
+    """Render with possible JSON value with an already parsed JSON value."""
+    tpl = template.Template("{{ value }} {{ value_json.hello }}", hass)
+    with patch.object(template, "json_loads") as mock_json_loads:
+        assert (
+            tpl.async_render_with_possible_json_value(
+                "payload", value_json={"hello": "world"}
+            )
+            == "payload world"
+        )
+    mock_json_loads.assert_not_called()
+
+
+def test_render_with_possible_json_value_not_json(hass: HomeAssistant) -> None:
+    """Render with possible JSON value with a value known not to be JSON."""
+    tpl = template.Template("{{ value }} {{ value_json is defined }}", hass)
+    with patch.object(template, "json_loads") as mock_json_loads:
+        assert (
+            tpl.async_render_with_possible_json_value(
+                "ON", value_json=template.VALUE_NOT_JSON
+            )
+            == "ON False"
+        )
+    mock_json_loads.assert_not_called()
+
+
 def test_render_with_possible_json_value_undefined_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with unknown JSON object."""
     tpl = template.Template("{{ value_json.bye|is_defined }}", hass)
@@ -7114,3 +7185,84 @@ def test_combine(hass: HomeAssistant) -> None:
 
     with pytest.raises(TemplateError, match="combine expected a dict, got str"):
         template.Template("{{ {'a': 1} | combine('not a dict') }}", hass).async_render()
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are saved and reused after a restart."""
+    await template.async_load_bytecode_cache(hass)
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == 2
+    bytecode_cache = template._get_bytecode_cache(hass)
+    assert (bytecode_cache.hits, bytecode_cache.misses) == (0, 1)
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["bytecode"]) == 1
+    assert list(data["unused_runs"].values()) == [0]
+
+    # Restart with the saved cache
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    env = template.TemplateEnvironment(hass)
+    env.template_bytecode_cache = bytecode_cache
+    with patch.object(
+        template.ImmutableSandboxedEnvironment,
+        "compile",
+        side_effect=AssertionError("compiled again"),
+    ):
+        code = env.compile("{{ 1 + 1 }}")
+    assert jinja2.Template.from_code(env, code, env.globals, None).render() == "2"
+    assert (bytecode_cache.hits, bytecode_cache.misses) == (1, 0)
+
+    # Templates compiled by a limited environment are cached separately
+    env = template.TemplateEnvironment(hass, limited=True)
+    env.template_bytecode_cache = bytecode_cache
+    env.compile("{{ 1 + 1 }}")
+    assert (bytecode_cache.hits, bytecode_cache.misses) == (1, 1)
+
+
+async def test_bytecode_cache_evicts_stale_code(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test code unused for several runs or for other versions is discarded."""
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY] = {
+        "version": template.BYTECODE_CACHE_STORAGE_VERSION,
+        "data": {
+            "magic": template._bytecode_magic(),
+            "bytecode": {"stale": "AA==", "recent": "AA=="},
+            "unused_runs": {
+                "stale": template.BYTECODE_CACHE_MAX_UNUSED_RUNS,
+                "recent": 0,
+            },
+        },
+    }
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert "stale" not in data["bytecode"]
+    assert data["unused_runs"]["recent"] == 1
+    assert len(data["bytecode"]) == 2
+
+    # The code of other versions is discarded
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY] = {
+        "version": template.BYTECODE_CACHE_STORAGE_VERSION,
+        "data": {**data, "magic": "other"},
+    }
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    assert bytecode_cache.get("recent") is None
+    assert bytecode_cache.misses == 1
@@ -7,9 +7,12 @@ import contextlib
 import logging
 import os
 from pathlib import Path
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from annotatedyaml.loader import load_yaml as load_annotated_yaml
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
 import voluptuous as vol
@@ -29,6 +32,7 @@ from homeassistant.util.yaml.objects import NodeDictClass
 from .common import (
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_integration,
     mock_platform,
@@ -609,6 +613,41 @@ async def test_async_hass_config_yaml_merge(
     assert len(conf["light"]) == 1
 
 
+async def test_async_hass_config_yaml_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    tmp_path: Path,
+) -> None:
+    """Test the parsed configuration is cached and saved."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / config_util.YAML_CONFIG_FILE).write_text(
+        "light: !include lights.yaml\n"
+    )
+    (tmp_path / "lights.yaml").write_text("- platform: demo\n")
+
+    with patch(
+        "homeassistant.util.yaml.loader.load_annotated_yaml",
+        wraps=load_annotated_yaml,
+    ) as mock_parse:
+        assert await config_util.async_hass_config_yaml(hass) == {
+            "light": [{"platform": "demo"}]
+        }
+        assert await config_util.async_hass_config_yaml(hass) == {
+            "light": [{"platform": "demo"}]
+        }
+    assert mock_parse.call_count == 1
+
+    freezer.tick(config_util.YAML_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[config_util.YAML_CACHE_STORAGE_KEY]["data"]
+    assert data["version"] == __version__
+    assert list(data["entries"]) == [
+        f"{tmp_path / config_util.YAML_CONFIG_FILE}|{tmp_path}"
+    ]
+
+
 @pytest.fixture
 def merge_log_err() -> Generator[MagicMock]:
     """Patch _merge_log_error from packages."""
@@ -16,6 +16,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from pytest_unordered import unordered
 import voluptuous as vol
@@ -1165,6 +1166,105 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_indexed_listener(hass: HomeAssistant) -> None:
+    """Test indexed listeners are only called for matching events."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event)
+
+    unsub = hass.bus.async_listen_indexed(
+        "test", listener, "entity_id", ["light.kitchen", "light.hall"]
+    )
+    unsub_other = hass.bus.async_listen_indexed(
+        "test", other_listener, "device_id", ["abc"]
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+    assert len(other_calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall", "device_id": "abc"})
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.hall",
+    ]
+    assert len(other_calls) == 1
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert hass.bus.async_listeners()["test"] == 1
+
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_indexed_listener_with_filter(hass: HomeAssistant) -> None:
+    """Test indexed listeners can be combined with an event filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub = hass.bus.async_listen_indexed(
+        "test", listener, "entity_id", ["light.kitchen"], event_filter=mock_filter
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+
+
+async def test_eventbus_indexed_listener_invalid(hass: HomeAssistant) -> None:
+    """Test invalid indexed listeners are rejected."""
+
+    def not_a_callback(event_data):
+        """Not a callback filter."""
+        return True
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(MATCH_ALL, lambda event: None, "entity_id", [])
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(
+            "test",
+            lambda event: None,
+            "entity_id",
+            ["light.kitchen"],
+            event_filter=not_a_callback,
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1488,6 +1588,93 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_restore(hass: HomeAssistant) -> None:
+    """Test restoring states does not replace existing or reserved states."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_reserve("light.reserved")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    restored = ha.State("light.kitchen", "off")
+    hass.states.async_restore(
+        [
+            ha.State("light.bowl", "off"),
+            ha.State("light.reserved", "off"),
+            restored,
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.reserved") is None
+    assert hass.states.get("light.kitchen") is restored
+    assert hass.states.async_entity_ids("light") == ["light.bowl", "light.kitchen"]
+    assert events == []
+
+
+async def test_statemachine_restore_replaced_as_added(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the first state set for a restored entity has no old state."""
+    restored_at = dt_util.utcnow() - timedelta(days=1)
+    hass.states.async_restore(
+        [
+            ha.State(
+                "light.kitchen",
+                "on",
+                last_changed=restored_at,
+                last_reported=restored_at,
+                last_updated=restored_at,
+            )
+        ]
+    )
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["old_state"] is None
+    state = hass.states.get("light.kitchen")
+    assert state.last_changed == dt_util.utcnow()
+
+    # Later states are set as usual
+    freezer.tick(1)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert events[1].data["old_state"] is state
+    assert hass.states.get("light.kitchen").last_changed == state.last_changed
+
+
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test async_snapshot method."""
+    assert len(hass.states.async_snapshot()) == 0
+
+    hass.states.async_set("light.bowl", "on", {}, timestamp=1.0)
+    hass.states.async_set("switch.ac", "off", {}, timestamp=2.0)
+    hass.states.async_set("sensor.power", "10", {}, timestamp=3.0)
+    snapshot = hass.states.async_snapshot()
+    assert list(snapshot) == [
+        ("light.bowl", "on", 1.0),
+        ("switch.ac", "off", 2.0),
+        ("sensor.power", "10", 3.0),
+    ]
+
+    hass.states.async_set("light.bowl", "off", {}, timestamp=4.0)
+    hass.states.async_remove("switch.ac")
+    # Snapshots are not affected by later changes
+    assert len(snapshot) == 3
+    assert list(hass.states.async_snapshot()) == [
+        ("light.bowl", "off", 4.0),
+        ("sensor.power", "10", 3.0),
+    ]
+
+    hass.states.async_remove("sensor.power")
+    hass.states.async_remove("light.bowl")
+    assert len(hass.states.async_snapshot()) == 0
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -9,6 +9,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
@@ -18,7 +19,12 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -2143,3 +2149,51 @@ async def test_async_get_integrations_multiple_non_existent(
     ):
         integrations = await loader.async_get_integrations(hass, ["does_not_exist"])
     assert integrations["does_not_exist"] is integration
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test manifests are cached for the next run."""
+    await loader.async_load_manifest_cache(hass)
+    manifest_cache = hass.data[loader.DATA_MANIFEST_CACHE]
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert (manifest_cache.hits, manifest_cache.misses) == (0, 1)
+    freezer.tick(loader.MANIFEST_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    manifest_path = str(integration.file_path / "manifest.json")
+    assert list(data["manifests"]) == [manifest_path]
+    assert data["manifests"][manifest_path]["manifest"]["domain"] == "hue"
+    assert "light.py" in data["manifests"][manifest_path]["top_level_files"]
+
+    async def _async_restart() -> loader.ManifestCache:
+        del hass.data[loader.DATA_INTEGRATIONS]["hue"]
+        await loader.async_load_manifest_cache(hass)
+        return hass.data[loader.DATA_MANIFEST_CACHE]
+
+    manifest_cache = await _async_restart()
+    with patch("homeassistant.loader.json_loads") as mock_json_loads:
+        cached_integration = await loader.async_get_integration(hass, "hue")
+    assert not mock_json_loads.called
+    assert (manifest_cache.hits, manifest_cache.misses) == (1, 0)
+    assert cached_integration.manifest == integration.manifest
+    assert cached_integration.platforms_exists(["light"]) == ["light"]
+
+    # Changed manifests are read again
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"][manifest_path][
+        "stat"
+    ][0] -= 1
+    manifest_cache = await _async_restart()
+    await loader.async_get_integration(hass, "hue")
+    assert (manifest_cache.hits, manifest_cache.misses) == (0, 1)
+
+    # The cache of another Home Assistant version is not used
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["ha_version"] = "0.1"
+    manifest_cache = await _async_restart()
+    await loader.async_get_integration(hass, "hue")
+    assert (manifest_cache.hits, manifest_cache.misses) == (0, 1)
@@ -1309,6 +1309,27 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     }
 
 
+async def test_async_get_import_timings(hass: HomeAssistant) -> None:
+    """Test the import time of each module of an integration is recorded."""
+    integration = loader.Integration(
+        hass,
+        "custom_components.import_timings",
+        None,
+        {"name": "Import timings", "domain": "import_timings"},
+        {"__init__.py", "sensor.py"},
+    )
+    assert setup.async_get_import_timings(hass) == {}
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        integration.get_component()
+        integration.get_platform("sensor")
+
+    assert mock_import.call_count == 2
+    assert setup.async_get_import_timings(hass) == {
+        "import_timings": {"__init__": ANY, "sensor": ANY}
+    }
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
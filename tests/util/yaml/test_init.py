@@ -15,7 +15,9 @@ import yaml as pyyaml
 from homeassistant.config import YAML_CONFIG_FILE, load_yaml_config_file
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import yaml as yaml_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.yaml import loader as yaml_loader
 
 from tests.common import extract_stack_to_frame
@@ -602,3 +604,73 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+def test_yaml_cache(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test parsed files are cached until a file they depend on changes."""
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text(
+        "included: !include included.yaml\n"
+        "password: !secret password\n"
+        "env: !env_var YAML_CACHE_TEST default\n"
+        "dir: !include_dir_named dir\n"
+    )
+    (tmp_path / "included.yaml").write_text("key: value\n")
+    (tmp_path / "secrets.yaml").write_text("password: hunter2\n")
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "one.yaml").write_text("1\n")
+    monkeypatch.delenv("YAML_CACHE_TEST", raising=False)
+    secrets = yaml_loader.Secrets(tmp_path)
+    cache = yaml_loader.YAMLCache()
+
+    def _load() -> Any:
+        return yaml_loader.load_yaml_dict(config_file, secrets, cache)
+
+    loaded = _load()
+    assert loaded == {
+        "included": {"key": "value"},
+        "password": "hunter2",
+        "env": "default",
+        "dir": {"one": 1},
+    }
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cached = _load()
+    assert cached == loaded
+    assert cached is not loaded
+    assert cached["included"]["key"].__config_file__ == str(tmp_path / "included.yaml")
+    assert cached["included"]["key"].__line__ == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # The cache survives a round trip through JSON and doesn't contain secrets
+    stored = json_dumps(cache.entries)
+    assert "hunter2" not in stored
+    cache = yaml_loader.YAMLCache(json_loads(stored))
+    assert _load() == loaded
+    assert _load()["password"].__config_file__ == str(tmp_path / "secrets.yaml")
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    (tmp_path / "included.yaml").write_text("key: new value\n")
+    assert _load()["included"] == {"key": "new value"}
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    (tmp_path / "secrets.yaml").write_text("password: new secret\n")
+    secrets = yaml_loader.Secrets(tmp_path)
+    assert _load()["password"] == "new secret"
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    monkeypatch.setenv("YAML_CACHE_TEST", "set")
+    assert _load()["env"] == "set"
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    (tmp_path / "dir" / "two.yaml").write_text("2\n")
+    assert _load()["dir"] == {"one": 1, "two": 2}
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    assert _load() == {
+        "included": {"key": "new value"},
+        "password": "new secret",
+        "env": "set",
+        "dir": {"one": 1, "two": 2},
+    }
+    assert (cache.hits, cache.misses) == (3, 4)